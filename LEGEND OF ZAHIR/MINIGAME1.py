@@ -1,19 +1,72 @@
 import pygame
 import random
-import time
 import math
 from config_settings import *
 from player import *
 from sprites import *
+from timestep import FixedTimestep, capture_positions, draw_interpolated
+from scenes import Timer
+from framecache import cached
+from inputmanager import input_manager
+from collision import Broadphase, BULLET, TARGET
+
+FONT_PATH = 'LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf'
+CANDLE_PATH = 'LEGEND OF ZAHIR/Minigame 1 Assets'
+COLORED_CANDLES = ['Blue candle.png', 'Orange candle.png', 'Purple candle.png', 'Red candle.png']
+LIGHT_RADIUS = 50  # Radius of the lit circle around the player and each candle
+
+
+def load_fireball():
+    """The bullet image, loaded once."""
+    original_image = pygame.image.load('LEGEND OF ZAHIR/fireball.png').convert_alpha()
+    return pygame.transform.scale(original_image, (32, 32))
+
+
+def load_candles(tile_size):
+    """
+    Load the unlit and lit candle images once, scaled to the tile size.
+
+    Returns:
+        tuple: Four unlit candles and the four lit candles in square order
+    """
+    black_candle = pygame.image.load(f'{CANDLE_PATH}/Black candle.png').convert_alpha()
+    resized_black = pygame.transform.scale(black_candle, (tile_size, tile_size))
+    flash_images = []
+    for candle_file in COLORED_CANDLES:
+        colored_candle = pygame.image.load(f'{CANDLE_PATH}/{candle_file}').convert_alpha()
+        flash_images.append(pygame.transform.scale(colored_candle, (tile_size, tile_size)))
+    return [resized_black] * 4, flash_images
+
+
+def build_light_mask(squares):
+    """
+    Make the darkness with lit circles and orange rings around the candles.
+
+    The candles never move, so this is only made once. The player's light
+    is cut out of a copy each frame.
+
+    Args:
+        squares (list): Rects of the candles
+
+    Returns:
+        pygame.Surface: Full-screen dark overlay
+    """
+    light_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    light_surface.fill((0, 0, 0, 250))
+    for square in squares:
+        # Clear circle for each candle
+        pygame.draw.circle(light_surface, (0, 0, 0, 0), square.center, LIGHT_RADIUS)
+        # Orange ring around each candle
+        pygame.draw.circle(light_surface, (255, 165, 0, 100), square.center, LIGHT_RADIUS + 5, 5)
+    return light_surface
+
 
 class Bullet(pygame.sprite.Sprite):
     def __init__(self, x, y, direction):
         super().__init__()
         
         try:
-            self.original_image = pygame.image.load('LEGEND OF ZAHIR/fireball.png').convert_alpha()
-            scaled_size = (32, 32)
-            self.image = pygame.transform.scale(self.original_image, scaled_size)
+            self.image = cached(('memory', 'fireball'), load_fireball)
         except pygame.error as e:
             print(f"Couldn't load bullet image: {e}")
             self.image = pygame.Surface([BULLETSIZE, BULLETSIZE])
@@ -38,47 +91,86 @@ class Bullet(pygame.sprite.Sprite):
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
 
+
+class SequencePlayer:
+    """
+    Lights the candles of a sequence one after another on timers.
+
+    Each candle stays lit for flash_ms, then all candles stay dark for
+    gap_ms so the same candle twice in a row shows as two flashes.
+
+    Attributes:
+        sequence (list): Candle indices to show
+        index (int): Position in the sequence
+        lit (int): Candle lit right now, None between flashes
+        done (bool): Whether the whole sequence has been shown
+    """
+
+    def __init__(self, sequence, flash_ms=MEMORY_FLASH_MS, gap_ms=MEMORY_GAP_MS):
+        """
+        Args:
+            sequence (list): Candle indices to show
+            flash_ms (float): How long each candle stays lit
+            gap_ms (float): How long the candles stay dark between flashes
+        """
+        self.sequence = sequence
+        self.flash_ms = flash_ms
+        self.gap_ms = gap_ms
+        self.index = 0
+        self.done = not sequence
+        self.lit = None if self.done else sequence[0]
+        self.timer = Timer(flash_ms)
+
+    def update(self, dt):
+        """
+        Move the sequence along.
+
+        Args:
+            dt (float): Milliseconds since the last update
+        """
+        if self.done or not self.timer.update(dt):
+            return
+        if self.lit is not None:
+            # The flash is over, go dark before the next one
+            self.lit = None
+            self.index += 1
+            if self.index >= len(self.sequence):
+                self.done = True
+                return
+            self.timer = Timer(self.gap_ms)
+        else:
+            self.lit = self.sequence[self.index]
+            self.timer = Timer(self.flash_ms)
+
+
 class MemoryGame:
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, rounds=MEMORY_ROUNDS, start_length=MEMORY_START_LENGTH):
         self.screen = screen
         self.clock = clock
+        self.rounds = rounds  # Sequences to repeat to win
+        self.start_length = start_length  # Length of the first sequence
+        self.input_state = input_manager.current  # Read by the player's movement
         self.initialize_game()
-        self.light_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.previous_positions = {}
+
+        # Text only changes with the score and game state
+        try:
+            self.font = pygame.font.Font(FONT_PATH, 36)
+        except pygame.error:
+            self.font = pygame.font.Font(None, 36)
+        self.texts = {}
 
     def initialize_game(self):
         """Initialize or reset the game state"""
-        self.character_spritesheet = Spritesheet('LEGEND OF ZAHIR/main character strip.png')
-        self.enemy_spritesheet = Spritesheet('LEGEND OF ZAHIR/skeleton_strip.png')
-        self.terrain_spritesheet = Spritesheet('LEGEND OF ZAHIR/dungeon2.jpg')
-        
-        self.tile_images = []
-        self.flash_images = []
+        # Spritesheets and candles are shared with the main game and earlier runs
+        self.character_spritesheet = load_spritesheet('LEGEND OF ZAHIR/main character strip.png')
+        self.enemy_spritesheet = load_spritesheet('LEGEND OF ZAHIR/skeleton_strip.png')
+        self.terrain_spritesheet = load_spritesheet('LEGEND OF ZAHIR/dungeon2.jpg')
         
+        self.tile_size = TILESIZE * 2
         try:
-            self.original_image = pygame.image.load('LEGEND OF ZAHIR/fireball.png').convert_alpha()
-            scaled_size = (32, 32)
-            self.original_image = pygame.transform.scale(self.original_image, scaled_size)
-
-            black_candle = pygame.image.load('LEGEND OF ZAHIR/Minigame 1 Assets/Black candle.png').convert_alpha()
-            
-            colored_candles = [
-                'LEGEND OF ZAHIR/Minigame 1 Assets/Blue candle.png',
-                'LEGEND OF ZAHIR/Minigame 1 Assets/Orange candle.png',
-                'LEGEND OF ZAHIR/Minigame 1 Assets/Purple candle.png',
-                'LEGEND OF ZAHIR/Minigame 1 Assets/Red candle.png'
-            ]
-            
-            self.tile_size = TILESIZE * 2
-            
-            for _ in range(4):
-                resized_black = pygame.transform.scale(black_candle, (self.tile_size, self.tile_size))
-                self.tile_images.append(resized_black)
-            
-            for candle_path in colored_candles:
-                colored_candle = pygame.image.load(candle_path).convert_alpha()
-                resized_colored = pygame.transform.scale(colored_candle, (self.tile_size, self.tile_size))
-                self.flash_images.append(resized_colored)
-                
+            self.tile_images, self.flash_images = cached(('memory', 'candles', self.tile_size),
+                                                         lambda: load_candles(self.tile_size))
         except pygame.error as e:
             print(f"Couldn't load image: {e}")
             pygame.quit()
@@ -96,7 +188,6 @@ class MemoryGame:
         self.game_state = "show_sequence"
         self.win_displayed = False
         self.retry_prompt = False
-        self.retry_start_time = 0
         
         self.create_map()
         
@@ -108,51 +199,49 @@ class MemoryGame:
         ]
         
         self.current_flash = None
-        self.flash_start = time.time()
-        self.flash_duration = 0.5
-        self.sequence_index = 0
-        self.flash_alpha = 255
+        self.sequence_player = None
+
+        # Bullets hitting candles are found in one pass per tick
+        self.collisions = Broadphase()
+        self.collisions.on(BULLET, TARGET, self.handle_shooting)
+        self.collisions.track(self.bullets, BULLET)
+        for i, square in enumerate(self.squares):
+            self.collisions.add(i, TARGET, rect=square)
+
+        # The candle lighting is made once, only the player's light moves
+        self.light_mask = cached(('memory', 'light', tuple(map(tuple, self.squares))),
+                                 lambda: build_light_mask(self.squares))
+        self.light_surface = self.light_mask.copy()
+        self.player_light = None  # Area of the player's light cut out last frame
 
-    #nye 
     def update_light_mask(self):
-        """Create the spotlight effect around the player and candles"""
+        """Move the player's spotlight on the cached darkness"""
         if not hasattr(self, 'player') or not hasattr(self.player, 'rect'):
             return
-            
-        # Create the dark overlay
-        self.light_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        self.light_surface.fill((0, 0, 0, 250))
+
+        # Put back the darkness where the player's light was
+        if self.player_light is not None:
+            self.light_surface.fill((0, 0, 0, 0), self.player_light)
+            self.light_surface.blit(self.light_mask, self.player_light, self.player_light)
 
         # Player's spotlight
-        pygame.draw.circle(
+        self.player_light = pygame.draw.circle(
             self.light_surface,
             (0, 0, 0, 0),
             self.player.rect.center,
-            50
+            LIGHT_RADIUS
         )
 
-        # Candle spotlights with orange rings
-        for square in self.squares:
-            # Clear circle for each candle
-            pygame.draw.circle(
-                self.light_surface,
-                (0, 0, 0, 0),
-                square.center,
-                50
-            )
-            # Orange ring around each candle
-            pygame.draw.circle(
-                self.light_surface,
-                (255, 165, 0, 100),
-                square.center,
-                55,
-                5
-            )
-
-    def draw(self):
+    def text(self, message):
+        """A line of text rendered once."""
+        if message not in self.texts:
+            self.texts[message] = self.font.render(message, True, WHITE)
+        return self.texts[message]
+
+    def draw(self, alpha=1.0):
         self.screen.fill(BLACK)
         
-        self.allsprites.draw(self.screen)
+        draw_interpolated(self.screen, self.allsprites, self.previous_positions, alpha)
         
         for i, square in enumerate(self.squares):
             if self.current_flash == i and i < len(self.flash_images):
@@ -165,19 +254,14 @@ class MemoryGame:
         self.screen.blit(self.light_surface, (0, 0))
         
         # Text
-        try:
-            font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 36)
-        except pygame.error:
-            font = pygame.font.Font(None, 36)
-            
-        score_text = font.render(f"Score: {self.score}/5", True, WHITE)
+        score_text = self.text(f"Score: {self.score}/{self.rounds}")
         self.screen.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, 10))
 
         if self.game_state == "win":
-            win_text = font.render("Congratulations! You Won!", True, WHITE)
+            win_text = self.text("Congratulations! You Won!")
             self.screen.blit(win_text, (WIDTH // 2 - win_text.get_width() // 2, HEIGHT // 2))
         elif self.game_state == "game_over":
-            game_over_text = font.render("Game Over! Click to retry", True, WHITE)
+            game_over_text = self.text("Game Over! Click to retry")
             self.screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2))
 
     def create_map(self):
@@ -190,66 +274,69 @@ class MemoryGame:
                     self.allsprites.add(self.player)
 
     def display_sequence(self):
-        current_time = time.time()
-        
+        """Start showing a new sequence, one candle longer for every round won."""
         if not self.sequence:
-            self.sequence = [random.randint(0, 3) for _ in range(self.score + 1)]
-            self.sequence_index = 0
-            self.current_flash = self.sequence[0]
-            self.flash_start = current_time
+            length = self.start_length + self.score
+            self.sequence = [random.randint(0, 3) for _ in range(length)]
             self.player_sequence = []
-        elif self.current_flash is None and self.sequence_index < len(self.sequence):
-            self.current_flash = self.sequence[self.sequence_index]
-            self.flash_start = current_time
+        self.sequence_player = SequencePlayer(self.sequence)
+        self.current_flash = self.sequence_player.lit
 
-    def handle_shooting(self, bullet):
-        for i, square in enumerate(self.squares):
-            if square.colliderect(bullet.rect):
-                self.player_sequence.append(i)
-                bullet.kill()
-                
-                if self.player_sequence[-1] != self.sequence[len(self.player_sequence) - 1]:
-                    self.game_state = "game_over"
-                    self.retry_start_time = time.time()
-                    return True
-                elif len(self.player_sequence) == len(self.sequence):
-                    self.score += 1
-                    if self.score >= 5:
-                        self.game_state = "win"
-                        self.win_displayed = True
-                        return True
-                    
-                    self.sequence = []
-                    self.sequence_index = 0
-                    self.current_flash = None
-                    self.player_sequence = []
-                    self.game_state = "show_sequence"
-                return True
-        return False
+    def handle_shooting(self, bullet, i):
+        """
+        Record a bullet hitting a candle.
 
-    def update(self):
-        if self.score >= 5:
+        Args:
+            bullet (Bullet): The bullet, destroyed by the hit
+            i (int): Index of the candle in squares
+        """
+        self.player_sequence.append(i)
+        bullet.kill()
+
+        if self.player_sequence[-1] != self.sequence[len(self.player_sequence) - 1]:
+            self.game_state = "game_over"
+        elif len(self.player_sequence) == len(self.sequence):
+            self.score += 1
+            if self.score >= self.rounds:
+                self.game_state = "win"
+                self.win_displayed = True
+                return
+
+            self.sequence = []
+            self.sequence_player = None
+            self.current_flash = None
+            self.player_sequence = []
+            self.game_state = "show_sequence"
+
+    def update(self, dt):
+        """
+        Advance the game by one simulation tick.
+
+        Args:
+            dt (float): Milliseconds in the tick
+        """
+        if self.score >= self.rounds:
             self.game_state = "win"
             return
             
+        self.previous_positions = capture_positions(self.allsprites)
         self.allsprites.update()
         
+        self.collisions.update()
+        screen_rect = pygame.display.get_surface().get_rect()
         for bullet in list(self.bullets):
-            self.handle_shooting(bullet)
-            if not pygame.display.get_surface().get_rect().contains(bullet.rect):
+            if not screen_rect.contains(bullet.rect):
                 bullet.kill()
         
         if self.game_state == "show_sequence":
-            current_time = time.time()
-            if self.current_flash is not None:
-                if current_time - self.flash_start > self.flash_duration:
-                    self.sequence_index += 1
-                    self.current_flash = None
-                    
-                    if self.sequence_index >= len(self.sequence):
-                        self.game_state = "player_turn"
-            else:
+            if self.sequence_player is None:
                 self.display_sequence()
+            else:
+                self.sequence_player.update(dt)
+                self.current_flash = self.sequence_player.lit
+                if self.sequence_player.done:
+                    self.sequence_player = None
+                    self.game_state = "player_turn"
 
     def shoot(self, target_pos):
         player_center = self.player.rect.center
@@ -270,37 +357,41 @@ class MemoryGame:
         self.sequence = []
         self.player_sequence = []
         self.current_flash = None
-        self.sequence_index = 0
+        self.sequence_player = None
         self.game_state = "show_sequence"
 
 def run_memory_game(screen, clock):
     try:
         game = MemoryGame(screen, clock)
+        timestep = FixedTimestep()
+        timestep.reset(clock)
+        win_hold = None  # Keeps the win screen up before returning
         running = True
         
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if game.game_state == "player_turn":
-                        if event.button == 1:
-                            game.shoot(pygame.mouse.get_pos())
-                    elif game.game_state == "game_over":
-                        if event.button == 1:
-                            # Reset the level but keep the score
-                            game.reset_level()
+            steps = timestep.tick(clock)
+            snapshot = input_manager.poll()
+            game.input_state = snapshot
+            if snapshot.quit:
+                return "quit"
+            if snapshot.was_triggered('shoot'):
+                if game.game_state == "player_turn":
+                    game.shoot(snapshot.mouse_pos)
+                elif game.game_state == "game_over":
+                    # Reset the level but keep the score
+                    game.reset_level()
             
-            game.update()
-            game.draw()
+            for _ in range(steps):
+                game.update(timestep.step_ms)
+            game.draw(timestep.alpha)
+            pygame.display.flip()
             
             if game.game_state == "win":
-                pygame.display.flip()
-                time.sleep(2)
-                return "completed"
-                
-            pygame.display.flip()
-            clock.tick(FPS)
+                # Show the win screen for a while still handling events
+                if win_hold is None:
+                    win_hold = Timer(MEMORY_WIN_HOLD_MS)
+                elif win_hold.update(steps * timestep.step_ms):
+                    return "completed"
         
         return "quit"
         
@@ -1,6 +1,8 @@
 import pygame
-import random
 from soundmanager import *
+from inputmanager import input_manager
+from config_settings import RENDER_ON_DEMAND, IDLE_WAIT_MS, TIMEZONE_TIER
+from questionbank import QuestionBank
 
 # Constants
 WIDTH = 1366
@@ -26,17 +28,6 @@ REGULAR_SIZE = 15
 MEDIUM_SIZE = 25
 LARGE_SIZE = 40
 
-# Timezone definitions (UTC offsets in hours)
-TIMEZONES = {
-    'New York': -5,
-    'London': 0,
-    'Paris': 1,
-    'Dubai': 4,
-    'Tokyo': 9,
-    'Sydney': 10,
-    'Los Angeles': -8,
-    'Singapore': 8
-}
 
 class Button:
     def __init__(self, x, y, width, height, text):
@@ -46,6 +37,19 @@ class Button:
         self.is_hovered = False
         self.is_correct = False
         self.was_selected = False
+        self.label = None  # Rendered text, made on the first draw if not given
+
+    def set_text(self, text, label=None):
+        """
+        Change the button's text.
+
+        Args:
+            text (str): New text
+            label (pygame.Surface): The text already rendered, if it is
+        """
+        self.text = text
+        self.label = label
+        self.is_hovered = False
 
     def draw(self, surface, font):
         if self.was_selected:
@@ -58,9 +62,10 @@ class Button:
         # Draw button with border
         pygame.draw.rect(surface, self.color, self.rect)
         pygame.draw.rect(surface, BORDER_COLOR, self.rect, 2)
-        text_surface = font.render(self.text, True, BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if self.label is None:
+            self.label = font.render(self.text, True, BLACK)
+        text_rect = self.label.get_rect(center=self.rect.center)
+        surface.blit(self.label, text_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -73,7 +78,7 @@ class Button:
         return False
     
 class TimezoneGame:
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, tier=TIMEZONE_TIER):
         self.screen = screen
         self.clock = clock
         
@@ -95,7 +100,10 @@ class TimezoneGame:
         self.correct_answers = 0
         self.lives = 4
         self.buttons = []
-        
+        self.correct_count = None  # Count the correct answers text was rendered for
+
+        self.bank = QuestionBank(tier)
+        self.next_view = None
         self.generate_question()
         self.create_buttons()
         self.selected_answer = None
@@ -113,96 +121,101 @@ class TimezoneGame:
         )
 
     def create_buttons(self):
-        self.buttons = []
         button_width = 160
         button_height = 45
         spacing = 5
         start_y = HEIGHT - 300
 
-        for i, choice in enumerate(self.choices):
-            x = (WIDTH - button_width) // 2
-            y = start_y + (button_height + spacing) * i
-            button = Button(x, y, button_width, button_height, choice)
+        # The same buttons are relabelled for every question
+        if not self.buttons:
+            for i in range(len(self.choices)):
+                x = (WIDTH - button_width) // 2
+                y = start_y + (button_height + spacing) * i
+                self.buttons.append(Button(x, y, button_width, button_height, ""))
+
+        for button, choice, label in zip(self.buttons, self.choices, self.view['choices']):
+            button.set_text(choice, label)
             button.is_correct = (choice == self.correct_answer)
-            self.buttons.append(button)
+            button.was_selected = False
+
+    def render_question(self, question):
+        """
+        Render every text of a question ahead of showing it.
+
+        Args:
+            question (Question): Question from the bank
+
+        Returns:
+            dict: Surfaces and rects by name, with the choice labels under 'choices'
+        """
+        question_surface = self.medium_font.render(question.prompt, True, WHITE)
+        time_surface = self.large_font.render(question.time_text, True, WHITE)
+        hint_surface = self.regular_font.render(question.hint, True, BLUE)
+        explanation_surface = self.regular_font.render(
+            f"The correct time in {question.target} is {question.answer}", True, WHITE)
+        return {
+            'question': question,
+            'prompt': (question_surface, question_surface.get_rect(center=(WIDTH//2, HEIGHT//6))),
+            'time': (time_surface, time_surface.get_rect(center=(WIDTH//2, HEIGHT//3))),
+            'hint': (hint_surface, hint_surface.get_rect(center=(WIDTH//2, HEIGHT//3 + 30))),
+            'explanation': (explanation_surface, explanation_surface.get_rect(center=(WIDTH//2, HEIGHT//3))),
+            'choices': [self.regular_font.render(choice, True, BLACK) for choice in question.choices],
+        }
+
+    def prepare_next_question(self):
+        """Render the next question while the result screen is up, so it appears at once."""
+        self.next_view = self.render_question(self.bank.peek())
 
     def generate_question(self):
-        self.source_tz_name = random.choice(list(TIMEZONES.keys()))
-        self.target_tz_name = random.choice([tz for tz in TIMEZONES.keys() if tz != self.source_tz_name])
-        
-        source_offset = TIMEZONES[self.source_tz_name]
-        target_offset = TIMEZONES[self.target_tz_name]
-        
-        self.source_hour = random.randint(0, 23)
-        self.source_minute = random.choice([0, 15, 30, 45])
-        
-        hour_diff = target_offset - source_offset
-        target_hour = int((self.source_hour + hour_diff) % 24)
-        
-        self.correct_answer = f"{target_hour:02d}:{self.source_minute:02d}"
-        
-        wrong_hours = [(target_hour + offset) % 24 for offset in [-2, -1, 1, 2]]
-        wrong_times = [f"{int(h):02d}:{self.source_minute:02d}" for h in wrong_hours]
-        
-        self.choices = wrong_times[:3] + [self.correct_answer]
-        random.shuffle(self.choices)
-
-    def get_calculation_hint(self):
-        source_offset = TIMEZONES[self.source_tz_name]
-        target_offset = TIMEZONES[self.target_tz_name]
-        diff = target_offset - source_offset
-        
-        if diff > 0:
-            return f"Hint: Add {diff} hours to {self.source_hour:02d}:00"
-        elif diff < 0:
-            return f"Hint: Subtract {abs(diff)} hours from {self.source_hour:02d}:00"
+        self.question = self.bank.next()
+        if self.next_view is not None and self.next_view['question'] is self.question:
+            self.view = self.next_view
         else:
-            return "Hint: Time is the same in both zones"
+            self.view = self.render_question(self.question)
+        self.next_view = None
 
-    def draw_question_screen(self):
+        self.source_tz_name = self.question.source
+        self.target_tz_name = self.question.target
+        self.source_hour, self.source_minute = divmod(self.question.source_time, 60)
+        self.correct_answer = self.question.answer
+        self.choices = self.question.choices
+
+    def get_calculation_hint(self):
+        return self.question.hint
+
+    def show_answer_result(self):
+        """Render the result of the selected answer and get the next question ready."""
+        correct = self.selected_answer == self.correct_answer
+        result_surface = self.medium_font.render("Correct!" if correct else "Wrong!", True,
+                                                 GREEN if correct else RED)
+        self.result_text = (result_surface, result_surface.get_rect(center=(WIDTH//2, HEIGHT//6)))
+        self.show_result = True
+        self.prepare_next_question()
+
+    def draw_status(self):
         # Draw lives using heart images
         for i in range(self.lives):
             self.screen.blit(PLAYER_HEALTH, (15 + i * 45, 10))  # Position hearts with spacing
 
-        # Draw correct answers text
-        correct_text = f"Correct Answers: {self.correct_answers}/3"
-        correct_surface = self.regular_font.render(correct_text, True, GREEN)
-        self.screen.blit(correct_surface, (20, 60))
-
-        # Draw question
-        question_text = f"Convert time from {self.source_tz_name} to {self.target_tz_name}"
-        text_surface = self.medium_font.render(question_text, True, WHITE)
-        text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 6))
-        self.screen.blit(text_surface, text_rect)
-
-        # Draw time
-        time_text = f"{self.source_hour:02d}:{self.source_minute:02d}"
-        time_surface = self.large_font.render(time_text, True, WHITE)
-        time_rect = time_surface.get_rect(center=(WIDTH // 2, HEIGHT // 3))
-        self.screen.blit(time_surface, time_rect)
-
-        # Draw calculation hint
-        hint_text = self.get_calculation_hint()
-        hint_surface = self.regular_font.render(hint_text, True, BLUE)
-        hint_rect = hint_surface.get_rect(center=(WIDTH // 2, HEIGHT // 3 + 30))
-        self.screen.blit(hint_surface, hint_rect)
+        # Draw correct answers text, rendered again only when the count changes
+        if self.correct_count != self.correct_answers:
+            self.correct_count = self.correct_answers
+            correct_text = f"Correct Answers: {self.correct_answers}/3"
+            self.correct_surface = self.regular_font.render(correct_text, True, GREEN)
+        self.screen.blit(self.correct_surface, (20, 60))
+
+    def draw_question_screen(self):
+        # Draw question, time and calculation hint
+        for name in ('prompt', 'time', 'hint'):
+            self.screen.blit(*self.view[name])
 
         # Draw answer buttons
         for button in self.buttons:
             button.draw(self.screen, self.regular_font)
 
-
     def draw_result_screen(self):
-        result_text = "Correct!" if self.selected_answer == self.correct_answer else "Wrong!"
-        color = GREEN if self.selected_answer == self.correct_answer else RED
-        result_surface = self.medium_font.render(result_text, True, color)
-        result_rect = result_surface.get_rect(center=(WIDTH//2, HEIGHT//6))
-        self.screen.blit(result_surface, result_rect)
-
-        explanation_text = f"The correct time in {self.target_tz_name} is {self.correct_answer}"
-        explanation_surface = self.regular_font.render(explanation_text, True, WHITE)
-        explanation_rect = explanation_surface.get_rect(center=(WIDTH//2, HEIGHT//3))
-        self.screen.blit(explanation_surface, explanation_rect)
+        self.screen.blit(*self.result_text)
+        self.screen.blit(*self.view['explanation'])
 
         for button in self.buttons:
             button.draw(self.screen, self.regular_font)
@@ -213,15 +226,7 @@ class TimezoneGame:
         # Draw background and overlay
         self.screen.blit(self.bg_img, (0, 0))
         self.screen.blit(self.overlay, (0, 0))
-
-        # Draw lives using heart images
-        for i in range(self.lives):
-            self.screen.blit(PLAYER_HEALTH, (15 + i * 45, 10))
-
-        # Draw correct answers text
-        correct_text = f"Correct Answers: {self.correct_answers}/3"
-        correct_surface = self.regular_font.render(correct_text, True, GREEN)
-        self.screen.blit(correct_surface, (20, 60))
+        self.draw_status()
 
         if self.game_over:
             if self.correct_answers >= 3:  # Victory condition
@@ -248,51 +253,26 @@ class TimezoneGame:
             continue_rect = continue_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 80))
             self.screen.blit(continue_text, continue_rect)
             
-        else:
+        elif not self.show_result:
             # Draw normal game elements when game is not over
-            if not self.show_result:
-                # Draw question
-                question_text = f"Convert time from {self.source_tz_name} to {self.target_tz_name}"
-                text_surface = self.medium_font.render(question_text, True, WHITE)
-                text_rect = text_surface.get_rect(center=(WIDTH//2, HEIGHT//6))
-                self.screen.blit(text_surface, text_rect)
-
-                # Draw time
-                time_text = f"{self.source_hour:02d}:{self.source_minute:02d}"
-                time_surface = self.large_font.render(time_text, True, WHITE)
-                time_rect = time_surface.get_rect(center=(WIDTH//2, HEIGHT//3))
-                self.screen.blit(time_surface, time_rect)
-
-                # Draw calculation hint
-                hint_text = self.get_calculation_hint()
-                hint_surface = self.regular_font.render(hint_text, True, BLUE)
-                hint_rect = hint_surface.get_rect(center=(WIDTH//2, HEIGHT//3 + 30))
-                self.screen.blit(hint_surface, hint_rect)
-
-                # Draw answer buttons
-                for button in self.buttons:
-                    button.draw(self.screen, self.regular_font)
-            else:
-                # Draw result screen
-                result_text = "Correct!" if self.selected_answer == self.correct_answer else "Wrong!"
-                color = GREEN if self.selected_answer == self.correct_answer else RED
-                result_surface = self.medium_font.render(result_text, True, color)
-                result_rect = result_surface.get_rect(center=(WIDTH//2, HEIGHT//6))
-                self.screen.blit(result_surface, result_rect)
-
-                explanation_text = f"The correct time in {self.target_tz_name} is {self.correct_answer}"
-                explanation_surface = self.regular_font.render(explanation_text, True, WHITE)
-                explanation_rect = explanation_surface.get_rect(center=(WIDTH//2, HEIGHT//3))
-                self.screen.blit(explanation_surface, explanation_rect)
-
-                for button in self.buttons:
-                    button.draw(self.screen, self.regular_font)
-                self.continue_button.draw(self.screen, self.regular_font)
+            self.draw_question_screen()
+        else:
+            self.draw_result_screen()
 
         pygame.display.update()
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    def view_state(self):
+        """Everything the screen is drawn from, the screen only changes when this does."""
+        buttons = tuple((b.is_hovered, b.was_selected) for b in self.buttons)
+        question = (self.source_tz_name, self.target_tz_name, self.source_hour,
+                    self.source_minute, self.selected_answer)
+        return (self.game_over, self.show_result, self.lives, self.correct_answers,
+                question, buttons, self.continue_button.is_hovered)
+
+    def handle_events(self, snapshot=None):
+        if snapshot is None:
+            snapshot = input_manager.poll()
+        for event in snapshot.events:
             if event.type == pygame.QUIT:
                 return "quit"
 
@@ -318,7 +298,7 @@ class TimezoneGame:
                     if button.handle_event(event):  # Button class handles sound
                         self.selected_answer = button.text
                         button.was_selected = True
-                        self.show_result = True
+                        self.show_answer_result()
                         self.total_questions += 1
                         if self.selected_answer == self.correct_answer:
                             self.score += 1
@@ -339,13 +319,24 @@ def run_timezone_game(screen=None, clock=None):
         pygame.display.set_caption("Timezone Conversion Game")
 
     game = TimezoneGame(screen, clock)
-    
+    drawn = None  # View state of the frame on screen
+
     while True:
-        result = game.handle_events()
+        if RENDER_ON_DEMAND and game.view_state() == drawn:
+            # Nothing changed since the last frame, sleep until input arrives
+            snapshot = input_manager.wait(IDLE_WAIT_MS)
+        else:
+            snapshot = input_manager.poll()
+        result = game.handle_events(snapshot)
         if result:
             return result
-            
-        game.draw()
+
+        if any(event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE) for event in snapshot.events):
+            drawn = None
+        view = game.view_state()
+        if view != drawn:
+            game.draw()
+            drawn = view
         clock.tick(FPS)
 
 if __name__ == "__main__":
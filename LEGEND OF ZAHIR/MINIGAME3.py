@@ -3,11 +3,17 @@ import sys
 import os
 import time
 from config_settings import *
+from scenes import Timer
+from transitions import dim
+from inputmanager import input_manager
+from spatial import SpatialGrid
+from framecache import cached
 
 class ContinentGame:
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, regions=None):
         self.screen = screen
         self.clock = clock
+        self.regions = regions
         self.width = WIDTH
         self.height = HEIGHT
 
@@ -66,12 +72,47 @@ class ContinentGame:
         self.debug_mode = False
         self.game_complete = False
         self.completion_time = 0
+        self.feedback_timer = None  # Timer showing 'Correct!' after a placement
 
-    def show_completion_screen(self):
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill(self.BLACK)
-        overlay.set_alpha(200)
-        self.screen.blit(overlay, (0, 0))
+        # Areas and labels are indexed for hit tests, and each label is
+        # rendered once and only has its rect moved while dragged
+        self.area_index = SpatialGrid()
+        for name, area in self.continent_areas.items():
+            self.area_index.insert(name, area)
+        self.label_index = SpatialGrid()
+        self.labels = []
+        for i, continent in enumerate(self.continents):
+            text = self.font.render(continent['name'], True, self.BLACK)
+            rect = text.get_rect(center=continent['pos'])
+            self.labels.append((text, rect))
+            self.label_index.insert(i, rect)
+        self.hint_texts = {}
+
+        # Hard mode uses the polygon regions of the map instead of the rectangles
+        self.region_map = None
+        if regions is not None:
+            # NumPy is only needed for the region hit mask
+            from regions import RegionMap
+            self.region_map = cached(('regions', regions, tuple(self.map_rect)),
+                                     lambda: RegionMap(regions, self.map_rect))
+
+    def move_label(self, continent_idx, pos):
+        """Move a label and its hit rect."""
+        self.continents[continent_idx]['pos'] = pos
+        rect = self.labels[continent_idx][1]
+        rect.center = pos
+        if continent_idx in self.label_index:
+            self.label_index.move(continent_idx, rect)
+
+    def hint_text(self, continent_idx):
+        """The rendered hint of a continent, made the first time it is shown."""
+        if continent_idx not in self.hint_texts:
+            hint = self.continents[continent_idx]['hint']
+            self.hint_texts[continent_idx] = self.font.render(hint, True, self.BLUE)
+        return self.hint_texts[continent_idx]
+
+    def draw_completion_screen(self):
+        dim(self.screen, 200, self.BLACK)
 
         # Draw congratulations text
         congrats_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 30)
@@ -91,55 +132,52 @@ class ContinentGame:
             text_rect = text_surface.get_rect(center=(self.width//2, y_offset + i * 40))
             self.screen.blit(text_surface, text_rect)
 
-        pygame.display.flip()
-        
-        # Wait for ENTER key
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        waiting = False
-                        if self.score >= len(self.continents):  # All continents placed correctly
-                            return "completed"
-                        else:
-                            return "failed"
-        return "completed" if self.score >= len(self.continents) else "failed"
+    def completion_result(self):
+        """Result returned once the completion screen is closed."""
+        # All continents placed correctly
+        if self.score >= len(self.continents):
+            return "completed"
+        return "failed"
 
     def draw_labels(self):
         # Draw continent areas in debug mode
         if self.debug_mode:
-            for name, area in self.continent_areas.items():
-                pygame.draw.rect(self.screen, (255, 0, 0, 128), area, 1)
+            if self.region_map is not None:
+                for name in self.continent_areas:
+                    self.region_map.draw_highlight(self.screen, name)
+            else:
+                for name, area in self.continent_areas.items():
+                    pygame.draw.rect(self.screen, (255, 0, 0, 128), area, 1)
 
-        for i, continent in enumerate(self.continents):
+        for i, (text, text_rect) in enumerate(self.labels):
             if not self.completed[i]:
-                text = self.font.render(continent['name'], True, self.BLACK)
-                text_rect = text.get_rect(center=continent['pos'])
                 pygame.draw.rect(self.screen, self.WHITE, text_rect.inflate(10, 10))
                 pygame.draw.rect(self.screen, self.BLACK, text_rect.inflate(10, 10), 1)
                 self.screen.blit(text, text_rect)
 
                 if self.show_hint == i:
-                    hint_text = self.font.render(continent['hint'], True, self.BLUE)
+                    hint_text = self.hint_text(i)
                     hint_rect = hint_text.get_rect(center=(self.width//2, self.height - 40))
                     pygame.draw.rect(self.screen, self.WHITE, hint_rect.inflate(10, 5))
                     self.screen.blit(hint_text, hint_rect)
 
-    def check_position(self, continent_idx):
+    def check_position(self, continent_idx, mouse_pos):
         continent = self.continents[continent_idx]
         name = continent['name']
-        mouse_pos = pygame.mouse.get_pos()
         
         # Check if the mouse position is within the continent's area
-        if self.continent_areas[name].collidepoint(mouse_pos):
+        if self.region_map is not None:
+            on_area = self.region_map.region_at(mouse_pos) == name
+        else:
+            on_area = name in self.area_index.at(mouse_pos)
+        if on_area:
             self.completed[continent_idx] = True
             self.score += 1
             # Set the continent label to the center of its area
             area = self.continent_areas[name]
-            self.continents[continent_idx]['pos'] = (area.centerx, area.centery)
+            self.move_label(continent_idx, (area.centerx, area.centery))
+            # Placed labels can no longer be picked up
+            self.label_index.remove(continent_idx)
             if self.score == len(self.continents):
                 self.completion_time = self.game_time
                 self.game_complete = True
@@ -151,47 +189,65 @@ class ContinentGame:
         feedback_rect = feedback_text.get_rect(center=(self.width//2, 30))
         pygame.draw.rect(self.screen, self.BLACK, feedback_rect.inflate(20, 10))
         self.screen.blit(feedback_text, feedback_rect)
-        pygame.display.flip()
-        pygame.time.wait(500)
 
     def run(self):
         running = True
+        dirty = True  # Whether the screen needs drawing again
         while running:
+            if RENDER_ON_DEMAND and not dirty:
+                # Sleep until input arrives or the timer reaches the next second
+                elapsed = time.time() - self.start_time
+                snapshot = input_manager.wait(min(IDLE_WAIT_MS, (1 - elapsed % 1) * 1000))
+                dt = self.clock.tick()
+            else:
+                dt = self.clock.tick(FPS)
+                snapshot = input_manager.poll()
             current_time = time.time()
+            shown_time = self.game_time
             self.game_time = int(current_time - self.start_time)
+            if snapshot.events or self.game_time != shown_time:
+                dirty = True
+
+            # Completion screen waits for ENTER once the feedback has been shown
+            showing_completion = self.game_complete and self.feedback_timer is None
 
-            for event in pygame.event.get():
+            for event in snapshot.events:
                 if event.type == pygame.QUIT:
                     return "quit"
+
+                elif showing_completion:
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                        return self.completion_result()
                     
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:  # Reset game
-                        self.__init__(self.screen, self.clock)
+                        self.__init__(self.screen, self.clock, self.regions)
                     elif event.key == pygame.K_d:  # Toggle debug mode
                         self.debug_mode = not self.debug_mode
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    for i, continent in enumerate(self.continents):
-                        if not self.completed[i]:
-                            text_rect = self.font.render(continent['name'], True, self.BLACK).get_rect(center=continent['pos'])
-                            if text_rect.collidepoint(event.pos):
-                                self.dragging = i
-                                self.show_hint = i
+                    # Labels added later are drawn on top, so they are picked first
+                    label = self.label_index.top(event.pos)
+                    if label is not None:
+                        self.dragging = label
+                        self.show_hint = label
 
                 elif event.type == pygame.MOUSEBUTTONUP:
                     if self.dragging is not None:
-                        if self.check_position(self.dragging):
-                            self.draw_correct_feedback()
-                            if self.game_complete:
-                                return self.show_completion_screen()
+                        if self.check_position(self.dragging, event.pos):
+                            self.feedback_timer = Timer(500)
                         self.dragging = None
                         self.show_hint = None
 
                 elif event.type == pygame.MOUSEMOTION:
                     if self.dragging is not None:
-                        self.continents[self.dragging]['pos'] = event.pos
+                        self.move_label(self.dragging, event.pos)
+
+            if not dirty:
+                continue
 
             # Drawing
+            dirty = False
             self.screen.fill(self.BLACK)
             self.screen.blit(self.map_img, self.map_rect)
             self.draw_labels()
@@ -206,17 +262,25 @@ class ContinentGame:
             reset_text = self.font.render('Press R to reset | D for debug mode', True, self.WHITE)
             self.screen.blit(reset_text, (10, 70))
 
+            if self.feedback_timer is not None:
+                self.draw_correct_feedback()
+                if self.feedback_timer.update(dt):
+                    self.feedback_timer = None
+                # Keep drawing while the feedback is up, and once more to clear it
+                dirty = True
+            elif showing_completion:
+                self.draw_completion_screen()
+
             pygame.display.flip()
-            self.clock.tick(FPS)
 
         return "quit"
 
-def run_continent_game(screen, clock):
+def run_continent_game(screen, clock, hard_mode=CONTINENT_HARD_MODE):
     """
     Wrapper function to run the continent game
     Returns "completed", "quit"
     """
-    game = ContinentGame(screen, clock)
+    game = ContinentGame(screen, clock, CONTINENT_REGIONS if hard_mode else None)
     return game.run()
 
 if __name__ == '_main_':
@@ -1,9 +1,12 @@
 import pygame
 import random
 from config_settings import *
+from inputmanager import input_manager
+from framecache import cached
 
-# Initialize Pygame
-pygame.init()
+# Initialize Pygame, the sound manager opens the mixer itself
+pygame.display.init()
+pygame.font.init()
 
 # Set up the display
 WIDTH, HEIGHT = 1366, 768
@@ -39,24 +42,30 @@ ALL_LANGUAGES = [
     ("Portuguese", "Olá")
 ]
 
+def render_card(color, label):
+    """Draw one side of a card with its border and centered label."""
+    surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
+    surface.fill(color)
+    
+    # Add border
+    pygame.draw.rect(surface, BORDER_COLOR, surface.get_rect(), 2)
+    text_surface = FONT.render(label, True, TEXT_COLOR)
+    text_rect = text_surface.get_rect(center=surface.get_rect().center)
+    surface.blit(text_surface, text_rect)
+    return surface
+
 class Card:
     def __init__(self, x, y, text):
         self.rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
         self.text = text
         self.revealed = False
+        
+        # Both sides are drawn once, every card shares the same back
+        self.face_up = render_card(REVEALED_PURPLE, text)
+        self.face_down = cached(('language card', 'back'), lambda: render_card(LIGHT_PURPLE, "?"))
 
     def draw(self, screen):
-        if self.revealed:
-            pygame.draw.rect(screen, REVEALED_PURPLE, self.rect)
-            text_surface = FONT.render(self.text, True, TEXT_COLOR)
-        else:
-            pygame.draw.rect(screen, LIGHT_PURPLE, self.rect)
-            text_surface = FONT.render("?", True, TEXT_COLOR)
-        
-        # Add border
-        pygame.draw.rect(screen, BORDER_COLOR, self.rect, 2)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(self.face_up if self.revealed else self.face_down, self.rect)
 
 def create_cards():
     game_languages = random.sample(ALL_LANGUAGES, 6)
@@ -90,6 +99,15 @@ def run_language_matching_game():
     overlay.set_alpha(150)  # More transparent to show background better
     
     cards, game_languages = create_cards()
+    
+    # Background, overlay and cards are composited once, cards are
+    # redrawn onto the board only when they are turned over
+    board = bg_img.convert()
+    board.blit(overlay, (0, 0))
+    for card in cards:
+        card.draw(board)
+    redraw = True
+    shown_time = None
     selected_cards = []
     matched_pairs = set()
     clock = pygame.time.Clock()
@@ -98,13 +116,15 @@ def run_language_matching_game():
     time_limit = 60000  # 60 seconds
 
     while running:
-        for event in pygame.event.get():
+        for event in input_manager.poll().events:
             if event.type == pygame.QUIT:
                 return "quit"
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 for card in cards:
                     if card.rect.collidepoint(event.pos) and not card.revealed and len(selected_cards) < 2:
                         card.revealed = True
+                        card.draw(board)
+                        redraw = True
                         selected_cards.append(card)
                         if len(selected_cards) == 2:
                             pygame.time.set_timer(pygame.USEREVENT, 1000)
@@ -117,25 +137,31 @@ def run_language_matching_game():
                     else:
                         for card in selected_cards:
                             card.revealed = False
+                            card.draw(board)
+                        redraw = True
                     selected_cards.clear()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                redraw = True
 
-        # Draw background and overlay
-        SCREEN.blit(bg_img, (0, 0))
-        SCREEN.blit(overlay, (0, 0))
-
-        for card in cards:
-            card.draw(SCREEN)
-
-        # Timer logic with updated colors
+        # Timer logic with updated colors, rendered only when the second changes
         elapsed_time = pygame.time.get_ticks() - start_time
         remaining_time = max(0, (time_limit - elapsed_time) // 1000)
-        timer_color = (255, 100, 100) if remaining_time <= 5 else TEXT_COLOR  # Red for low time
-        timer_text = TIMER_FONT.render(f"Time: {remaining_time}s", True, timer_color)
-        timer_rect = timer_text.get_rect(center=(WIDTH // 2, 50))
-        SCREEN.blit(timer_text, timer_rect)
-
-        pygame.display.flip()
-        clock.tick(60)
+        if remaining_time != shown_time:
+            shown_time = remaining_time
+            timer_color = (255, 100, 100) if remaining_time <= 5 else TEXT_COLOR  # Red for low time
+            timer_text = TIMER_FONT.render(f"Time: {remaining_time}s", True, timer_color)
+            timer_rect = timer_text.get_rect(center=(WIDTH // 2, 50))
+            redraw = True
+
+        # Only draw when something changed, otherwise wait for input at a low frame rate
+        if redraw:
+            SCREEN.blit(board, (0, 0))
+            SCREEN.blit(timer_text, timer_rect)
+            pygame.display.flip()
+            clock.tick(60)
+            redraw = False
+        else:
+            clock.tick(IDLE_FPS)
 
         if len(matched_pairs) == len(game_languages):
             return "completed"
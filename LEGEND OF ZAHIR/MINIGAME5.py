@@ -2,10 +2,20 @@ import pygame
 import os
 import random
 import string
-from sprites import Spritesheet
-
-# Initialize Pygame
-pygame.init()
+from sprites import load_spritesheet
+from timestep import FixedTimestep, capture_positions, interpolate
+from scenes import Timer
+from transitions import dim
+from inputmanager import input_manager
+from widgets import TextInput
+from soundmanager import sound_manager
+from hud import HudWidget
+from framecache import cached
+from bossbattle import BulletPool, PatternScheduler, Ring, Spiral, AimedBurst, baked_rotations
+
+# Initialize Pygame, the sound manager opens the mixer itself
+pygame.display.init()
+pygame.font.init()
 
 # Game Constants
 WIDTH, HEIGHT = 1366, 768
@@ -25,10 +35,10 @@ BOSS_WIDTH, BOSS_HEIGHT = 360, 360
 
 # Load and transform boss sprite
 BOSS_SPRITE_IMAGE = pygame.image.load(os.path.join('LEGEND OF ZAHIR/assets/graphics/sprites/boss 3_3 sprite.PNG'))
-BOSS_SPRITE = pygame.transform.rotate(pygame.transform.scale(BOSS_SPRITE_IMAGE, (BOSS_WIDTH, BOSS_HEIGHT)), 360)
+BOSS_SPRITE = pygame.transform.rotate(pygame.transform.scale(BOSS_SPRITE_IMAGE, (BOSS_WIDTH, BOSS_HEIGHT)), 360).convert_alpha()
 
 PLAYER_HEALTH_IMAGE = pygame.image.load(os.path.join('LEGEND OF ZAHIR/Minigame 5 Assets/Player health icon.png'))
-PLAYER_HEALTH = pygame.transform.scale(PLAYER_HEALTH_IMAGE, (50, 50))
+PLAYER_HEALTH = pygame.transform.scale(PLAYER_HEALTH_IMAGE, (50, 50)).convert_alpha()
 
 # Colors
 BLUE = (25, 118, 210)
@@ -42,7 +52,7 @@ POPUP_COLOR = (0, 0, 0, 128)
 # Game Elements
 WALL = pygame.Rect(WIDTH // 2 - 10, 0, 10, HEIGHT)
 BACKGROUND = pygame.transform.scale(pygame.image.load(
-    os.path.join('LEGEND OF ZAHIR/Minigame 5 Assets/Alt Dungeon Background.png')), (WIDTH, HEIGHT))
+    os.path.join('LEGEND OF ZAHIR/Minigame 5 Assets/Alt Dungeon Background.png')), (WIDTH, HEIGHT)).convert()
 
 # Custom Events
 BOSS_HIT = pygame.USEREVENT + 1
@@ -57,7 +67,7 @@ SHOOTING_PHASE_DURATION = 10000  # 10 seconds
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.character_spritesheet = Spritesheet('LEGEND OF ZAHIR/main character strip.png')
+        self.character_spritesheet = load_spritesheet('LEGEND OF ZAHIR/main character strip.png')
         
         # Create animation dictionaries
         self.animations = {
@@ -91,68 +101,47 @@ class Player(pygame.sprite.Sprite):
             self.animation_loop = (self.animation_loop + 1) % len(self.animations[self.facing])
             self.image = self.animations[self.facing][self.animation_loop]
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction):
-        super().__init__()
-        try:
-            self.original_image = pygame.image.load('LEGEND OF ZAHIR/fireball.png').convert_alpha()
-            self.original_image = pygame.transform.scale(self.original_image, (BULLETSIZE, BULLETSIZE))
-        except pygame.error:
-            self.original_image = pygame.Surface((BULLETSIZE, BULLETSIZE))
-            self.original_image.fill((255, 165, 0))
-            
-        self.image = self.original_image
-        self.rect = self.image.get_rect(center=(x, y))
-        self.direction = direction
-        self.speed = BULLET_VEL
-        
-        # Add sound effect
-        try:
-            self.shoot_sound = pygame.mixer.Sound('LEGEND OF ZAHIR/assets/sounds/sfx/fireball.mp3')
-            self.shoot_sound.play()
-        except:
-            print("Could not load bullet sound")
-
-    def update(self):
-        self.rect.x += self.direction[0] * self.speed
-        self.rect.y += self.direction[1] * self.speed
-        
-        # Rotate bullet to face direction
-        angle = pygame.math.Vector2(self.direction).angle_to((1, 0))
-        self.image = pygame.transform.rotate(self.original_image, angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-
-class BossBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction):
-        super().__init__()
-        try:
-            # Load and scale the boss bullet image
-            self.original_image = pygame.image.load('LEGEND OF ZAHIR/purple (2).png').convert_alpha()
-            self.original_image = pygame.transform.scale(self.original_image, (50, 50))
-        except pygame.error:
-            # Fallback if image loading fails
-            print("Could not load boss bullet image - using default shape")
-            self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.circle(self.original_image, (255, 0, 0), (15, 15), 15)
-            
-        self.image = self.original_image
-        self.rect = self.image.get_rect(center=(x, y))
-        self.dx = direction[0]
-        self.dy = direction[1]
-        
-        # Calculate angle for rotation
-        angle = pygame.math.Vector2(direction).angle_to((1, 0))
-        self.image = pygame.transform.rotate(self.original_image, angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
+def load_player_bullet():
+    """Load the player's fireball facing right, or an orange square if it is missing."""
+    try:
+        image = pygame.image.load('LEGEND OF ZAHIR/fireball.png').convert_alpha()
+        return pygame.transform.scale(image, (BULLETSIZE, BULLETSIZE))
+    except pygame.error:
+        image = pygame.Surface((BULLETSIZE, BULLETSIZE))
+        image.fill((255, 165, 0))
+        return image
+
+def load_boss_bullet():
+    """Load the boss bullet facing right, or a red circle if it is missing."""
+    try:
+        image = pygame.image.load('LEGEND OF ZAHIR/purple (2).png').convert_alpha()
+        return pygame.transform.scale(image, (50, 50))
+    except pygame.error:
+        print("Could not load boss bullet image - using default shape")
+        image = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 0, 0), (15, 15), 15)
+        return image
+
+def boss_phases():
+    """
+    The boss's bullet patterns by the health each phase starts at.
 
-    def update(self):
-        self.rect.x += self.dx
-        self.rect.y += self.dy
+    The first phase is the original ring, fired about as often as the old
+    one in 45 chance did. Lower phases add aimed bursts and a spiral.
+    """
+    return [
+        (100, [Ring(17, interval=45, speed=BOSS_BULLET_VEL)]),
+        (50, [Ring(17, interval=45, speed=BOSS_BULLET_VEL),
+              AimedBurst(3, 20, interval=90, speed=BOSS_BULLET_VEL + 2, delay=20)]),
+        (20, [Spiral(4, 17, interval=6, speed=BOSS_BULLET_VEL),
+              AimedBurst(5, 40, interval=60, speed=BOSS_BULLET_VEL + 2)]),
+    ]
 
 def create_text_input(shuffled_word):
     """
     Create a themed text input popup surface for the word unscrambling game.
     Match the dungeon aesthetic with dark colors and stone-like appearance.
+    Built once per word, the typed answer is drawn over it by a TextInput.
     """
     # Create base surface with padding for border effects
     popup = pygame.Surface((600, 200), pygame.SRCALPHA)
@@ -222,102 +211,151 @@ def create_text_input(shuffled_word):
     
     return final_surface
 
-def draw_window(player, boss, playerBullets, bossBullets, player_hp, boss_hp, 
-                shuffled_word, player_input, popup=None, game_over=False, win=False):
-    """Draw the game window with all elements."""
-    # Background and core elements
-    WIN.blit(BACKGROUND, (0, 0))
-    WIN.blit(player.image, player.rect)
-    WIN.blit(BOSS_SPRITE, (boss.x, boss.y))
-
-    # Draw bullets
-    for bullet in playerBullets:
-        WIN.blit(bullet.image, bullet.rect)
-    for bullet in bossBullets:
-        WIN.blit(bullet.image, bullet.rect)
-
-    # Draw player health icons
-    for i in range(player_hp):
-        WIN.blit(PLAYER_HEALTH, (775 + i * 45, 10))
-
-    # Draw boss health bar background
-    health_bar_bg = pygame.Surface((200, 20))
-    health_bar_bg.fill(RED)
-    WIN.blit(health_bar_bg, (WIDTH - 950, 10))
-
-    # Draw boss health bar
-    if boss_hp > 0:
-        health_width = int(200 * (boss_hp / 100))
-        health_bar = pygame.Surface((health_width, 20))
-        health_bar.fill(GREEN)
-        WIN.blit(health_bar, (WIDTH - 950, 10))
-
-    # Draw popup if active
-    if popup:
-        # Draw a semi-transparent dark overlay behind the popup for better visibility
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Black with 128 alpha (semi-transparent)
-        WIN.blit(overlay, (0, 0))
-        
-        # Draw the main popup
-        WIN.blit(popup, (WIDTH//2 - 302, HEIGHT//2 - 102))
-        
-        # Draw the player input with a matching theme
-        input_surface = FONT.render(player_input, True, (255, 98, 0))  # Orange text
-        
-        # Optional: Add a text cursor effect
-        if pygame.time.get_ticks() % 1000 < 500:  # Blink every half second
-            input_surface = FONT.render(player_input + "|", True, (255, 98, 0))
-            
-        # Center the input text
-        input_rect = input_surface.get_rect(center=(WIDTH//2, HEIGHT//2 + 20))
-        WIN.blit(input_surface, input_rect)
-
-    # Draw game over screen
-    if game_over:
-        # Create overlay for game over text
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Darker overlay for game over
-        WIN.blit(overlay, (0, 0))
-        
-        # Create game over text
-        game_over_text = "YOU WIN!" if win else "DEFEAT"
-        game_over_color = (255, 223, 0) if win else (255, 0, 0)  # Gold for win, red for defeat
-        
-        # Create glowing text effect
-        for offset in range(3):
-            # Draw multiple layers of text with decreasing alpha for glow effect
-            alpha = 255 - (offset * 50)
-            glow_color = (*game_over_color[:3], alpha)
-            glow_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 30 + offset*2)
-            glow_surface = glow_font.render(game_over_text, True, glow_color)
-            glow_rect = glow_surface.get_rect(center=(WIDTH//2, HEIGHT//2))
-            WIN.blit(glow_surface, glow_rect)
-        
-        # Draw main text
-        game_over_surface = FONT.render(game_over_text, True, game_over_color)
-        game_over_rect = game_over_surface.get_rect(center=(WIDTH//2, HEIGHT//2))
-        WIN.blit(game_over_surface, game_over_rect)
+def render_game_over_text(win):
+    """Render the glowing win or defeat message, centred on a screen-sized surface."""
+    text = "YOU WIN!" if win else "DEFEAT"
+    color = (255, 223, 0) if win else (255, 0, 0)  # Gold for win, red for defeat
+    surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+    # Draw multiple layers of text with decreasing alpha for glow effect
+    for offset in range(3):
+        glow_color = (*color, 255 - offset * 50)
+        glow_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 30 + offset*2)
+        glow_surface = glow_font.render(text, True, glow_color)
+        surface.blit(glow_surface, glow_surface.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
-    # Update display
-    pygame.display.update()
+    # Draw main text
+    main_surface = FONT.render(text, True, color)
+    surface.blit(main_surface, main_surface.get_rect(center=(WIDTH//2, HEIGHT//2)))
+    return surface
 
-def player_movement(keys_pressed, player):
+class BattleView:
+    """
+    Draws the boss battle from cached layers.
+
+    The background, boss and health icons are converted to the display
+    format once. The health bars live on a HUD surface whose widgets are
+    redrawn only when the health they show changes. While the word popup
+    or the game over message is up the battle underneath does not move, so
+    the whole dimmed frame is composed once and reused until its inputs
+    change, leaving only the typed answer to draw each frame.
+
+    Attributes:
+        hud (pygame.Surface): Cached health bars, transparent between them
+        player_hp, boss_hp (int): Health the HUD widgets read
+        widgets (list): HudWidgets drawing onto the HUD surface
+        frozen (pygame.Surface): Last composed popup or game over frame
+        frozen_key (tuple): Inputs the frozen frame was composed from
+        redraws (int): Number of layer redraws, for profiling
+    """
+
+    HUD_HEIGHT = 60  # The health bars only cover a band at the top of the screen
+
+    def __init__(self):
+        self.hud = pygame.Surface((WIDTH, self.HUD_HEIGHT), pygame.SRCALPHA)
+        self.player_hp = self.boss_hp = None
+        self.widgets = [
+            HudWidget((775, 0, 4 * 45 + 50, self.HUD_HEIGHT), lambda: self.player_hp, self.draw_player_health),
+            HudWidget((WIDTH - 950, 0, 200, 40), lambda: self.boss_hp, self.draw_boss_health),
+        ]
+        self.frozen = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.frozen_key = None
+        self.redraws = 0
+
+    def draw_player_health(self, surface, player_hp):
+        for i in range(player_hp):
+            surface.blit(PLAYER_HEALTH, (775 + i * 45, 10))
+
+    def draw_boss_health(self, surface, boss_hp):
+        surface.fill(RED, (WIDTH - 950, 10, 200, 20))
+        if boss_hp > 0:
+            surface.fill(GREEN, (WIDTH - 950, 10, int(200 * (boss_hp / 100)), 20))
+
+    def draw_hud(self, player_hp, boss_hp):
+        """Redraw the health bars whose values changed and draw the HUD."""
+        self.player_hp = player_hp
+        self.boss_hp = boss_hp
+        for widget in self.widgets:
+            state = widget.state()
+            if state == widget.last:
+                continue
+            widget.last = state
+            self.hud.set_clip(widget.rect)
+            self.hud.fill((0, 0, 0, 0))
+            widget.render(self.hud, state)
+            self.redraws += 1
+        self.hud.set_clip(None)
+        WIN.blit(self.hud, (0, 0))
+
+    def draw_battle(self, player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+                    previous, alpha):
+        """Draw the moving battle and the HUD."""
+        WIN.blit(BACKGROUND, (0, 0))
+        WIN.blit(player.image, interpolate(previous.get(player), player.rect, alpha))
+        WIN.blit(BOSS_SPRITE, interpolate(previous.get('boss'), boss, alpha))
+        playerBullets.draw(WIN, alpha)
+        bossBullets.draw(WIN, alpha)
+        self.draw_hud(player_hp, boss_hp)
+
+    def draw(self, player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+             shuffled_word, text_input, popup=None, game_over=False, win=False,
+             previous=None, alpha=1.0):
+        """
+        Draw the game window with all elements.
+
+        Moving objects are drawn between their last two simulated positions
+        using the positions in previous and the interpolation factor alpha.
+        """
+        if previous is None:
+            previous = {}
+
+        if not popup and not game_over:
+            self.frozen_key = None
+            self.draw_battle(player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+                             previous, alpha)
+            pygame.display.update()
+            return
+
+        key = (id(popup) if popup else None, game_over, win, player_hp, boss_hp)
+        if key != self.frozen_key:
+            self.frozen_key = key
+            self.draw_battle(player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+                             previous, alpha)
+            if popup:
+                # Draw a semi-transparent dark overlay behind the popup for better visibility
+                dim(WIN, 128)
+                WIN.blit(popup, (WIDTH//2 - 302, HEIGHT//2 - 102))
+            if game_over:
+                dim(WIN, 180)  # Darker overlay for game over
+                WIN.blit(cached(('boss game over', win), lambda: render_game_over_text(win)), (0, 0))
+            self.frozen.blit(WIN, (0, 0))
+            self.redraws += 1
+        else:
+            WIN.blit(self.frozen, (0, 0))
+
+        if popup and not game_over:
+            # Draw the player input centered, with a blinking cursor
+            text_input.draw(WIN, center=(WIDTH//2, HEIGHT//2 + 20))
+
+        # Update display
+        pygame.display.update()
+
+def player_movement(snapshot, player):
     """Handle player movement and animation."""
     moved = False
-    if keys_pressed[pygame.K_a] and player.rect.x - VEL > WALL.x:  # left
+    if snapshot.is_held('move_left') and player.rect.x - VEL > WALL.x:  # left
         player.rect.x -= VEL
         player.facing = 'left'
         moved = True
-    if keys_pressed[pygame.K_d] and player.rect.x + VEL + player.rect.width < WIDTH:  # right
+    if snapshot.is_held('move_right') and player.rect.x + VEL + player.rect.width < WIDTH:  # right
         player.rect.x += VEL
         player.facing = 'right'
         moved = True
-    if keys_pressed[pygame.K_w] and player.rect.y - VEL > 0:  # up
+    if snapshot.is_held('move_up') and player.rect.y - VEL > 0:  # up
         player.rect.y -= VEL
         player.facing = 'up'
         moved = True
-    if keys_pressed[pygame.K_s] and player.rect.y + VEL + player.rect.height < HEIGHT:  # down
+    if snapshot.is_held('move_down') and player.rect.y + VEL + player.rect.height < HEIGHT:  # down
         player.rect.y += VEL
         player.facing = 'down'
         moved = True
@@ -339,54 +377,19 @@ def boss_movement(boss):
     elif direction == 'right' and boss.x + boss.width < WALL.x:
         boss.x += BOSS_VEL
 
-def shooting(playerBullets, player, boss):
-    """Handle player bullet movement and collision."""
-    for bullet in playerBullets[:]:
-        bullet.update()
-        
-        # Check if bullet is out of bounds
-        if bullet.rect.right < 0 or bullet.rect.left > WIDTH or \
-           bullet.rect.bottom < 0 or bullet.rect.top > HEIGHT:
-            playerBullets.remove(bullet)
-            continue
-            
-        # Check for collision with boss
-        boss_rect = pygame.Rect(boss.x, boss.y, BOSS_WIDTH, BOSS_HEIGHT)
-        if boss_rect.colliderect(bullet.rect):
-            pygame.event.post(pygame.event.Event(BOSS_HIT))
-            playerBullets.remove(bullet)
-
-def boss_shooting(bossBullets, boss):
-    """Create boss bullets in a circular pattern."""
-    if random.randint(1, 45) == 1:  # Random chance to shoot
-        for angle in range(0, 360, 22):  # 8 directions
-            # Calculate direction vector
-            direction = pygame.math.Vector2(1, 0).rotate(angle)
-            dx = BOSS_BULLET_VEL * direction.x
-            dy = BOSS_BULLET_VEL * direction.y
-            
-            # Create new bullet at boss center
-            bullet = BossBullet(
-                boss.x + boss.width // 2,
-                boss.y + boss.height // 2,
-                (dx, dy)
-            )
-            bossBullets.append(bullet)
+def shooting(playerBullets, boss):
+    """Move player bullets and count their hits on the boss."""
+    for _ in range(playerBullets.update(boss)):
+        pygame.event.post(pygame.event.Event(BOSS_HIT))
+
+def boss_shooting(attacks, bossBullets, boss, player, boss_hp):
+    """Fire the patterns of the boss's current phase."""
+    attacks.update(bossBullets, boss.center, player.rect.center, boss_hp)
 
 def update_boss_shooting(bossBullets, player):
-    """Update boss bullet positions and handle collisions."""
-    for bullet in bossBullets[:]:
-        bullet.update()
-        
-        # Check for collision with player
-        if player.rect.colliderect(bullet.rect):
-            pygame.event.post(pygame.event.Event(PLAYER_HIT))
-            bossBullets.remove(bullet)
-            continue
-            
-        # Remove bullets that are off screen
-        if not bullet.rect.colliderect(pygame.Rect(0, 0, WIDTH, HEIGHT)):
-            bossBullets.remove(bullet)
+    """Move boss bullets and count their hits on the player."""
+    for _ in range(bossBullets.update(player.rect)):
+        pygame.event.post(pygame.event.Event(PLAYER_HIT))
 
 def generate_word():
     """Generate a random Southeast Asian country name and its scrambled version."""
@@ -403,16 +406,26 @@ def main():
     player = Player(700, 300)
 
     # Initialize game state
-    playerBullets = []
-    bossBullets = []  # Now stores BossBullet sprites
+    screen_rect = WIN.get_rect()
+    playerBullets = BulletPool(baked_rotations('player bullet', load_player_bullet), screen_rect)
+    bossBullets = BulletPool(baked_rotations('boss bullet', load_boss_bullet), screen_rect)
+    attacks = PatternScheduler(boss_phases())
     player_hp = 4
     boss_hp = 100
+    view = BattleView()
     clock = pygame.time.Clock()
+    timestep = FixedTimestep(sim_fps=FPS)
+    timestep.reset(clock)
+    previous = {}
+    game_over_hold = None  # Keeps the game over screen up before returning
     run = True
 
     # Initialize word game state
     word, shuffled_word = generate_word()
-    player_input = ""
+    popup = create_text_input(shuffled_word)
+    text_input = TextInput(FONT, (255, 98, 0),  # Orange text
+                           allowed=lambda char: char.isalpha() or char == " ",
+                           transform=str.upper)
     can_shoot = False
     bullets_fired = 0
 
@@ -422,42 +435,41 @@ def main():
     shooting_phase_start_time = 0
 
     while run:
-        clock.tick(FPS)
+        steps = timestep.tick(clock)
         current_time = pygame.time.get_ticks()
-        keys_pressed = pygame.key.get_pressed()
+        snapshot = input_manager.poll()
 
-        for event in pygame.event.get():
+        for event in snapshot.events:
             if event.type == pygame.QUIT:
                 return "quit"
 
+            if game_over_hold is not None:
+                continue
+
             if popup_active:
-                if event.type == pygame.KEYDOWN:
-                    if event.unicode.isalpha():
-                        player_input += event.unicode.upper()
-                    elif event.key == pygame.K_BACKSPACE:
-                        player_input = player_input[:-1]
-                    elif event.key == pygame.K_SPACE:
-                        player_input += " "
-                    elif event.key == pygame.K_RETURN:
-                        if player_input == word:
-                            can_shoot = True
-                            bullets_fired = 0
-                            popup_active = False
-                            shooting_phase_start_time = current_time
-                        else:
-                            player_hp -= 1
-                        player_input = ""
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                    if text_input.text == word:
+                        can_shoot = True
+                        bullets_fired = 0
                         popup_active = False
+                        shooting_phase_start_time = current_time
+                    else:
+                        player_hp -= 1
+                    text_input.reset()
+                    popup_active = False
+                else:
+                    text_input.handle_event(event)
 
             elif can_shoot and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and bullets_fired < MAG:
                 # Calculate direction vector
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                mouse_x, mouse_y = event.pos
                 start_pos = (player.rect.centerx, player.rect.centery)
                 direction = pygame.math.Vector2(mouse_x - start_pos[0], mouse_y - start_pos[1])
                 if direction.length() > 0:
                     direction = direction.normalize()
-                    bullet = Bullet(start_pos[0], start_pos[1], (direction.x, direction.y))
-                    playerBullets.append(bullet)
+                    playerBullets.spawn(start_pos[0], start_pos[1],
+                                        direction.x * BULLET_VEL, direction.y * BULLET_VEL)
+                    sound_manager.play_sound('bullet')
                     bullets_fired += 1
                     if bullets_fired == MAG:
                         can_shoot = False
@@ -469,18 +481,25 @@ def main():
 
         # Check win/lose conditions
         if player_hp <= 0 or boss_hp <= 0:
-            draw_window(player, boss, playerBullets, bossBullets, player_hp, boss_hp, 
-                       shuffled_word, player_input, game_over=True, win=boss_hp <= 0)
-            pygame.time.delay(3000)
-            return "completed" if boss_hp <= 0 else "died"
+            # Show the result for 3 seconds while still handling events
+            if game_over_hold is None:
+                game_over_hold = Timer(3000)
+            view.draw(player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+                      shuffled_word, text_input, game_over=True, win=boss_hp <= 0)
+            if game_over_hold.update(steps * timestep.step_ms):
+                return "completed" if boss_hp <= 0 else "died"
+            continue
 
-        # Update game state when popup is not active
+        # Update game state when popup is not active, one fixed tick at a time
         if not popup_active:
-            player_movement(keys_pressed, player)
-            shooting(playerBullets, player, boss)
-            boss_movement(boss)
-            if not popup_active:  # Only shoot when popup is not active
-                boss_shooting(bossBullets, boss)
+            for _ in range(steps):
+                # Bullets keep their own previous positions
+                previous = capture_positions([player])
+                previous['boss'] = boss.topleft
+                player_movement(snapshot, player)
+                shooting(playerBullets, boss)
+                boss_movement(boss)
+                boss_shooting(attacks, bossBullets, boss, player, boss_hp)
                 update_boss_shooting(bossBullets, player)
 
         # Handle popup timing
@@ -494,12 +513,14 @@ def main():
             popup_active = True
             popup_start_time = current_time
             word, shuffled_word = generate_word()
-            player_input = ""
+            popup = create_text_input(shuffled_word)
+            text_input.reset()
 
         # Draw current game state
-        popup = create_text_input(shuffled_word) if popup_active else None
-        draw_window(player, boss, playerBullets, bossBullets, player_hp, boss_hp, 
-                   shuffled_word, player_input, popup)
+        text_input.update(clock.get_time())
+        view.draw(player, boss, playerBullets, bossBullets, player_hp, boss_hp,
+                  shuffled_word, text_input, popup if popup_active else None,
+                  previous=previous, alpha=1.0 if popup_active else timestep.alpha)
 
     return "quit"
 
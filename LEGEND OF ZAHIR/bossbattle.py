@@ -0,0 +1,309 @@
+import abc
+import math
+import pygame
+from framecache import cached
+
+ROTATION_STEPS = 64  # Pre-rotated images per bullet image, one every 5.6 degrees
+
+
+def baked_rotations(key, load, steps=ROTATION_STEPS):
+    """
+    Get an image rotated to every direction a bullet can fly in.
+
+    The rotations are made once per process, so firing a bullet only picks
+    the nearest one instead of loading, scaling and rotating an image.
+
+    Args:
+        key (str): Name the rotations are cached under
+        load (callable): Returns the image facing right
+        steps (int): Number of directions
+
+    Returns:
+        list: Images for directions 0, 360 / steps, ... degrees clockwise from right
+    """
+    def build():
+        image = load()
+        return [pygame.transform.rotate(image, -360 * i / steps) for i in range(steps)]
+    return cached(('rotations', key, steps), build)
+
+
+class Projectile:
+    """
+    One pooled bullet.
+
+    Attributes:
+        x, y (float): Centre position
+        vx, vy (float): Movement per simulation tick
+        px, py (float): Centre position before the last tick, for interpolation
+        image (pygame.Surface): Pre-rotated image for the direction of flight
+        rect (pygame.Rect): Area used for collisions, centred on the position
+    """
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'px', 'py', 'image', 'rect')
+
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+
+class BulletPool:
+    """
+    Every bullet of one kind, moved, culled and collided in a single pass.
+
+    Bullets that leave the bounds or hit the target go back to a free list
+    and are reused by the next spawn, so a bullet-hell phase does not
+    allocate objects or surfaces while it runs.
+
+    Attributes:
+        images (list): Pre-rotated images from baked_rotations()
+        bounds (pygame.Rect): Bullets leaving this area are removed
+        active (list): Bullets in flight
+        free (list): Bullets ready to be reused
+    """
+
+    def __init__(self, images, bounds):
+        """
+        Args:
+            images (list): Pre-rotated images from baked_rotations()
+            bounds (pygame.Rect): Bullets leaving this area are removed
+        """
+        self.images = images
+        self.bounds = pygame.Rect(bounds)
+        self.active = []
+        self.free = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def spawn(self, x, y, vx, vy):
+        """
+        Fire a bullet.
+
+        Args:
+            x, y (float): Starting centre position
+            vx, vy (float): Movement per simulation tick
+        """
+        bullet = self.free.pop() if self.free else Projectile()
+        bullet.x = bullet.px = x
+        bullet.y = bullet.py = y
+        bullet.vx = vx
+        bullet.vy = vy
+        steps = len(self.images)
+        bullet.image = self.images[round(math.atan2(vy, vx) * steps / math.tau) % steps]
+        bullet.rect.size = bullet.image.get_size()
+        bullet.rect.center = (round(x), round(y))
+        self.active.append(bullet)
+
+    def update(self, target=None):
+        """
+        Move every bullet one tick, dropping those that hit the target or leave the bounds.
+
+        Args:
+            target (pygame.Rect): Area bullets hit, None for no collisions
+
+        Returns:
+            int: Number of bullets that hit the target
+        """
+        hits = 0
+        kept = []
+        bounds = self.bounds
+        for bullet in self.active:
+            bullet.px = bullet.x
+            bullet.py = bullet.y
+            bullet.x += bullet.vx
+            bullet.y += bullet.vy
+            rect = bullet.rect
+            rect.center = (round(bullet.x), round(bullet.y))
+            if target is not None and rect.colliderect(target):
+                hits += 1
+                self.free.append(bullet)
+            elif rect.colliderect(bounds):
+                kept.append(bullet)
+            else:
+                self.free.append(bullet)
+        self.active = kept
+        return hits
+
+    def clear(self):
+        """Remove every bullet."""
+        self.free.extend(self.active)
+        self.active = []
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw every bullet between its last two ticks.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            alpha (float): Fraction of a tick since the last one
+        """
+        surface.blits([(bullet.image,
+                        (round(bullet.px + (bullet.x - bullet.px) * alpha) - bullet.rect.width // 2,
+                         round(bullet.py + (bullet.y - bullet.py) * alpha) - bullet.rect.height // 2))
+                       for bullet in self.active], doreturn=False)
+
+
+class Pattern(abc.ABC):
+    """
+    A bullet pattern fired at a fixed rate.
+
+    Attributes:
+        interval (int): Simulation ticks between volleys
+        speed (float): Bullet movement per tick
+        countdown (int): Ticks until the next volley
+    """
+
+    def __init__(self, interval, speed, delay=None):
+        """
+        Args:
+            interval (int): Simulation ticks between volleys
+            speed (float): Bullet movement per tick
+            delay (int): Ticks before the first volley, the interval if None
+        """
+        self.interval = interval
+        self.speed = speed
+        self.delay = interval if delay is None else delay
+        self.countdown = self.delay
+
+    def reset(self):
+        """Start counting towards the first volley again."""
+        self.countdown = self.delay
+
+    def update(self, pool, origin, target):
+        """
+        Count one tick and fire when the interval is up.
+
+        Args:
+            pool (BulletPool): Pool to fire into
+            origin (tuple): Where the bullets start
+            target (tuple): Position of the player
+        """
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.countdown += self.interval
+            self.fire(pool, origin, target)
+
+    def fire_at(self, pool, origin, degrees):
+        """Fire one bullet in a direction, in degrees clockwise from right."""
+        radians = math.radians(degrees)
+        pool.spawn(origin[0], origin[1], self.speed * math.cos(radians), self.speed * math.sin(radians))
+
+    @abc.abstractmethod
+    def fire(self, pool, origin, target):
+        """
+        Fire one volley, each pattern places its own bullets.
+
+        Args:
+            pool (BulletPool): Pool to fire into
+            origin (tuple): Where the bullets start
+            target (tuple): Position of the player
+        """
+
+
+class Ring(Pattern):
+    """Bullets in every direction at once."""
+
+    def __init__(self, count, interval, speed, offset=0, delay=None):
+        """
+        Args:
+            count (int): Bullets in the ring, evenly spaced
+            offset (float): Direction of the first bullet in degrees
+        """
+        super().__init__(interval, speed, delay)
+        self.count = count
+        self.offset = offset
+
+    def fire(self, pool, origin, target):
+        for i in range(self.count):
+            self.fire_at(pool, origin, self.offset + 360 * i / self.count)
+
+
+class Spiral(Pattern):
+    """A few bullets per volley, turning a little further each time."""
+
+    def __init__(self, arms, turn, interval, speed, delay=None):
+        """
+        Args:
+            arms (int): Bullets per volley, evenly spaced
+            turn (float): Degrees the arms turn between volleys
+        """
+        super().__init__(interval, speed, delay)
+        self.arms = arms
+        self.turn = turn
+        self.angle = 0
+
+    def fire(self, pool, origin, target):
+        for i in range(self.arms):
+            self.fire_at(pool, origin, self.angle + 360 * i / self.arms)
+        self.angle = (self.angle + self.turn) % 360
+
+
+class AimedBurst(Pattern):
+    """A fan of bullets aimed at the player."""
+
+    def __init__(self, count, spread, interval, speed, delay=None):
+        """
+        Args:
+            count (int): Bullets in the fan
+            spread (float): Degrees between the outermost bullets
+        """
+        super().__init__(interval, speed, delay)
+        self.count = count
+        self.spread = spread
+
+    def fire(self, pool, origin, target):
+        aim = math.degrees(math.atan2(target[1] - origin[1], target[0] - origin[0]))
+        if self.count == 1:
+            self.fire_at(pool, origin, aim)
+            return
+        for i in range(self.count):
+            self.fire_at(pool, origin, aim - self.spread / 2 + self.spread * i / (self.count - 1))
+
+
+class PatternScheduler:
+    """
+    Runs the boss's patterns for the phase its health is in.
+
+    Phases are listed by the health they start at, highest first. The
+    patterns of a phase start counting from the beginning when it begins.
+
+    Attributes:
+        phases (list): (starting health, patterns) pairs, highest health first
+        phase (int): Index of the current phase
+    """
+
+    def __init__(self, phases):
+        """
+        Args:
+            phases (list): (starting health, list of Pattern) pairs, highest health first
+        """
+        self.phases = phases
+        self.phase = 0
+
+    def phase_for(self, health):
+        """Index of the phase for a health value."""
+        phase = 0
+        for i, (start, _) in enumerate(self.phases):
+            if health <= start:
+                phase = i
+        return phase
+
+    def update(self, pool, origin, target, health):
+        """
+        Advance the patterns by one simulation tick.
+
+        Args:
+            pool (BulletPool): Pool to fire into
+            origin (tuple): Where the bullets start
+            target (tuple): Position of the player
+            health (int): The boss's current health
+        """
+        phase = self.phase_for(health)
+        if phase != self.phase:
+            self.phase = phase
+            for pattern in self.phases[phase][1]:
+                pattern.reset()
+        for pattern in self.phases[self.phase][1]:
+            pattern.update(pool, origin, target)
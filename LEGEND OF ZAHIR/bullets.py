@@ -1,5 +1,12 @@
 import pygame
 from config_settings import *
+from framecache import cached
+
+def render_cooldown_text():
+    """Render the cooldown notice, shared by every AmmoSystem."""
+    font = pygame.font.Font(None, 36)
+    return font.render("On Cooldown", True, (255, 0, 0))
+
 
 class AmmoSystem:
     """Manages the player's ammunition system with cooldown text."""
@@ -10,9 +17,8 @@ class AmmoSystem:
         self.cooldown_time = 3000  # 3 seconds in milliseconds
         self.cooldown_start = 0
         
-        # Setup the cooldown text
-        self.font = pygame.font.Font(None, 36)
-        self.cooldown_text = self.font.render("On Cooldown", True, (255, 0, 0))
+        # Setup the cooldown text, rendered once per process
+        self.cooldown_text = cached(('ammo', 'cooldown_text'), render_cooldown_text)
         self.cooldown_text_rect = self.cooldown_text.get_rect(center=(WIDTH/2, 50))
         
     def can_shoot(self):
@@ -88,9 +94,7 @@ class Bullet(pygame.sprite.Sprite):
         self.image = pygame.transform.rotate(self.original_image, -target_angle - 90)
         self.rect = self.image.get_rect(center=self.rect.center)
 
-        if pygame.sprite.spritecollide(self, self.game.blocks, False):
-            self.kill()
-
+        # Walls are hit in the game's collision pass
         if (self.rect.left > WIDTH or self.rect.right < 0 or 
             self.rect.top > HEIGHT or self.rect.bottom < 0):
             self.kill()
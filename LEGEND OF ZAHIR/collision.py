@@ -0,0 +1,167 @@
+import pygame
+from config_settings import COLLISION_CELL_SIZE
+
+# Collision layers, one bit each so a layer mask can hold several
+BULLET = 1
+ENEMY = 2
+BLOCK = 4
+PLAYER = 8
+DOOR = 16
+TARGET = 32  # Things minigames shoot at, e.g. the candles
+
+
+class Broadphase:
+    """
+    Finds every colliding pair of a tick in one pass over a spatial hash.
+
+    Sprites are registered with the layer they are on, either a whole
+    sprite group at a time or one object at a time. Handlers are registered
+    for pairs of layers, and only layers that have a handler are hashed and
+    tested against each other. Each tick update() files every rectangle
+    under the grid cells it overlaps, tests the pairs sharing a cell once
+    each and calls the handler of every pair that overlaps.
+
+    The hash is built again each tick because the camera moves every
+    sprite, which costs about as much as one spritecollide per sprite.
+    Sprites killed by a handler are skipped for the rest of the tick.
+
+    Attributes:
+        cell_size (int): Width and height of a grid cell in pixels
+        groups (list): (sprite group, layer) pairs whose members are tested
+        objects (dict): Layer and rectangle of each object added on its own
+        handlers (dict): Handler of each (layer, layer) pair
+        masks (dict): Layers each layer is tested against
+        pair_count (int): Colliding pairs handled last tick, for profiling
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        """
+        Args:
+            cell_size (int): Width and height of a grid cell, about twice a sprite's size
+        """
+        self.cell_size = cell_size
+        self.groups = []
+        self.objects = {}
+        self.handlers = {}
+        self.masks = {}
+        self.pair_count = 0
+
+    def on(self, layer_a, layer_b, handler):
+        """
+        Call a handler for every overlapping pair on two layers.
+
+        Args:
+            layer_a (int): Layer of the handler's first argument
+            layer_b (int): Layer of the handler's second argument
+            handler (callable): Takes the object on layer_a and the one on layer_b
+        """
+        self.handlers[(layer_a, layer_b)] = handler
+        self.masks[layer_a] = self.masks.get(layer_a, 0) | layer_b
+        self.masks[layer_b] = self.masks.get(layer_b, 0) | layer_a
+
+    def track(self, group, layer):
+        """
+        Test every member of a sprite group, including ones added later.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): Sprites with a rect
+            layer (int): Layer the sprites are on
+        """
+        self.groups.append((group, layer))
+
+    def add(self, obj, layer, rect=None):
+        """
+        Test one object.
+
+        Args:
+            obj: Hashable object handed to handlers, e.g. a sprite or an index
+            layer (int): Layer the object is on
+            rect (pygame.Rect or callable): Area to test, or a function
+                returning it each tick. None uses the object's rect.
+        """
+        self.objects[obj] = (layer, rect)
+
+    def remove(self, obj):
+        """Stop testing an object added with add()."""
+        self.objects.pop(obj, None)
+
+    def clear(self):
+        """Forget every tracked group and object, keeping the handlers."""
+        self.groups = []
+        self.objects = {}
+
+    def entries(self):
+        """Objects to test this tick as (object, layer, rect), skipping layers without handlers."""
+        masks = self.masks
+        for group, layer in self.groups:
+            if masks.get(layer):
+                for sprite in group:
+                    yield sprite, layer, sprite.rect
+        for obj, (layer, rect) in self.objects.items():
+            if masks.get(layer):
+                if rect is None:
+                    rect = obj.rect
+                elif callable(rect):
+                    rect = rect()
+                yield obj, layer, rect
+
+    def pairs(self):
+        """
+        Find this tick's overlapping pairs.
+
+        Returns:
+            list: (handler, a, b) for each pair, a and b in the handler's order
+        """
+        size = self.cell_size
+        entries = []
+        cells = {}
+        for entry in self.entries():
+            index = len(entries)
+            entries.append(entry)
+            rect = entry[2]
+            for col in range(rect.left // size, (rect.right - 1) // size + 1):
+                for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    cells.setdefault((col, row), []).append(index)
+
+        found = []
+        seen = set()
+        masks = self.masks
+        handlers = self.handlers
+        for members in cells.values():
+            if len(members) < 2:
+                continue
+            for i, a in enumerate(members):
+                obj_a, layer_a, rect_a = entries[a]
+                wanted = masks[layer_a]
+                for b in members[i + 1:]:
+                    obj_b, layer_b, rect_b = entries[b]
+                    if not wanted & layer_b or (a, b) in seen:
+                        continue
+                    seen.add((a, b))
+                    if not rect_a.colliderect(rect_b):
+                        continue
+                    handler = handlers.get((layer_a, layer_b))
+                    if handler is not None:
+                        found.append((handler, obj_a, obj_b))
+                    else:
+                        found.append((handlers[(layer_b, layer_a)], obj_b, obj_a))
+        return found
+
+    def update(self):
+        """
+        Find this tick's overlapping pairs and call their handlers.
+
+        Returns:
+            int: Number of pairs handled
+        """
+        count = 0
+        for handler, a, b in self.pairs():
+            # A handler earlier in the tick may have killed one of them
+            if isinstance(a, pygame.sprite.Sprite) and not a.alive():
+                continue
+            if isinstance(b, pygame.sprite.Sprite) and not b.alive():
+                continue
+            handler(a, b)
+            count += 1
+        self.pair_count = count
+        return count
@@ -5,12 +5,68 @@ FPS = 60
 TILESIZE = 48
 BULLETSIZE = 16
 
+# Simulation settings
+# Gameplay speeds are in pixels per simulation tick, so they stay the same
+# however fast or slow the screen is redrawn
+SIM_FPS = 60  # Simulation ticks per second
+MAX_SIM_STEPS = 5  # Most ticks simulated for one rendered frame before dropping time
+RENDER_FPS = FPS  # Render frame cap, 0 renders uncapped
+VSYNC = False  # Sync rendering to the display refresh instead of RENDER_FPS
+IDLE_FPS = 15  # Frame cap for screens waiting on input with nothing changing
+# Static screens (menus, leaderboard, quizzes) only redraw when something
+# changed and otherwise sleep until input arrives or IDLE_WAIT_MS passes
+RENDER_ON_DEMAND = True
+IDLE_WAIT_MS = 1000
+# Background jobs (asset loading) get this much of each frame
+JOB_BUDGET_MS = 4
+
+# Control settings
+# Each action is bound to pygame key codes, mouse actions to button numbers
+KEY_BINDINGS = {
+    'move_left': (97,),    # pygame.K_a
+    'move_right': (100,),  # pygame.K_d
+    'move_up': (119,),     # pygame.K_w
+    'move_down': (115,),   # pygame.K_s
+    'interact': (101,),    # pygame.K_e
+    'pause': (27,),        # pygame.K_ESCAPE
+    'confirm': (13,),      # pygame.K_RETURN
+    'advance': (32,),      # pygame.K_SPACE
+}
+MOUSE_BINDINGS = {
+    'shoot': (1,),  # Left mouse button
+}
+
+# Audio settings
+AUDIO_ENABLED = True  # False (or the ZAHIR_NO_AUDIO environment variable) skips the mixer
+# Mixer channels reserved for each sound category, how many copies of one
+# sound may play at once, and whether a full category cuts off its oldest
+# sound (True) or drops the new one (False)
+SOUND_CHANNELS = {'sfx': 8, 'ui': 2, 'voice': 2, 'music': 2}
+SOUND_MAX_INSTANCES = {'sfx': 3, 'ui': 1, 'voice': 1, 'music': 1}
+SOUND_STEALING = {'sfx': True, 'ui': True, 'voice': False, 'music': False}
+# Music track for each game mode and for dialogue, in assets/sounds/bgm
+MUSIC_TRACKS = {
+    'main': 'A_Journey_Awaits.mp3',
+    'dialogue': 'background_music.wav',
+    'candle memory': 'background_music.wav',
+    'timezone': 'A_Journey_Awaits.mp3',
+    'language': 'A_Journey_Awaits.mp3',
+    'continent': 'A_Journey_Awaits.mp3',
+    'boss': 'A_Journey_Awaits.mp3',
+}
+MUSIC_CHUNK_MS = 1000  # Length of each streamed piece of music
+MUSIC_CROSSFADE_MS = 1500  # Time to fade between two tracks
+
 # Layer settings
 PLAYER_LAYER = 3
 ENEMY_LAYER = 2
 BLOCK_LAYER = 1
 WALL_LAYER = 1
 
+# Collision settings
+COLLISION_CELL_SIZE = TILESIZE * 2  # Grid cell of the collision broadphase in pixels
+DOOR_RANGE = 100  # Distance from the door's centre at which it can be entered
+
 # Player settings
 PLAYER_SPEED = 4
 PLAYER_HEALTH = 100
@@ -23,6 +79,15 @@ ENEMY_HEALTH = 50
 ENEMY_DAMAGE = 5
 ENEMY_KNOCKBACK = 3
 
+# Enemy level of detail
+# Enemies on screen update every tick. Enemies within LOD_NEAR_MARGIN of the
+# screen update every LOD_NEAR_INTERVAL ticks without animating, and the
+# rest only step towards the player on the tile grid every LOD_FAR_INTERVAL
+LOD_ENABLED = True
+LOD_NEAR_MARGIN = TILESIZE * 4
+LOD_NEAR_INTERVAL = 3
+LOD_FAR_INTERVAL = 10
+
 # Experience and leveling
 EXP_YIELD = 20
 EXP_TO_LEVEL = 100
@@ -113,6 +178,24 @@ MEMORY_TILEMAP = [
     'WWWWWWWWWWWWWWWWWWWWWWWWWWWW'
 ]
 
+# Candle memory minigame
+MEMORY_ROUNDS = 5  # Sequences to repeat to win
+MEMORY_START_LENGTH = 1  # Candles in the first sequence, one more each round
+MEMORY_FLASH_MS = 500  # How long each candle stays lit
+MEMORY_GAP_MS = 150  # Dark pause between two flashes
+MEMORY_WIN_HOLD_MS = 2000  # How long the win message stays up
+
+# Continent minigame
+# Hard mode checks drops against the polygon regions in CONTINENT_REGIONS
+# instead of rectangles around each continent
+CONTINENT_HARD_MODE = False
+CONTINENT_REGIONS = 'LEGEND OF ZAHIR/assets/regions/continents.json'
+
+# Timezone minigame
+# Difficulty tier of the questions: 'easy' (whole hours), 'medium' (summer
+# time on a given date) or 'hard' (also half and quarter hour zones)
+TIMEZONE_TIER = 'easy'
+
 # Game states
 INTRO = 0
 PLAYING = 1
@@ -140,4 +223,16 @@ DIFFICULTY_MULTIPLIERS = {
     EASY: 0.5,
     NORMAL: 1.0,
     HARD: 1.5
-}
\ No newline at end of file
+}
+DIFFICULTY = NORMAL  # Scales the enemy waves' budgets
+
+# Enemy waves
+# With waves on, the main game rooms also spawn enemies over time on top
+# of the 'E' markers, and the door only appears once every wave is beaten
+WAVES_ENABLED = False
+WAVE_COUNT = 3  # Waves per room, 0 keeps them coming (for stress tests)
+WAVE_BUDGET = 6  # Enemies in the first wave at NORMAL difficulty
+WAVE_GROWTH = 1.25  # Each wave's budget over the one before
+WAVE_DELAY_MS = 10000  # Next wave starts this long after the last, or once it is cleared
+SPAWN_INTERVAL_MS = 250  # At most one enemy spawns per interval, so no tick spikes
+MAX_LIVE_ENEMIES = 30  # Spawning waits while this many enemies are alive
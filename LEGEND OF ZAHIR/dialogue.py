@@ -7,11 +7,62 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from visual_assets import VisualNovelAssets, CharacterPosition, SpriteType
+from timestep import FixedTimestep
+from scenes import Scene, SceneManager
+from soundmanager import sound_manager
+
+class DialogueScene(Scene):
+    """Runs one dialogue sequence, advancing lines with SPACE."""
+
+    def __init__(self, system, sequence_key: str):
+        super().__init__()
+        self.system = system
+        self.sequence_key = sequence_key
+
+    def enter(self):
+        self.system.timestep.reset(self.manager.clock)
+        sound_manager.music.enter('dialogue')
+
+    def exit(self):
+        sound_manager.music.leave('dialogue')
+
+    def handle_events(self, events):
+        system = self.system
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.finish(False)
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                if system.text_counter < len(system.target_text):
+                    # Complete current text immediately
+                    system.text_counter = len(system.target_text)
+                else:
+                    # Move to next line
+                    system.current_line_index += 1
+                    if system.current_line_index < len(system.current_sequence):
+                        # Setup scene for the next line
+                        system.setup_scene(self.sequence_key, system.current_line_index)
+                        # Set the text for the next line
+                        system.target_text = system.current_sequence[system.current_line_index]['text']
+                        system.text_counter = 0
+                    else:
+                        system.dialogue_active = False
+                        self.finish(True)
+                        return
+
+    def update(self, dt):
+        super().update(dt)
+        for _ in range(self.system.timestep.advance(dt)):
+            self.system.update()
+
+    def draw(self, screen):
+        self.system.draw()
 
 class DialogueSystem:
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, scenes=None):
         self.screen = screen
         self.clock = clock
+        self.scenes = scenes if scenes is not None else SceneManager(screen, clock)
         self.font = pygame.font.Font(None, 32)
         
         # Initialize visual novel assets
@@ -32,7 +83,8 @@ class DialogueSystem:
         self.border_color = (200, 200, 200)
         self.border_width = 3
         
-        self.dialogue_speed = 2
+        self.dialogue_speed = 2  # Characters revealed per simulation tick
+        self.timestep = FixedTimestep()
         self.current_text = ""
         self.target_text = ""
         self.text_counter = 0
@@ -263,8 +315,8 @@ class DialogueSystem:
         space_width = self.font.size(' ')[0]
         
         for word in words:
-            word_surface = self.font.render(word, True, (255, 255, 255))
-            word_width = word_surface.get_width()
+            # Measured without rendering, the text is wrapped again every frame
+            word_width = self.font.size(word)[0]
             
             # If adding this word exceeds the box width
             if current_width + word_width + (space_width if current_line else 0) > self.box_width - (2 * self.padding):
@@ -294,8 +346,7 @@ class DialogueSystem:
         # Clear the screen first
         self.screen.fill((0, 0, 0))
 
-        # Update and draw visual novel assets
-        self.visual_assets.update()
+        # Draw visual novel assets
         self.visual_assets.draw()
 
         # Calculate dialogue box position
@@ -339,6 +390,11 @@ class DialogueSystem:
             self.text_counter += self.dialogue_speed
             self.current_text = self.target_text[:int(self.text_counter)]
 
+    def update(self):
+        """Advance text reveal and scene transitions by one simulation tick."""
+        self.update_text()
+        self.visual_assets.update()
+
     def setup_scene(self, sequence_key: str, line_index: int):
         """Set up the visual novel scene for the current dialogue line."""
         if sequence_key in self.dialogue_sequences:
@@ -376,6 +432,7 @@ class DialogueSystem:
     def start_dialogue(self, sequence_key: str):
         """Start a specific dialogue sequence."""
         if sequence_key in self.dialogue_sequences:
+            self.visual_assets.ensure_loaded()
             self.current_sequence = self.dialogue_sequences[sequence_key]
             self.current_line_index = 0
             
@@ -396,32 +453,4 @@ class DialogueSystem:
         if not self.start_dialogue(sequence_key):
             return False
         
-        running = True
-        while running and self.dialogue_active:
-            self.update_text()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    if self.text_counter < len(self.target_text):
-                        # Complete current text immediately
-                        self.text_counter = len(self.target_text)
-                    else:
-                        # Move to next line
-                        self.current_line_index += 1
-                        if self.current_line_index < len(self.current_sequence):
-                            # Setup scene for the next line
-                            self.setup_scene(sequence_key, self.current_line_index)
-                            # Set the text for the next line
-                            self.target_text = self.current_sequence[self.current_line_index]['text']
-                            self.text_counter = 0
-                        else:
-                            self.dialogue_active = False
-                            running = False
-            
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
-        
-        return True
\ No newline at end of file
+        return self.scenes.run(DialogueScene(self, sequence_key))
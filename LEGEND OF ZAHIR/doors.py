@@ -1,44 +1,68 @@
 import pygame
 
 from config_settings import *
+from framecache import cached, tween_frames, frame_index
+
+DOOR_OPEN_STEPS = 50  # Frames in the opening animation
+
+
+def draw_door():
+    """Draw the closed door, 2 tiles tall."""
+    image = pygame.Surface((TILESIZE, TILESIZE * 2))
+    image.fill((139, 69, 19))  # Brown color
+    
+    # Add a border to make it more visible
+    pygame.draw.rect(image, (101, 67, 33), image.get_rect(), 3)  # Darker brown border
+    
+    # Add inner details to make it look more like a door
+    door_width = TILESIZE
+    door_height = TILESIZE * 2
+    
+    # Add door panels
+    panel_color = (165, 42, 42)  # Darker brown for panels
+    panel_margin = 8
+    panel_width = door_width - (panel_margin * 2)
+    panel_height = (door_height - (panel_margin * 3)) // 2
+    
+    # Top panel
+    pygame.draw.rect(image, panel_color, 
+                    (panel_margin, panel_margin, 
+                     panel_width, panel_height))
+    
+    # Bottom panel
+    pygame.draw.rect(image, panel_color, 
+                    (panel_margin, panel_margin * 2 + panel_height,
+                     panel_width, panel_height))
+    
+    # Add doorknob
+    knob_color = (218, 165, 32)  # Golden color
+    knob_radius = 4
+    knob_pos = (door_width - 12, door_height // 2)
+    pygame.draw.circle(image, knob_color, knob_pos, knob_radius)
+    return image
+
+
+def door_frames():
+    """
+    Get the door's opening animation, built once per process.
+
+    Returns:
+        list: Frames from closed to fully open, the door getting narrower
+    """
+    closed = cached(('door', 'closed'), draw_door)
+    return cached(('door', 'opening'), lambda: tween_frames(
+        closed, DOOR_OPEN_STEPS, lambda t: (TILESIZE * (1.0 - t / 2), TILESIZE * 2)))
+
 
 class Door(pygame.sprite.Sprite):
     def __init__(self, game, x, y):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
         
-        # Create door appearance (2 tiles tall)
-        self.image = pygame.Surface((TILESIZE, TILESIZE * 2))
-        self.image.fill((139, 69, 19))  # Brown color
-        
-        # Add a border to make it more visible
-        pygame.draw.rect(self.image, (101, 67, 33), self.image.get_rect(), 3)  # Darker brown border
-        
-        # Add inner details to make it look more like a door
-        door_width = TILESIZE
-        door_height = TILESIZE * 2
-        
-        # Add door panels
-        panel_color = (165, 42, 42)  # Darker brown for panels
-        panel_margin = 8
-        panel_width = door_width - (panel_margin * 2)
-        panel_height = (door_height - (panel_margin * 3)) // 2
-        
-        # Top panel
-        pygame.draw.rect(self.image, panel_color, 
-                        (panel_margin, panel_margin, 
-                         panel_width, panel_height))
-        
-        # Bottom panel
-        pygame.draw.rect(self.image, panel_color, 
-                        (panel_margin, panel_margin * 2 + panel_height,
-                         panel_width, panel_height))
-        
-        # Add doorknob
-        knob_color = (218, 165, 32)  # Golden color
-        knob_radius = 4
-        knob_pos = (door_width - 12, door_height // 2)
-        pygame.draw.circle(self.image, knob_color, knob_pos, knob_radius)
+        # Shared closed image and opening frames
+        self.frames = door_frames()
+        self.image = self.frames[0]
+        self.frame = 0
         
         # Position the door
         self.rect = self.image.get_rect()
@@ -49,7 +73,7 @@ class Door(pygame.sprite.Sprite):
         self._layer = WALL_LAYER + 1  # Just in front of walls but behind player
         
         # Store original image for reference
-        self.original_image = self.image.copy()
+        self.original_image = self.image
         
         # Animation variables
         self.is_opening = False
@@ -73,16 +97,12 @@ class Door(pygame.sprite.Sprite):
                 self.fully_open = True
                 self.open_progress = 100
             
-            # Create opening animation effect
-            # Scale the door to create a "opening" effect
-            scale_factor = 1.0 - (self.open_progress / 200)  # Door gets narrower
-            if scale_factor > 0:
-                new_width = int(TILESIZE * scale_factor)
-                if new_width > 0:
-                    new_image = pygame.transform.scale(self.original_image, 
-                                                     (new_width, TILESIZE * 2))
-                    self.image = new_image
-                    # Keep door centered while scaling
-                    old_center = self.rect.center
-                    self.rect = self.image.get_rect()
-                    self.rect.center = old_center
\ No newline at end of file
+            # Door gets narrower as it opens, frames are only swapped when they change
+            frame = frame_index(self.open_progress / 100, DOOR_OPEN_STEPS)
+            if frame != self.frame:
+                self.frame = frame
+                self.image = self.frames[frame]
+                # Keep door centered while it narrows
+                center = self.rect.center
+                self.rect.size = self.image.get_size()
+                self.rect.center = center
@@ -1,7 +1,39 @@
 import pygame
 from config_settings import *
+from lod import VISIBLE, FAR
+from framecache import cached
 import random
 
+# Sprite sheet region of each walking frame, per direction
+ENEMY_FRAMES = {
+    'down': [(0, 0), (16, 0), (32, 0)],
+    'up': [(0, 16), (16, 16), (32, 16)],
+    'left': [(0, 32), (16, 34), (32, 34)],
+    'right': [(0, 48), (16, 50), (32, 50)],
+}
+
+
+def load_enemy_frames(sheet):
+    """
+    Get the enemy's walking frames, cut from the sheet and scaled once.
+
+    Spawning an enemy during play then costs no file reads or scaling.
+
+    Args:
+        sheet (Spritesheet): The shared enemy spritesheet
+
+    Returns:
+        dict: List of frames for each direction, shared by every enemy
+    """
+    def build():
+        return {
+            direction: [pygame.transform.scale(sheet.get_sprite(x, y, 16, 16), (TILESIZE, TILESIZE))
+                        for x, y in regions]
+            for direction, regions in ENEMY_FRAMES.items()
+        }
+    return cached(('enemy', 'frames', sheet), build)
+
+
 class Enemy(pygame.sprite.Sprite):
     """
     Enemy class representing hostile entities in the game.
@@ -36,7 +68,7 @@ class Enemy(pygame.sprite.Sprite):
             y (int): Starting y-coordinate in tile units
             
         The enemy is initialized with default health, random facing direction,
-        and loads its sprite animations from the sprite sheet.
+        and the shared animation frames from the enemy sprite sheet.
         """
         self.game = game
         self._layer = ENEMY_LAYER
@@ -56,103 +88,66 @@ class Enemy(pygame.sprite.Sprite):
         # Combat attributes
         self.health = ENEMY_HEALTH
 
+        # Level of detail, set each tick by the game's LodScheduler
+        self.lod = VISIBLE
+        self.lod_steps = 1
+        self.lod_slot = None
+
         # Animation attributes
         self.facing = random.choice(['left', 'right'])
         self.animation_loop = 1
         self.last_update = pygame.time.get_ticks()
 
-        # Load and set up sprites
-        self.sprite_sheet = pygame.image.load('LEGEND OF ZAHIR/skeleton_strip.png')
-        self.load_animations()
-        
-        # Set up initial image and rect
-        self.image = self.game.enemy_spritesheet.get_sprite(1, 0, 15, 15) 
+        # Animation frames are cut and scaled once and shared by every enemy
+        self.animations = load_enemy_frames(self.game.enemy_spritesheet)
+        self.image = self.animations['down'][0]
         self.rect = self.image.get_rect()
         self.rect.x = self.x
-        self.rect.y = self.y   
-
-        # Initialize animation dictionaries
-        self.animations = {
-            'down': [self.game.enemy_spritesheet.get_sprite(0, 0, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(16, 0, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(32, 0, 16, 16)],
-            
-            'up': [self.game.enemy_spritesheet.get_sprite(0, 16, 16, 16),
-                self.game.enemy_spritesheet.get_sprite(16, 16, 16, 16),
-                self.game.enemy_spritesheet.get_sprite(32, 16, 16, 16)],
-            
-            'left': [self.game.enemy_spritesheet.get_sprite(0, 32, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(16, 34, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(32, 34, 16, 16)],
-            
-            'right': [self.game.enemy_spritesheet.get_sprite(0, 48, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(16, 50, 16, 16),
-                    self.game.enemy_spritesheet.get_sprite(32, 50, 16, 16)]
-        }
-        # Scale initial image
-        self.img = self.animations['down'][0]  
-        self.image = pygame.transform.scale(self.img, (TILESIZE, TILESIZE))
-        
-        # Scale all animation frames
-        for direction in self.animations:
-            self.animations[direction] = [
-                pygame.transform.scale(img, (TILESIZE, TILESIZE)) 
-                for img in self.animations[direction]
-            ]
-
-    def load_animations(self):
-        """
-        Load animation frames from the sprite sheet.
-        
-        Divides the sprite sheet into individual frames and creates
-        separate animation sequences for left and right facing directions.
-        Each frame is scaled to match the tile size.
-        """
-        self.animations = {
-            'down':[],
-            'up':[],
-            'left': [], 
-            'right': [],
-        }
-        
-        sprite_width = self.sprite_sheet.get_width() // 3
-        sprite_height = self.sprite_sheet.get_height() // 4
-
-        for row, direction in enumerate(['down','up','left', 'right']):
-            for col in range(3):
-                x = col * sprite_width
-                y = row * sprite_height
-                sprite = self.sprite_sheet.subsurface(pygame.Rect(x, y, sprite_width, sprite_height))
-                scaled_sprite = pygame.transform.scale(sprite, (TILESIZE, TILESIZE))
-                self.animations[direction].append(scaled_sprite)
+        self.rect.y = self.y
 
     def update(self):
         """
         Update the enemy's state for the current frame.
         
-        Handles movement, collisions, animations, and combat checks.
+        Handles movement, wall collisions and animations. Bullet hits are
+        found by the game's collision broadphase after every sprite moved.
+        How much of this runs depends on the enemy's level of detail:
+        enemies off screen skip ticks and catch up with longer moves, and
+        only enemies on screen animate.
+        The cells the enemy stands on are handed to the spawn service
+        after it moved, so nothing is spawned on top of it.
         This method is called every frame while the enemy exists.
         """
-        self.movement()
-        self.check_collisions()
-        self.animate()
-        self.check_bullet_collision()
+        steps = self.lod_steps
+        if not steps:
+            return
+        if self.lod == FAR:
+            self.advance_on_grid(steps)
+        else:
+            self.movement(steps)
+            self.check_collisions()
+            if self.lod == VISIBLE:
+                self.animate()
+        self.game.spawn_service.place(self)
 
-    def movement(self):
+    def movement(self, steps=1):
         """
         Calculate and apply enemy movement towards the player.
         
         Uses simple path finding to move towards the player's current position.
         Movement speed is normalized so diagonal movement isn't faster.
         Updates facing direction based on movement.
+
+        Args:
+            steps (int): Simulation ticks of movement to cover
         """
         dx = self.game.player.rect.x - self.rect.x
         dy = self.game.player.rect.y - self.rect.y
         dist = max(abs(dx), abs(dy))
         
         if dist != 0:
-            self.x_change = (dx / dist) * ENEMY_SPEED
-            self.y_change = (dy / dist) * ENEMY_SPEED
+            self.x_change = (dx / dist) * ENEMY_SPEED * steps
+            self.y_change = (dy / dist) * ENEMY_SPEED * steps
         else:
             self.x_change = 0
             self.y_change = 0
@@ -195,16 +190,27 @@ class Enemy(pygame.sprite.Sprite):
                 self.rect.top = y_collision[0].rect.bottom
             self.y_change = 0
 
-    def check_bullet_collision(self):
+    def advance_on_grid(self, steps):
         """
-        Check for collisions with player bullets and handle damage.
-        
-        If a bullet hits the enemy, it takes damage based on the
-        player's attack power and grants experience points if defeated.
+        Move towards the player without wall collisions or animation.
+
+        Used for enemies far off screen. Like check_collisions(), the x and
+        y moves are tried separately so the enemy slides along walls, but a
+        move is only made if every tile the moved rect covers is walkable,
+        at most four set lookups instead of testing every wall.
+
+        Args:
+            steps (int): Simulation ticks of movement to cover
         """
-        bullet_hits = pygame.sprite.spritecollide(self, self.game.bullets, True)
-        for bullet in bullet_hits:
-            self.take_damage(self.game.player.attack_power)
+        self.movement(steps)
+        spawner = self.game.spawn_service
+        offset = spawner.camera_offset()
+        for dx, dy in ((self.x_change, 0), (0, self.y_change)):
+            moved = self.rect.copy()
+            moved.x += dx
+            moved.y += dy
+            if all(cell in spawner.walkable for cell in spawner.cells_under(moved, offset)):
+                self.rect = moved
 
     def take_damage(self, amount):
         """
@@ -220,58 +226,58 @@ class Enemy(pygame.sprite.Sprite):
         if self.health <= 0:
             self.kill()
 
+    def kill(self):
+        """Remove the enemy from the room and free the cells it stood on."""
+        self.game.spawn_service.release(self)
+        super().kill()
+
     @classmethod
     def create_random(cls, game):
-        map_height = len(TILEMAP)
-        map_width = len(TILEMAP[0])
-        min_distance = 5
-        
-        # Explicitly set boundaries to avoid wall tiles
-        left_bound = 1
-        right_bound = map_width - 2
-        top_bound = 1
-        bottom_bound = map_height - 2
-        
-        
-        print(f"Spawn boundaries: {left_bound}-{right_bound} x {top_bound}-{bottom_bound}")
-        
-        valid_positions = []
-        for y in range(top_bound, bottom_bound + 1):
-            for x in range(left_bound, right_bound + 1):
-                # Extra validation to ensure position is within map
-                if not (0 <= x < map_width and 0 <= y < map_height):
-                    continue
-                    
-                if TILEMAP[y][x] not in [".", "E", "P"]:
-                    continue
-                    
-                # Get player position in tile coordinates
-                player_tile_x = game.player.rect.x // TILESIZE
-                player_tile_y = game.player.rect.y // TILESIZE
-                
-                # Calculate distance from player
-                dx = x - player_tile_x
-                dy = y - player_tile_y
-                distance = (dx * dx + dy * dy) ** 0.5
-                
-                if distance < min_distance:
-                    continue
-                    
-                # Verify the position is clear
-                temp_rect = pygame.Rect(x * TILESIZE, y * TILESIZE, TILESIZE, TILESIZE)
-                collision = any(sprite.rect.colliderect(temp_rect) for sprite in game.allsprites)
-                
-                if not collision:
-                    valid_positions.append((x, y))
-        
-        if not valid_positions:
+        """
+        Spawn a single enemy on a random free cell away from the player.
+
+        Args:
+            game (Game): Reference to the main game instance
+
+        Returns:
+            Enemy: The newly created enemy
+
+        Raises:
+            ValueError: If no free cell is far enough from the player
+        """
+        enemies = cls.create_wave(game, 1)
+        if not enemies:
             raise ValueError("No valid positions found for enemy spawn")
-            
-        # Print chosen position for debugging
-        x, y = random.choice(valid_positions)
-        print(f"Spawning enemy at tile position: {x},{y}")
-        
-        return cls(game, x, y)
+        return enemies[0]
+
+    @classmethod
+    def create_wave(cls, game, count):
+        """
+        Spawn up to count enemies on distinct free cells away from the player.
+
+        Cells come from the game's SpawnService, which keeps the free cells
+        up to date as enemies move and die, so the cost grows with the number of enemies spawned
+        rather than with the size of the map.
+
+        Args:
+            game (Game): Reference to the main game instance
+            count (int): Number of enemies to spawn
+
+        Returns:
+            list: The enemies that were created
+        """
+        spawner = game.spawn_service
+        offset_x, offset_y = spawner.camera_offset()
+
+        enemies = []
+        for x, y in spawner.sample(count):
+            enemy = cls(game, x, y)
+            # Tile coordinates are in world space, move into the scrolled view
+            enemy.rect.x += offset_x
+            enemy.rect.y += offset_y
+            spawner.place(enemy)
+            enemies.append(enemy)
+        return enemies
 
     def animate(self):
         """
@@ -0,0 +1,73 @@
+import pygame
+
+# Surfaces and frame lists built once per process, by key
+_cache = {}
+
+
+def cached(key, build):
+    """
+    Get a value built once per process.
+
+    The first call for a key runs build() and keeps the result, so images
+    drawn procedurally or animation frames are only made once no matter how
+    many sprites use them. Cached surfaces are shared and must not be drawn on.
+
+    Args:
+        key: Hashable name of the value, e.g. ('door', 'closed')
+        build (callable): Makes the value when it is not cached yet
+
+    Returns:
+        The cached value
+    """
+    value = _cache.get(key)
+    if value is None:
+        value = build()
+        _cache[key] = value
+    return value
+
+
+def clear(key=None):
+    """
+    Forget cached values, e.g. after the display mode changes.
+
+    Args:
+        key: Value to forget, None for all of them
+    """
+    if key is None:
+        _cache.clear()
+    else:
+        _cache.pop(key, None)
+
+
+def tween_frames(image, steps, size_at):
+    """
+    Pre-scale an image for every step of a tweened animation.
+
+    Args:
+        image (pygame.Surface): Image at the start of the animation
+        steps (int): Number of steps, the list has one more frame than this
+        size_at (callable): Takes the progress from 0.0 to 1.0 and returns
+            the (width, height) of the frame
+
+    Returns:
+        list: Frames from progress 0.0 to 1.0
+    """
+    frames = []
+    for step in range(steps + 1):
+        width, height = size_at(step / steps)
+        frames.append(pygame.transform.scale(image, (max(1, int(width)), max(1, int(height)))))
+    return frames
+
+
+def frame_index(progress, steps):
+    """
+    Quantize a progress value to the nearest earlier frame.
+
+    Args:
+        progress (float): Progress from 0.0 to 1.0
+        steps (int): Number of steps the frames were built with
+
+    Returns:
+        int: Index into the frame list
+    """
+    return max(0, min(steps, int(progress * steps)))
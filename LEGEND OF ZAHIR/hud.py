@@ -0,0 +1,210 @@
+import pygame
+from config_settings import *
+
+FONT_PATH = 'LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf'
+
+# Player stats layout
+BAR_WIDTH = 200
+BAR_HEIGHT = 20
+MARGIN = 10
+LEFT_OFFSET = 10
+TOP_OFFSET = 10
+
+_UNSET = object()
+
+
+def format_time(total_seconds):
+    """
+    Format a duration as MM:SS, or HH:MM:SS from an hour up.
+
+    Args:
+        total_seconds (int): Whole seconds
+
+    Returns:
+        str: The formatted time
+    """
+    if total_seconds < 3600:  # Less than an hour
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        return f"{minutes:02d}:{seconds:02d}"
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class HudWidget:
+    """
+    One part of the HUD with its own area of the HUD surface.
+
+    Attributes:
+        rect (pygame.Rect): Area the widget owns, cleared before each redraw
+        state (callable): Returns the inputs the widget is drawn from
+        render (callable): Draws the widget given the surface and its inputs
+        last: Inputs it was last drawn with
+    """
+
+    def __init__(self, rect, state, render):
+        """
+        Args:
+            rect (tuple): Area the widget owns on the HUD surface
+            state (callable): Returns the inputs the widget is drawn from
+            render (callable): Draws the widget given the surface and its inputs
+        """
+        self.rect = pygame.Rect(rect)
+        self.state = state
+        self.render = render
+        self.last = _UNSET
+
+
+class Hud:
+    """
+    Player stats, timer and cooldown notice kept on one cached surface.
+
+    Each frame every widget's inputs are compared with the ones it was last
+    drawn with, and only widgets whose inputs changed are redrawn. Drawing
+    the HUD is then a single blit of the cached surface.
+
+    Attributes:
+        game (Game): The main game object the inputs are read from
+        surface (pygame.Surface): Cached HUD, transparent between widgets
+        widgets (list): The HUD's widgets
+        redraws (int): Number of widget redraws, for profiling
+    """
+
+    HEIGHT = 90  # The HUD only covers a band at the top of the screen
+
+    def __init__(self, game):
+        """
+        Args:
+            game (Game): The main game object
+        """
+        self.game = game
+        self.surface = pygame.Surface((WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        self.small_font = pygame.font.Font(FONT_PATH, 14)
+        self.redraws = 0
+
+        ammo_y = BAR_HEIGHT + MARGIN
+        attack_y = ammo_y + BAR_HEIGHT + MARGIN
+        self.widgets = [
+            HudWidget((0, 0, 320, ammo_y), self.health_state, self.draw_health),
+            HudWidget((0, ammo_y, 320, attack_y - ammo_y), self.ammo_state, self.draw_ammo),
+            HudWidget((0, attack_y, 320, 24), self.attack_state, self.draw_attack),
+            HudWidget((WIDTH - 420, 0, 420, 40), self.timer_state, self.draw_timer),
+            HudWidget((WIDTH // 2 - 150, 30, 300, 40), self.cooldown_state, self.draw_cooldown),
+        ]
+
+    def invalidate(self):
+        """Redraw every widget on the next draw."""
+        for widget in self.widgets:
+            widget.last = _UNSET
+
+    def refresh(self):
+        """Redraw the widgets whose inputs changed."""
+        for widget in self.widgets:
+            state = widget.state()
+            if state == widget.last:
+                continue
+            widget.last = state
+            self.surface.set_clip(widget.rect)
+            self.surface.fill((0, 0, 0, 0))
+            widget.render(self.surface, state)
+            self.redraws += 1
+        self.surface.set_clip(None)
+
+    def draw(self, screen):
+        """
+        Bring the HUD up to date and draw it.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+        """
+        self.refresh()
+        screen.blit(self.surface, (0, 0))
+
+    # Widget inputs
+
+    def health_state(self):
+        player = self.game.player
+        return player.name, player.health, player.max_health
+
+    def ammo_state(self):
+        ammo = self.game.player.ammo_system
+        return ammo.current_ammo, ammo.magazine_size
+
+    def attack_state(self):
+        return self.game.player.attack_power
+
+    def timer_state(self):
+        return int(self.game.elapsed_time)
+
+    def cooldown_state(self):
+        # The tutorial does not show the cooldown notice
+        return self.game.ammo_system.on_cooldown and not self.game.in_tutorial
+
+    # Widget drawing
+
+    def draw_health(self, surface, state):
+        name, health, max_health = state
+        health_y = TOP_OFFSET
+        health_outline = pygame.Rect(LEFT_OFFSET, health_y, BAR_WIDTH, BAR_HEIGHT)
+        health_fill = pygame.Rect(LEFT_OFFSET, health_y, BAR_WIDTH * (health / max_health), BAR_HEIGHT)
+
+        # Draw health bar background and fill
+        pygame.draw.rect(surface, (100, 0, 0), health_outline)  # Dark red background
+        pygame.draw.rect(surface, RED, health_fill)  # Health fill
+        pygame.draw.rect(surface, WHITE, health_outline, 2)  # White border
+
+        # Draw player name on left side of health bar
+        name_text = self.small_font.render(name, True, WHITE)
+        surface.blit(name_text, name_text.get_rect(midleft=(LEFT_OFFSET + 5, health_y + BAR_HEIGHT//2)))
+
+        # Draw HP counter next to health bar
+        hp_text = self.small_font.render(f"{health}/{max_health}", True, WHITE)
+        surface.blit(hp_text, hp_text.get_rect(midleft=(LEFT_OFFSET + BAR_WIDTH + 5, health_y + BAR_HEIGHT//2)))
+
+    def draw_ammo(self, surface, state):
+        current_ammo, magazine_size = state
+        ammo_y = BAR_HEIGHT + MARGIN
+        mag_width = BAR_WIDTH
+        mag_height = BAR_HEIGHT
+
+        # Magazine background
+        mag_rect = pygame.Rect(LEFT_OFFSET, ammo_y, mag_width, mag_height)
+        pygame.draw.rect(surface, (40, 40, 40), mag_rect)  # Darker background
+        pygame.draw.rect(surface, (70, 70, 70), mag_rect, 2)  # Border
+
+        # Calculate bullet dimensions
+        bullet_width = (mag_width - 20) // magazine_size
+        bullet_margin = 2
+        bullet_height = mag_height - 6
+
+        # Draw ammo slots
+        for i in range(magazine_size):
+            bullet_x = LEFT_OFFSET + 10 + (bullet_width + bullet_margin) * i
+            bullet_rect = pygame.Rect(bullet_x, ammo_y + 3, bullet_width, bullet_height)
+
+            # Bright orange for loaded bullets, darker gray for empty slots
+            color = (255, 165, 0) if i < current_ammo else (80, 80, 80)
+            pygame.draw.rect(surface, color, bullet_rect)
+
+            # Draw separator after each bullet except the last one
+            if i < magazine_size - 1:
+                separator_x = bullet_x + bullet_width + bullet_margin//2
+                pygame.draw.line(surface, (70, 70, 70),
+                                 (separator_x, ammo_y + 3),
+                                 (separator_x, ammo_y + mag_height - 3))
+
+    def draw_attack(self, surface, attack_power):
+        attack_y = 2 * (BAR_HEIGHT + MARGIN)
+        attack_text = self.small_font.render(f"ATK: {attack_power}", True, WHITE)
+        surface.blit(attack_text, attack_text.get_rect(topleft=(LEFT_OFFSET, attack_y)))
+
+    def draw_timer(self, surface, total_seconds):
+        timer_text = self.game.font.render(f"Total Time: {format_time(total_seconds)}", True, WHITE)
+        surface.blit(timer_text, timer_text.get_rect(topright=(WIDTH - 20, 10)))
+
+    def draw_cooldown(self, surface, on_cooldown):
+        if on_cooldown:
+            ammo = self.game.ammo_system
+            surface.blit(ammo.cooldown_text, ammo.cooldown_text_rect)
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+import time
+
+
+def measure_menu(game, seconds, on_demand):
+    """
+    Leave the main menu idle for a while and measure what it costs.
+
+    Args:
+        game (Game): The main game object
+        seconds (float): How long to leave the menu open
+        on_demand (bool): Whether on-demand scenes skip clean frames
+
+    Returns:
+        dict: CPU use as a percentage of one core, frames drawn and frames skipped
+    """
+    from screens import MainMenuScene
+    scenes = game.scenes
+    scenes.render_on_demand = on_demand
+    drawn, idle = scenes.frames_drawn, scenes.frames_idle
+
+    menu = MainMenuScene(game)
+    menu.add_timer(seconds * 1000, menu.finish)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    scenes.run(menu)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return {
+        'cpu_percent': 100 * cpu / wall,
+        'frames_drawn': scenes.frames_drawn - drawn,
+        'frames_idle': scenes.frames_idle - idle,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the CPU used by the idle main menu.")
+    parser.add_argument('--seconds', type=float, default=10, help="how long to idle in each mode")
+    parser.add_argument('--headless', action='store_true', help="no window or audio device")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        # Must be set before the game modules open the display
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        os.environ['ZAHIR_NO_AUDIO'] = '1'
+    from maingame import Game
+    game = Game()
+    for label, on_demand in (("every frame", False), ("on demand", True)):
+        report = measure_menu(game, args.seconds, on_demand)
+        print(f"{label:>12}: {report['cpu_percent']:5.1f}% CPU, "
+              f"{report['frames_drawn']} frames drawn, {report['frames_idle']} skipped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
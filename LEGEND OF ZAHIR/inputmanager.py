@@ -0,0 +1,207 @@
+import pygame
+from typing import NamedTuple
+from config_settings import KEY_BINDINGS, MOUSE_BINDINGS
+
+
+class InputSnapshot(NamedTuple):
+    """
+    Everything the player did during one frame.
+
+    Snapshots are immutable, so every system reading input in a frame sees
+    the same state no matter how many simulation ticks run or in which order
+    they are handled.
+
+    Attributes:
+        events (tuple): Raw events pulled from the queue this frame
+        held (frozenset): Keys held down at the end of the frame
+        pressed (frozenset): Keys that went down this frame
+        released (frozenset): Keys that went up this frame
+        mouse_pos (tuple): Mouse position at the end of the frame
+        clicks (tuple): (button, pos) for each mouse button pressed this frame
+        text (str): Characters typed this frame
+        quit (bool): Whether the window was asked to close
+        actions (frozenset): Bound actions held down at the end of the frame
+        triggered (frozenset): Bound actions started this frame
+    """
+
+    events: tuple = ()
+    held: frozenset = frozenset()
+    pressed: frozenset = frozenset()
+    released: frozenset = frozenset()
+    mouse_pos: tuple = (0, 0)
+    clicks: tuple = ()
+    text: str = ""
+    quit: bool = False
+    actions: frozenset = frozenset()
+    triggered: frozenset = frozenset()
+
+    def is_held(self, action):
+        """Check whether a bound action is held down."""
+        return action in self.actions
+
+    def was_triggered(self, action):
+        """Check whether a bound action started this frame."""
+        return action in self.triggered
+
+    def clicked(self, button=1):
+        """
+        Get the position of the first click with a mouse button this frame.
+
+        Args:
+            button (int): Mouse button number, 1 for left
+
+        Returns:
+            tuple: Click position, or None if the button was not pressed
+        """
+        for clicked_button, pos in self.clicks:
+            if clicked_button == button:
+                return pos
+        return None
+
+
+class InputManager:
+    """
+    Polls the event queue once per frame and turns it into an InputSnapshot.
+
+    Held keys and the mouse position are tracked from the events themselves
+    rather than read from pygame's live state, so a recorded event stream
+    always produces the same snapshots when it is fed back in.
+
+    Attributes:
+        key_bindings (dict): Action name to the keys that trigger it
+        mouse_bindings (dict): Action name to the mouse buttons that trigger it
+        held (set): Keys currently held down
+        buttons (set): Mouse buttons currently held down
+        mouse_pos (tuple): Last known mouse position
+        current (InputSnapshot): Snapshot of the last polled frame
+        event_source (callable): Returns the events for a frame instead of
+            the pygame queue when set, used to replay recorded input
+        listeners (list): Callables given each frame's events, used to record
+    """
+
+    def __init__(self, key_bindings=KEY_BINDINGS, mouse_bindings=MOUSE_BINDINGS):
+        """
+        Initialize the input manager.
+
+        Args:
+            key_bindings (dict): Action name to key codes
+            mouse_bindings (dict): Action name to mouse button numbers
+        """
+        self.key_bindings = key_bindings
+        self.mouse_bindings = mouse_bindings
+        self.held = set()
+        self.buttons = set()
+        self.mouse_pos = (0, 0)
+        self.current = InputSnapshot()
+        self.event_source = None
+        self.listeners = []
+
+    def reset(self):
+        """Forget held keys and buttons, e.g. after the window loses focus."""
+        self.held.clear()
+        self.buttons.clear()
+
+    def poll(self):
+        """
+        Pull all pending events and build this frame's snapshot.
+
+        Returns:
+            InputSnapshot: Input for the frame
+        """
+        if self.event_source is not None:
+            events = self.event_source()
+        else:
+            events = pygame.event.get()
+        return self._dispatch(events)
+
+    def wait(self, timeout):
+        """
+        Sleep until an event arrives or the timeout passes, then build the snapshot.
+
+        Used by screens with nothing to animate, so they use no CPU while the
+        player is idle. Replayed input never waits.
+
+        Args:
+            timeout (int): Most milliseconds to wait
+
+        Returns:
+            InputSnapshot: Input for the frame, empty if the timeout passed
+        """
+        if self.event_source is not None:
+            return self.poll()
+        event = pygame.event.wait(max(1, int(timeout)))
+        events = [] if event.type == pygame.NOEVENT else [event]
+        return self._dispatch(events + pygame.event.get())
+
+    def _dispatch(self, events):
+        """Hand a frame's events to the listeners and build its snapshot."""
+        for listener in self.listeners:
+            listener(events)
+        return self.process(events)
+
+    def process(self, events):
+        """
+        Build a snapshot from a batch of events.
+
+        Args:
+            events (list): Events for one frame
+
+        Returns:
+            InputSnapshot: Input for the frame
+        """
+        pressed = set()
+        released = set()
+        clicks = []
+        text = []
+        quit_requested = False
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+                pressed.add(event.key)
+                if event.unicode and event.unicode.isprintable():
+                    text.append(event.unicode)
+            elif event.type == pygame.KEYUP:
+                self.held.discard(event.key)
+                released.add(event.key)
+            elif event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.mouse_pos = event.pos
+                self.buttons.add(event.button)
+                clicks.append((event.button, event.pos))
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self.mouse_pos = event.pos
+                self.buttons.discard(event.button)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key up events are not delivered while unfocused
+                self.reset()
+            elif event.type == pygame.QUIT:
+                quit_requested = True
+
+        clicked_buttons = {button for button, _ in clicks}
+        self.current = InputSnapshot(
+            events=tuple(events),
+            held=frozenset(self.held),
+            pressed=frozenset(pressed),
+            released=frozenset(released),
+            mouse_pos=self.mouse_pos,
+            clicks=tuple(clicks),
+            text="".join(text),
+            quit=quit_requested,
+            actions=self._actions(self.held, self.buttons),
+            triggered=self._actions(pressed, clicked_buttons),
+        )
+        return self.current
+
+    def _actions(self, keys, buttons):
+        """Get the bound actions matched by a set of keys and mouse buttons."""
+        actions = {action for action, bound in self.key_bindings.items()
+                   if any(key in keys for key in bound)}
+        actions.update(action for action, bound in self.mouse_bindings.items()
+                       if any(button in buttons for button in bound))
+        return frozenset(actions)
+
+
+# Create a global instance of InputManager
+input_manager = InputManager()
@@ -0,0 +1,204 @@
+import threading
+import time
+from config_settings import JOB_BUDGET_MS
+
+
+class Job:
+    """
+    A piece of work split into steps by a generator.
+
+    Each yield ends a step. The generator's return value becomes the
+    job's result. A step may yield a thread, and the job is then not
+    resumed until the thread has finished (see in_background()).
+
+    Attributes:
+        name (str): Description of the work, for profiling
+        done (bool): Whether the generator has finished
+        result: Value the generator returned
+        steps (int): Steps run so far
+        on_done (callable): Called with the result when the job finishes
+        waiting (threading.Thread): Thread the job waits on, or None
+    """
+
+    def __init__(self, work, name="", on_done=None):
+        """
+        Args:
+            work (generator): The work, yielding between steps
+            name (str): Description of the work
+            on_done (callable): Called with the result when the job finishes
+        """
+        self.work = work
+        self.name = name
+        self.on_done = on_done
+        self.done = False
+        self.result = None
+        self.steps = 0
+        self.waiting = None
+
+    @property
+    def ready(self):
+        """Whether the job can run its next step without blocking."""
+        return self.waiting is None or not self.waiting.is_alive()
+
+    def step(self):
+        """
+        Run the job's next step.
+
+        Returns:
+            bool: Whether the job has finished
+        """
+        try:
+            self.waiting = next(self.work)
+            self.steps += 1
+        except StopIteration as stop:
+            self.done = True
+            self.result = stop.value
+            if self.on_done:
+                self.on_done(self.result)
+        return self.done
+
+
+class JobScheduler:
+    """
+    Runs submitted jobs a few steps per frame within a time budget.
+
+    Expensive work such as loading images is written as a generator that
+    yields between small steps. The scene manager calls run() once a
+    frame, which resumes the oldest ready job until the frame's budget is
+    spent, so the work is spread over as many frames as it needs instead
+    of stalling one. At least one step runs each frame, so a job whose
+    steps are longer than the budget still finishes. Calls that cannot be
+    split, like decoding a large image, go through in_background() so the
+    frame does not wait for them. When a result is needed straight away,
+    finish() runs the rest of a job at once.
+
+    Attributes:
+        budget_ms (float): Time run() may spend per frame
+        jobs (list): Unfinished jobs, the oldest first
+        last_ms (float): Time spent by the last run(), for profiling
+        last_steps (int): Steps taken by the last run(), for profiling
+    """
+
+    def __init__(self, budget_ms=JOB_BUDGET_MS):
+        """
+        Args:
+            budget_ms (float): Time run() may spend per frame
+        """
+        self.budget_ms = budget_ms
+        self.jobs = []
+        self.last_ms = 0.0
+        self.last_steps = 0
+
+    @property
+    def busy(self):
+        """Whether any job is waiting to run."""
+        return bool(self.jobs)
+
+    def submit(self, work, name="", on_done=None):
+        """
+        Queue work to be run over the next frames.
+
+        Args:
+            work (generator): The work, yielding between steps
+            name (str): Description of the work
+            on_done (callable): Called with the result when the job finishes
+
+        Returns:
+            Job: The queued job
+        """
+        job = Job(work, name, on_done)
+        self.jobs.append(job)
+        return job
+
+    def finish(self, job):
+        """
+        Run the rest of a job now.
+
+        Args:
+            job (Job): Job to finish, may already be done
+
+        Returns:
+            The job's result
+        """
+        while not job.done:
+            if job.waiting is not None:
+                job.waiting.join()
+            job.step()
+        if job in self.jobs:
+            self.jobs.remove(job)
+        return job.result
+
+    def finish_all(self):
+        """Run every queued job to the end now, the oldest first."""
+        while self.jobs:
+            self.finish(self.jobs[0])
+
+    def cancel(self, job):
+        """Drop a job without running the rest of it."""
+        if job in self.jobs:
+            self.jobs.remove(job)
+
+    def run(self, budget_ms=None):
+        """
+        Run job steps until the budget is spent or every job is done.
+
+        Args:
+            budget_ms (float): Time to spend, the scheduler's budget if None
+
+        Returns:
+            int: Steps run
+        """
+        if not self.jobs:
+            self.last_ms = 0.0
+            self.last_steps = 0
+            return 0
+        budget = (self.budget_ms if budget_ms is None else budget_ms) / 1000
+        start = time.perf_counter()
+        steps = 0
+        while True:
+            job = next((job for job in self.jobs if job.ready), None)
+            if job is None:
+                break  # Every job is waiting on a thread
+            if job.step():
+                self.jobs.remove(job)
+            steps += 1
+            if time.perf_counter() - start >= budget:
+                break
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.last_steps = steps
+        return steps
+
+
+def in_background(call, *args):
+    """
+    Run a blocking call on a worker thread from inside a job.
+
+    Used with yield from, the job is parked until the call returns, e.g.
+    image = yield from in_background(pygame.image.load, path). Only for
+    calls that release the GIL and do not touch the display.
+
+    Args:
+        call (callable): The blocking call
+        *args: Arguments for the call
+
+    Returns:
+        The call's result, its exception is raised in the job
+    """
+    outcome = {}
+
+    def work():
+        try:
+            outcome['result'] = call(*args)
+        except Exception as error:
+            outcome['error'] = error
+
+    worker = threading.Thread(target=work, name='Job', daemon=True)
+    worker.start()
+    yield worker
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+# Global job scheduler, run once a frame by the scene manager
+job_scheduler = JobScheduler()
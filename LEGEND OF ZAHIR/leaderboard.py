@@ -3,6 +3,8 @@ import pygame
 import os
 from datetime import datetime
 from config_settings import *
+from scenes import Scene
+from transitions import dim
 
 class LeaderboardSystem:
     """
@@ -84,11 +86,8 @@ def draw_leaderboard(screen, font, leaderboard_system):
     Draw the leaderboard on screen with properly aligned columns.
     Only shows completed game scores.
     """
-    # Create semi-transparent overlay
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    overlay.set_alpha(200)
-    screen.blit(overlay, (0, 0))
+    # Semi-transparent overlay
+    dim(screen, 200)
     
     # Draw title
     title = font.render('LEADERBOARD - COMPLETED GAMES', True, WHITE)
@@ -186,32 +185,57 @@ def draw_leaderboard(screen, font, leaderboard_system):
     exit_text = font.render('Press ENTER to continue', True, WHITE)
     exit_rect = exit_text.get_rect(center=(WIDTH/2, HEIGHT - 50))
     screen.blit(exit_text, exit_rect)
-    
-    pygame.display.update()
 
-def show_new_highscore(screen, font, rank, completion_time):
+class HighscoreScene(Scene):
+    """Congratulatory message for a new high score, shown for 3 seconds."""
+
+    on_demand = True
+
+    def __init__(self, font, rank, completion_time, duration=3000):
+        """
+        Args:
+            font (pygame.font.Font): Font for the message
+            rank (int): Leaderboard rank reached
+            completion_time (float): Completion time in seconds
+            duration (float): How long to show the message in milliseconds
+        """
+        super().__init__()
+        self.font = font
+        self.rank = rank
+        self.completion_time = completion_time
+        self.duration = duration
+
+    def enter(self):
+        font = self.font
+        self.backdrop = self.capture_backdrop()
+        dim(self.backdrop, 200)
+
+        congrats_text = font.render('NEW HIGH SCORE!', True, YELLOW)
+        rank_text = font.render(f'Rank: #{self.rank}', True, WHITE)
+        time_text = font.render(f'Time: {int(self.completion_time)}s', True, WHITE)
+        completion_text = font.render('Game Completed!', True, GREEN)
+
+        self.lines = [
+            (congrats_text, congrats_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 90))),
+            (rank_text, rank_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 30))),
+            (time_text, time_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 30))),
+            (completion_text, completion_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 90))),
+        ]
+        self.add_timer(self.duration, self.finish)
+
+    def draw(self, screen):
+        screen.blit(self.backdrop, (0, 0))
+        for text, rect in self.lines:
+            screen.blit(text, rect)
+
+def show_new_highscore(scenes, font, rank, completion_time):
     """
     Show a congratulatory message for achieving a high score in a completed game.
+
+    Args:
+        scenes (SceneManager): Scene manager to show the message with
+        font (pygame.font.Font): Font for the message
+        rank (int): Leaderboard rank reached
+        completion_time (float): Completion time in seconds
     """
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    overlay.set_alpha(200)
-    screen.blit(overlay, (0, 0))
-    
-    congrats_text = font.render('NEW HIGH SCORE!', True, YELLOW)
-    rank_text = font.render(f'Rank: #{rank}', True, WHITE)
-    time_text = font.render(f'Time: {int(completion_time)}s', True, WHITE)
-    completion_text = font.render('Game Completed!', True, GREEN)
-    
-    congrats_rect = congrats_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 90))
-    rank_rect = rank_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 30))
-    time_rect = time_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 30))
-    completion_rect = completion_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 90))
-    
-    screen.blit(congrats_text, congrats_rect)
-    screen.blit(rank_text, rank_rect)
-    screen.blit(time_text, time_rect)
-    screen.blit(completion_text, completion_rect)
-    
-    pygame.display.update()
-    pygame.time.delay(3000)  # Show for 3 seconds
\ No newline at end of file
+    scenes.show(HighscoreScene(font, rank, completion_time))
@@ -0,0 +1,83 @@
+import pygame
+from config_settings import *
+
+# Level of detail of an enemy
+VISIBLE = 0  # On screen: full movement, wall collisions and animation
+NEAR = 1  # Just off screen: movement and wall collisions at a reduced rate
+FAR = 2  # Further out: steps towards the player on the tile grid
+
+
+class LodScheduler:
+    """
+    Decides how much of each enemy's update runs this tick.
+
+    Before the sprites update, every enemy is given a level of detail from
+    where it is relative to the screen, and the number of ticks its update
+    should cover (0 to skip it). Off-screen enemies are spread over the
+    ticks of their interval by a slot given to each enemy when first seen,
+    so the ones updating on any tick are a steady fraction of them. An enemy
+    that catches up on several ticks moves that many ticks' distance, so
+    it keeps pace with the ones on screen.
+
+    Attributes:
+        game (Game): The main game object
+        enabled (bool): False updates every enemy fully every tick
+        near_margin (int): Pixels around the screen counted as near
+        near_interval (int): Ticks between updates of near enemies
+        far_interval (int): Ticks between updates of far enemies
+        tick (int): Ticks scheduled so far
+        counts (list): Enemies at each level last tick, for profiling
+        updates (int): Enemy updates scheduled last tick, for profiling
+    """
+
+    def __init__(self, game, enabled=LOD_ENABLED, near_margin=LOD_NEAR_MARGIN,
+                 near_interval=LOD_NEAR_INTERVAL, far_interval=LOD_FAR_INTERVAL):
+        """
+        Args:
+            game (Game): The main game object
+            enabled (bool): False updates every enemy fully every tick
+            near_margin (int): Pixels around the screen counted as near
+            near_interval (int): Ticks between updates of near enemies
+            far_interval (int): Ticks between updates of far enemies
+        """
+        self.game = game
+        self.enabled = enabled
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.near_rect = self.screen_rect.inflate(near_margin * 2, near_margin * 2)
+        self.near_interval = near_interval
+        self.far_interval = far_interval
+        self.tick = 0
+        self.next_slot = 0
+        self.counts = [0, 0, 0]
+        self.updates = 0
+
+    def level_of(self, rect):
+        """Get the level of detail for a screen rect."""
+        if rect.colliderect(self.screen_rect):
+            return VISIBLE
+        if rect.colliderect(self.near_rect):
+            return NEAR
+        return FAR
+
+    def update(self):
+        """Give every enemy its level of detail and ticks to cover this tick."""
+        self.tick += 1
+        counts = [0, 0, 0]
+        updates = 0
+        for enemy in self.game.enemies:
+            if enemy.lod_slot is None:
+                enemy.lod_slot = self.next_slot
+                self.next_slot += 1
+            level = self.level_of(enemy.rect) if self.enabled else VISIBLE
+            if level == VISIBLE:
+                steps = 1
+            else:
+                interval = self.near_interval if level == NEAR else self.far_interval
+                steps = interval if (self.tick + enemy.lod_slot) % interval == 0 else 0
+            enemy.lod = level
+            enemy.lod_steps = steps
+            counts[level] += 1
+            if steps:
+                updates += 1
+        self.counts = counts
+        self.updates = updates
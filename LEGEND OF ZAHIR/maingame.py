@@ -5,13 +5,22 @@ from enemies import *
 from player import *
 from tiles import *
 from doors import *
+from spawner import SpawnService
+from waves import WaveDirector
+from lod import LodScheduler
+from collision import Broadphase, BULLET, ENEMY, BLOCK, PLAYER, DOOR
+from timestep import FixedTimestep, capture_positions, draw_interpolated, set_display_mode
+from scenes import SceneManager
+from screens import *
 from MINIGAME1 import run_memory_game
 from MINIGAME2 import run_timezone_game
 from MINIGAME3 import run_continent_game
 from MINIGAME4 import main as run_language_matching_game
 from MINIGAME5 import main as run_boss_battle
 from soundmanager import sound_manager
+from inputmanager import input_manager
 from tutorial import *
+from hud import Hud
 from dialogue import DialogueSystem
 from visual_assets import VisualNovelAssets
 from leaderboard import *
@@ -23,14 +32,20 @@ import time
 class Game:
     def __init__(self):
         "initialize everything needed"
-        pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # The mixer is opened in the background by the sound manager
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = set_display_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Legend of Zahir")
+        sound_manager.start()
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
+        self.previous_positions = {}
         self.font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 24)
         self.running = True
-        self.dialogue_system = DialogueSystem(self.screen, self.clock)
+        self.hud = Hud(self)
+        self.scenes = SceneManager(self.screen, self.clock)
+        self.dialogue_system = DialogueSystem(self.screen, self.clock, self.scenes)
         self.player_name = ""
         self.background = Background(self)
         
@@ -39,21 +54,17 @@ class Game:
         self.in_tutorial = True
         
         # Initialize game components
-        sound_manager.play_music()
+        sound_manager.music.enter('main')  # Starts once the mixer is ready
         self.game_start_time = time.time()
         self.elapsed_time = 0
         self.pause_time = 0
         self.is_paused = False
         self.pause_start = 0
-
-        # Initialize sound manager and load button sound
-        sound_manager.load_sound('button_click', 'buttons.mp3')  # Add button click sound
-        sound_manager.play_music()
         
         # Load sprite sheets
-        self.character_spritesheet = Spritesheet('LEGEND OF ZAHIR/main character strip.png')
-        self.enemy_spritesheet = Spritesheet('LEGEND OF ZAHIR/06-conjurer.png')
-        self.terrain_spritesheet = Spritesheet('LEGEND OF ZAHIR/dungeon2.jpg')
+        self.character_spritesheet = load_spritesheet('LEGEND OF ZAHIR/main character strip.png')
+        self.enemy_spritesheet = load_spritesheet('LEGEND OF ZAHIR/06-conjurer.png')
+        self.terrain_spritesheet = load_spritesheet('LEGEND OF ZAHIR/dungeon2.jpg')
         
         # Initialize game state
         self.allsprites = pygame.sprite.LayeredUpdates()
@@ -62,6 +73,17 @@ class Game:
         self.attacks = pygame.sprite.LayeredUpdates()
         self.bullets = pygame.sprite.LayeredUpdates()
 
+        # Every collision of a tick is found in one pass and handled here
+        self.collisions = Broadphase()
+        self.collisions.on(BULLET, ENEMY, self.on_bullet_hit_enemy)
+        self.collisions.on(BULLET, BLOCK, self.on_bullet_hit_block)
+        self.collisions.on(PLAYER, ENEMY, self.on_player_touch_enemy)
+        self.collisions.on(PLAYER, DOOR, self.on_player_near_door)
+        self.enemy_contact = False
+
+        # Enemies off screen update less often
+        self.lod = LodScheduler(self)
+
         # Modified door-related attributes with reset functionality
         self.door_sprite = None
         self.door_visible = False
@@ -82,7 +104,7 @@ class Game:
         self.in_tutorial = True
         
         self.paused = False
-        self.keys_pressed = set()
+        self.input_state = input_manager.current
         self.ammo_system = AmmoSystem() #bullet limits
         
         # Initialize leaderboard
@@ -106,52 +128,7 @@ class Game:
 
     def show_pause_menu(self):
         """Display the pause menu with restart option."""
-        pause_overlay = pygame.Surface((WIDTH, HEIGHT))
-        pause_overlay.fill((0, 0, 0))
-        pause_overlay.set_alpha(128)
-        
-        # Create menu text
-        menu_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 36)
-        pause_text = menu_font.render("PAUSED", True, WHITE)
-        resume_text = self.font.render("Press ESC to Resume", True, WHITE)
-        restart_text = self.font.render("Press R to Restart Level", True, WHITE)
-        quit_text = self.font.render("Press Q to Quit", True, WHITE)
-        
-        # Position text
-        pause_rect = pause_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 80))
-        resume_rect = resume_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 20))
-        restart_rect = restart_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 20))
-        quit_rect = quit_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 60))
-        
-        while self.paused and self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    self.paused = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.paused = False
-                        self.resume_timer()
-                    elif event.key == pygame.K_q:
-                        self.running = False
-                        self.paused = False
-                    elif event.key == pygame.K_r:
-                        # Handle restart
-                        self.paused = False
-                        self.resume_timer()
-                        self.new()  # Reset the current level
-                        sound_manager.play_sound('button_click')
-                        return
-            
-            # Draw pause menu
-            self.screen.blit(pause_overlay, (0, 0))
-            self.screen.blit(pause_text, pause_rect)
-            self.screen.blit(resume_text, resume_rect)
-            self.screen.blit(restart_text, restart_rect)
-            self.screen.blit(quit_text, quit_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(30)
+        self.scenes.show(PauseScene(self))
     
     def game_loop(self):
         """Main game loop with integrated dialogue and tutorial systems."""
@@ -159,45 +136,15 @@ class Game:
         self.dialogue_system.show_dialogue('intro')
         
         # Tutorial loop with gameplay
-        while self.running and self.in_tutorial:
-            # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                
-                # Handle tutorial system input
-                self.tutorial_system.handle_input(events)
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if self.ammo_system.can_shoot():  # Add cooldown check
-                        if self.player.shoot(pygame.mouse.get_pos()):
-                            self.ammo_system.shoot()  # Update ammo system
-                            sound_manager.play_sound('bullet')
-                
-                # Check if tutorial is completed
-                if self.tutorial_system.tutorial_completed:
-                    self.end_tutorial()  # Start timing after tutorial
-                    self.createTilemap()  # Recreate map with enemies
-                    self.create_enemies()  # Add random enemies
-                    self.dialogue_system.show_dialogue('after_tutorial')
-                    break
-            
-            # Update game state during tutorial
-            self.allsprites.update()
-            
-            # Draw game and tutorial overlay
-            self.screen.fill(BACKGROUND_COLOR)
-            self.allsprites.draw(self.screen)
-            self.player.draw_health_bar(self.screen)
-            self.player.draw_stats(self.screen)
-            self.draw_timer()
-            
-            # Draw tutorial overlay last
-            self.tutorial_system.draw(self.screen)
-            
-            pygame.display.update()
-            self.clock.tick(FPS)
+        if self.in_tutorial:
+            self.scenes.run(TutorialScene(self))
+        if not self.running:
+            return
+        if self.in_tutorial and self.tutorial_system.tutorial_completed:
+            self.end_tutorial()  # Start timing after tutorial
+            self.createTilemap()  # Recreate map with enemies
+            self.create_enemies()  # Add random enemies
+            self.dialogue_system.show_dialogue('after_tutorial')
         
         # Main game sequence loop with proper bounds checking
         while self.running and self.current_sequence_index < len(self.game_sequence):
@@ -263,108 +210,11 @@ class Game:
         Display a screen for the player to enter their name.
         Returns the entered name.
         """
-        input_box = pygame.Rect(WIDTH/2 - 150, HEIGHT/2, 200, 36)
-        color_inactive = pygame.Color('lightskyblue3')
-        color_active = pygame.Color('dodgerblue2')
-        color = color_inactive
-        active = False
-        text = ''
-        done = False
-
-        prompt = self.font.render('Please Enter Your Player Name:', True, WHITE)
-        prompt_rect = prompt.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
-
-        enter_text = self.font.render('Press ENTER when done', True, WHITE)
-        enter_rect = enter_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 50))
-
-        while not done:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return ''
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    active = input_box.collidepoint(event.pos)
-                    color = color_active if active else color_inactive
-                
-                if event.type == pygame.KEYDOWN:
-                    if active:
-                        if event.key == pygame.K_RETURN:
-                            done = True
-                        elif event.key == pygame.K_BACKSPACE:
-                            text = text[:-1]
-                        else:
-                            # Limit name length to 15 characters
-                            if len(text) < 15:
-                                text += event.unicode
-
-            self.screen.fill(BLACK)
-            
-            # Draw prompt
-            self.screen.blit(prompt, prompt_rect)
-            
-            # Draw the input box
-            txt_surface = self.font.render(text, True, color)
-            width = max(200, txt_surface.get_width()+10)
-            input_box.w = width
-            input_box.centerx = WIDTH/2
-            pygame.draw.rect(self.screen, color, input_box, 2)
-            self.screen.blit(txt_surface, (input_box.x+5, input_box.y+5))
-            
-            # Draw enter instruction
-            self.screen.blit(enter_text, enter_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-        return text if text else "Player"  # Return "Player" if no name entered
+        return self.scenes.run(NameEntryScene(self))
 
     def show_production_screen(self):
         """Display the production company screen with fade effects."""
-        # Setup fade effect
-        fade_surface = pygame.Surface((WIDTH, HEIGHT))
-        fade_surface.fill(BLACK)
-        
-        # Create the text
-        font_large = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 48)  # Larger font for production text
-        production_text = font_large.render("Produced by", True, WHITE)
-        team_text = font_large.render("Learning Team 7", True, WHITE)
-        
-        production_rect = production_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 40))
-        team_rect = team_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 40))
-        
-        # Fade in
-        for alpha in range(0, 255, 5):
-            self.screen.fill(BLACK)
-            
-            # Draw text
-            self.screen.blit(production_text, production_rect)
-            self.screen.blit(team_text, team_rect)
-            
-            # Apply fade
-            fade_surface.set_alpha(255 - alpha)
-            self.screen.blit(fade_surface, (0, 0))
-            
-            pygame.display.flip()
-            pygame.time.delay(20)
-        
-        # Hold the screen
-        pygame.time.delay(2000)  # Show for 2 seconds
-        
-        # Fade out
-        for alpha in range(0, 255, 5):
-            self.screen.fill(BLACK)
-            
-            # Draw text
-            self.screen.blit(production_text, production_rect)
-            self.screen.blit(team_text, team_rect)
-            
-            # Apply fade
-            fade_surface.set_alpha(alpha)
-            self.screen.blit(fade_surface, (0, 0))
-            
-            pygame.display.flip()
-            pygame.time.delay(20)
+        self.scenes.run(ProductionScene())
 
     def start_game_sequence(self):
         """Handle the complete game startup sequence."""
@@ -375,178 +225,12 @@ class Game:
 
     def loading_screen(self):
         """Display a loading screen with a progress bar."""
-        self.screen.fill(BLACK)
-        
-        # Create loading text
-        loading_text = self.font.render("Loading...", True, WHITE)
-        loading_rect = loading_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
-        
-        # Create progress bar background
-        bar_width = 400
-        bar_height = 40
-        bar_bg_rect = pygame.Rect(WIDTH/2 - bar_width/2, HEIGHT/2, bar_width, bar_height)
-        
-        # Simulate loading with progress bar
-        for progress in range(101):
-            # Calculate progress bar fill width
-            fill_width = (progress / 100) * bar_width
-            fill_rect = pygame.Rect(WIDTH/2 - bar_width/2, HEIGHT/2, fill_width, bar_height)
-            
-            # Draw loading screen
-            self.screen.fill(BLACK)
-            self.screen.blit(loading_text, loading_rect)
-            pygame.draw.rect(self.screen, GRAY, bar_bg_rect, 2)  # Border
-            pygame.draw.rect(self.screen, WHITE, fill_rect)
-            
-            # Add percentage text
-            percent_text = self.font.render(f"{progress}%", True, WHITE)
-            percent_rect = percent_text.get_rect(center=(WIDTH/2, HEIGHT/2 + bar_height + 20))
-            self.screen.blit(percent_text, percent_rect)
-            
-            pygame.display.flip()
-            pygame.time.delay(10)  # Control loading speed
+        self.scenes.run(LoadingScene(self.font))
 
     def main_menu(self):
         """Display the main menu with proper font sizes and game logo."""
-        try:
-            background = pygame.image.load('LEGEND OF ZAHIR/menu_background.png')
-            background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-        except:
-            print("Could not load menu background image")
-            background = None
-
-        # Create fonts of different sizes for the title and menu items
-        button_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 20)
-
-        # Colors
-        BUTTON_BG = (67, 56, 202)  # Base color
-        BUTTON_HOVER = (99, 102, 241)  # Hover color
-        BUTTON_BORDER = (129, 140, 248)  # Border color
-        BUTTON_SHADOW = (30, 27, 75)  # Shadow color
-
-        
-        # Button settings
-        button_width = 200  # Reduced width to match font size
-        button_height = 40  # Reduced height to match font size
-        button_spacing = 20
-        start_y = HEIGHT/2 + 50
-        shadow_offset = 3  # Slightly reduced shadow for smaller buttons
-        
-        buttons = {
-            'new_game': {
-                'rect': pygame.Rect(WIDTH/2 - button_width/2, start_y, button_width, button_height),
-                'text': 'New Game',
-                'action': self.start_new_game
-            },
-            'leaderboard': {
-                'rect': pygame.Rect(WIDTH/2 - button_width/2, start_y + button_height + button_spacing, 
-                                button_width, button_height),
-                'text': 'Leaderboard',
-                'action': self.show_leaderboard_screen
-            },
-            'quit': {
-                'rect': pygame.Rect(WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 2, 
-                                button_width, button_height),
-                'text': 'Quit',
-                'action': self.quit_game
-            }
-        }
-
-        def draw_button(surface, rect, text, is_selected, is_pressed=False):
-            """Draw a single button with proper sizing and styling."""
-            # Shadow/3D effect
-            shadow_rect = rect.copy()
-            shadow_rect.y += shadow_offset
-            pygame.draw.rect(surface, BUTTON_SHADOW, shadow_rect, border_radius=8)
-            
-            # Main button
-            button_rect = rect.copy()
-            if is_pressed:
-                button_rect.y += shadow_offset
-                color = BUTTON_HOVER
-            else:
-                color = BUTTON_HOVER if is_selected else BUTTON_BG
-            
-            pygame.draw.rect(surface, color, button_rect, border_radius=8)
-            
-            # Gradient effect
-            gradient_rect = button_rect.copy()
-            gradient_rect.height = button_rect.height // 2
-            pygame.draw.rect(surface, (*[min(c + 20, 255) for c in color], 50), 
-                            gradient_rect, border_radius=8)
-            
-            # Border
-            pygame.draw.rect(surface, BUTTON_BORDER, button_rect, 2, border_radius=8)
-            
-            # Inner glow when selected
-            if is_selected:
-                glow_rect = button_rect.inflate(-4, -4)
-                pygame.draw.rect(surface, (*BUTTON_BORDER, 100), glow_rect, 2, border_radius=6)
-            
-            # Text
-            text_surface = button_font.render(text, True, WHITE)
-            text_rect = text_surface.get_rect(center=button_rect.center)
-            if is_pressed:
-                text_rect.y += shadow_offset
-            
-            # Text shadow
-            text_shadow = button_font.render(text, True, BUTTON_SHADOW)
-            shadow_text_rect = text_rect.copy()
-            shadow_text_rect.y += 2
-            surface.blit(text_shadow, shadow_text_rect)
-            
-            # Main text
-            surface.blit(text_surface, text_rect)
-        # Main menu loop
-        selected_button = None
-        pressed_button = None
-        menu_running = True
-        while menu_running and self.running:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button_key, button in buttons.items():
-                        if button['rect'].collidepoint(mouse_pos):
-                            pressed_button = button_key
-                            sound_manager.play_sound('button_click')
-                
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if pressed_button:
-                        if buttons[pressed_button]['rect'].collidepoint(mouse_pos):
-                            buttons[pressed_button]['action']()
-                            if pressed_button == 'new_game':
-                                menu_running = False
-                            elif pressed_button == 'quit':
-                                self.running = False
-                                return
-                        pressed_button = None
-            
-            # Update selected button
-            selected_button = None
-            for button_key, button in buttons.items():
-                if button['rect'].collidepoint(mouse_pos):
-                    selected_button = button_key
-            
-            # Draw menu
-            if background:
-                self.screen.blit(background, (0, 0))
-            else:
-                self.screen.fill((30, 27, 75))
-        
-            # Draw buttons
-            for button_key, button in buttons.items():
-                is_selected = button_key == selected_button
-                is_pressed = button_key == pressed_button
-                draw_button(self.screen, button['rect'], button['text'], 
-                        is_selected, is_pressed)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        if self.scenes.run(MainMenuScene(self)) == 'new_game':
+            self.start_new_game()
 
     def start_new_game(self):
         """Handle starting a new game."""
@@ -556,21 +240,7 @@ class Game:
 
     def show_leaderboard_screen(self):
         """Display the leaderboard screen with sound effects."""
-        viewing = True
-        while viewing and self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN:
-                    if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
-                        sound_manager.play_sound('button_click')
-                        viewing = False
-            
-            self.screen.fill(BLACK)
-            draw_leaderboard(self.screen, self.font, self.leaderboard_system)
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        self.scenes.show(LeaderboardScene(self))
 
     def quit_game(self):
         """Handle quitting the game."""
@@ -584,6 +254,8 @@ class Game:
         self.enemies.empty()
         self.attacks.empty()
         self.bullets.empty()
+        self.previous_positions = {}
+        self.block_at = {}  # Wall of each tile, so the door can find its own
         
         # Find the player's initial spawn position from the TILEMAP
         initial_pos = None
@@ -615,13 +287,24 @@ class Game:
                     continue
                     
                 if column == "W":
-                    Block(self, j, i)
+                    self.block_at[(j, i)] = Block(self, j, i)
                 if column == "E" and not self.in_tutorial:
                     Enemy(self, j, i)
         
         # Ensure player is added to sprite group
         self.allsprites.add(self.player)
 
+        # Test this room's sprites for collisions
+        self.collisions.clear()
+        self.collisions.track(self.bullets, BULLET)
+        self.collisions.track(self.enemies, ENEMY)
+        self.collisions.track(self.blocks, BLOCK)
+        self.collisions.add(self.player, PLAYER)
+
+        # Track free cells for random enemy spawns in this room
+        self.spawn_service = SpawnService(self)
+        self.waves = WaveDirector(self) if WAVES_ENABLED and not self.in_tutorial else None
+
     def show_door(self):
         """Create and show the door sprite at the fixed center position."""
         if not self.door_visible and not self.enemies_defeated:
@@ -635,19 +318,23 @@ class Game:
             # Create door sprite
             self.door_sprite = Door(self, x, y)
             self.allsprites.add(self.door_sprite)
+            # The door reacts to the player within DOOR_RANGE of its centre
+            door = self.door_sprite
+            self.collisions.add(door, DOOR, rect=lambda: door.rect.inflate(DOOR_RANGE * 2, DOOR_RANGE * 2))
             self.door_visible = True
             self.door_prompt_visible = False
             self.enemies_defeated = True
             
-            # Remove any blocks at door position
-            for block in self.blocks.copy():
-                block_x = block.rect.x // TILESIZE
-                block_y = block.rect.y // TILESIZE
-                if block_x == x and block_y == y:
-                    block.kill()
+            # Remove any block at door position
+            block = self.block_at.pop((x, y), None)
+            if block:
+                block.kill()
             
             self.show_message("A door has appeared!", 2.0)
             sound_manager.play_sound('door_appear')
+            # Read the next mode's music while the player walks to the door
+            if self.current_sequence_index + 1 < len(self.game_sequence):
+                sound_manager.music.prepare(self.game_sequence[self.current_sequence_index + 1])
     
     
     def ensure_door_accessibility(self):
@@ -657,13 +344,10 @@ class Game:
             
         x, y = self.door_position
         
-        # Check and remove blocks that might block door access
-        for block in self.blocks.copy():
-            block_x = block.rect.x // TILESIZE
-            block_y = block.rect.y // TILESIZE
-            
-            # Remove blocks immediately adjacent to door
-            if (abs(block_x - x) == 1 and (block_y == y or block_y == y + 1)):
+        # Remove blocks immediately adjacent to door
+        for tile in ((x - 1, y), (x + 1, y), (x - 1, y + 1), (x + 1, y + 1)):
+            block = self.block_at.pop(tile, None)
+            if block:
                 block.kill()
 
     def show_door_prompt(self):
@@ -707,76 +391,100 @@ class Game:
         self.playing = True
          
     # Replace the existing events method with this:
-    def events(self):
-        """Handle game events with pause functionality."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.playing = False
-                self.running = False
-                
-            # Handle key press events
-            elif event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                
-                # Handle pause with Escape key
-                if event.key == pygame.K_ESCAPE:
-                    self.toggle_pause()
-                    
-            # Handle key release events
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
-                
-            # Handle shooting when not paused
-            if event.type == pygame.MOUSEBUTTONDOWN and not self.paused:
-                if event.button == 1 and not self.tutorial_system.active:
-                    if self.ammo_system.can_shoot():  # Check if we can shoot
-                        if self.player.shoot(pygame.mouse.get_pos()):
-                            self.ammo_system.shoot()  # Update ammo system
-                            sound_manager.play_sound('bullet')
+    def events(self, snapshot):
+        """
+        Handle game input with pause functionality.
+
+        Args:
+            snapshot (InputSnapshot): Input polled for this frame
+        """
+        self.input_state = snapshot
+        if snapshot.quit:
+            self.playing = False
+            self.running = False
+            
+        # Handle pause with Escape key
+        if snapshot.was_triggered('pause'):
+            self.toggle_pause()
+            
+        # Handle shooting when not paused
+        if snapshot.was_triggered('shoot') and not self.paused and not self.tutorial_system.active:
+            if self.ammo_system.can_shoot():  # Check if we can shoot
+                if self.player.shoot(snapshot.mouse_pos):
+                    self.ammo_system.shoot()  # Update ammo system
+                    sound_manager.play_sound('bullet')
 
     # Replace the existing update method with this:
     def update(self):
         """Update game state with modified door logic."""
         if not self.paused:
+            self.previous_positions = capture_positions(self.allsprites)
+            self.lod.update()
             self.allsprites.update()
+            self.spawn_service.place(self.player)  # Enemies place themselves
             self.elapsed_time = self.get_elapsed_time()
             
             # Update ammo system
             self.ammo_system.update()
+
+            if self.waves is not None:
+                self.waves.update(self.timestep.step_ms)
+
+            # Bullet hits, enemy contact and the door prompt
+            self.resolve_collisions()
             
             # Check player health
             if self.player.health <= 0:
                 self.playing = False
                 return "died"
             
-            # Check for bullet collisions
-            hits = pygame.sprite.groupcollide(self.bullets, self.enemies, True, True)
-            
-            # Show door when all enemies are defeated
-            if len(self.enemies) == 0 and not self.door_visible and not self.enemies_defeated:
+            # Show door when all enemies, and every wave, are defeated
+            waves_done = self.waves is None or self.waves.finished
+            if len(self.enemies) == 0 and waves_done and not self.door_visible and not self.enemies_defeated:
                 self.show_door()
                 self.enemies_defeated = True
             
             # Handle door interaction
-            if self.door_visible and self.door_sprite:
-                player_pos = pygame.math.Vector2(self.player.rect.center)
-                door_pos = pygame.math.Vector2(self.door_sprite.rect.center)
-                distance = player_pos.distance_to(door_pos)
-                
-                if distance < 100:
-                    self.door_prompt_visible = True
-                    keys = pygame.key.get_pressed()
-                    if keys[pygame.K_e]:
-                        self.playing = False
-                        return "completed"
-                else:
-                    self.door_prompt_visible = False
+            if self.door_prompt_visible and self.input_state.is_held('interact'):
+                self.playing = False
+                return "completed"
             
             return None
+
+    def resolve_collisions(self):
+        """Find the tick's collisions in one broadphase pass and apply them."""
+        self.enemy_contact = False
+        self.door_prompt_visible = False
+        self.collisions.update()
+        if self.enemy_contact:
+            self.player.collide_enemy()
+
+    def on_bullet_hit_enemy(self, bullet, enemy):
+        """A hit destroys the bullet and the enemy outright."""
+        bullet.kill()
+        enemy.kill()
+
+    def on_bullet_hit_block(self, bullet, block):
+        bullet.kill()
+
+    def on_player_touch_enemy(self, player, enemy):
+        # Damage is taken once per tick however many enemies touch the player
+        self.enemy_contact = True
+
+    def on_player_near_door(self, player, door):
+        distance = pygame.math.Vector2(player.rect.center).distance_to(door.rect.center)
+        if distance < DOOR_RANGE:
+            self.door_prompt_visible = True
                     
     # Update the draw method:
-    def draw(self):
-        """Draw game state with all elements including door and prompts."""
+    def draw(self, alpha=1.0):
+        """
+        Draw game state with all elements including door and prompts.
+
+        Args:
+            alpha (float): Fraction of a simulation tick since the last update,
+                used to interpolate sprite positions
+        """
     
         # Fill with background first
         if hasattr(self, 'background'):
@@ -784,18 +492,14 @@ class Game:
         else:
             self.screen.fill(BACKGROUND_COLOR)
         
-        # Draw all sprites
-        self.allsprites.draw(self.screen)
+        # Draw all sprites between their last two simulated positions
+        draw_interpolated(self.screen, self.allsprites, self.previous_positions, alpha)
         
         # Draw player spotlight
         self.player.draw(self.screen)  # This should follow allsprites for spotlight to be applied correctly
         
-        # Draw player UI elements
-        self.player.draw_stats(self.screen)
-        self.draw_timer()
-        
-        # Draw ammo system cooldown text
-        self.ammo_system.draw(self.screen)
+        # Draw player stats, timer and cooldown text
+        self.hud.draw(self.screen)
         
         # Draw door prompt if active
         if self.door_prompt_visible and self.door_visible:
@@ -804,28 +508,6 @@ class Game:
         # Draw tutorial if active
         if self.tutorial_system.active:
             self.tutorial_system.draw(self.screen)
-        
-        pygame.display.update()
-
-    def draw_timer(self):
-        """
-        Draw the cumulative game timer on screen.
-        Formats time as MM:SS if under an hour, or HH:MM:SS if over an hour.
-        """
-        total_seconds = int(self.elapsed_time)
-        if total_seconds < 3600:  # Less than an hour
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            time_str = f"{minutes:02d}:{seconds:02d}"
-        else:  # More than an hour
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
-        timer_text = self.font.render(f"Total Time: {time_str}", True, WHITE)
-        timer_rect = timer_text.get_rect(topright=(WIDTH - 20, 10))
-        self.screen.blit(timer_text, timer_rect)
 
     def pause_timer(self):
         """Pause the game timer and record pause start time."""
@@ -880,6 +562,7 @@ class Game:
                     enemy = Enemy(self, j, i)  # Create enemy at the 'E' position
                     self.enemies.add(enemy)
                     self.allsprites.add(enemy)
+                    self.spawn_service.place(enemy)
         
         print(f"Created {len(self.enemies)} enemies at marked positions")
 
@@ -891,26 +574,7 @@ class Game:
         Args:
             message (str): The message to display in the dialogue box.
         """
-        dialogue_box = pygame.Surface((600, 120))
-        dialogue_box.fill(WHITE)
-        dialogue_box_rect = dialogue_box.get_rect(center=(WIDTH/2, HEIGHT/2))
-
-        # Use slightly smaller font for potentially long messages
-        dialogue_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 20)
-        text = dialogue_font.render(message, True, BLACK)
-        text_rect = text.get_rect(center=(300, 60))  # Centered in the dialogue box
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    return
-
-            self.screen.blit(dialogue_box, dialogue_box_rect)
-            pygame.display.update()
-            self.clock.tick(FPS)
+        self.scenes.show(LevelCompleteScene(self, message))
 
 
 
@@ -928,18 +592,22 @@ class Game:
             # Record minigame start time
             minigame_start_time = time.time()
             
-            # Run the appropriate minigame
+            # Run the appropriate minigame with its own music
             result = None
-            if minigame_type == 'candle memory':
-                result = run_memory_game(self.screen, self.clock)
-            elif minigame_type == 'timezone':
-                result = run_timezone_game(self.screen, self.clock)
-            elif minigame_type == 'language':
-                result = run_language_matching_game()
-            elif minigame_type == 'continent':
-                result = run_continent_game(self.screen, self.clock)
-            elif minigame_type == 'boss':
-                result = run_boss_battle()
+            sound_manager.music.enter(minigame_type)
+            try:
+                if minigame_type == 'candle memory':
+                    result = run_memory_game(self.screen, self.clock)
+                elif minigame_type == 'timezone':
+                    result = run_timezone_game(self.screen, self.clock)
+                elif minigame_type == 'language':
+                    result = run_language_matching_game()
+                elif minigame_type == 'continent':
+                    result = run_continent_game(self.screen, self.clock)
+                elif minigame_type == 'boss':
+                    result = run_boss_battle()
+            finally:
+                sound_manager.music.leave(minigame_type)
             
             # Handle minigame completion
             if result == "completed":
@@ -987,22 +655,7 @@ class Game:
         try:
             # Reset game state including door
             self.new()
-            
-            while self.playing and self.running:
-                self.events()
-                if not self.paused:
-                    result = self.update()
-                    if result == "completed":
-                        return "completed"
-                self.draw()
-                self.clock.tick(FPS)
-
-                if self.player.health <= 0:
-                    return "died"
-            
-            if self.enemies_defeated:
-                return "completed"
-            return "quit"
+            return self.scenes.run(GameplayScene(self))
             
         except Exception as e:
             print(f"Error in main sequence: {e}")
@@ -1015,10 +668,9 @@ class Game:
             door_pos = pygame.math.Vector2(self.door_sprite.rect.center)
             distance = player_pos.distance_to(door_pos)
             
-            if distance < 100:
+            if distance < DOOR_RANGE:
                 self.door_prompt_visible = True
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_e]:
+                if self.input_state.is_held('interact'):
                     return True
             else:
                 self.door_prompt_visible = False
@@ -1044,45 +696,7 @@ class Game:
 
     def restart_level_prompt(self):
         """Display a prompt asking if the player wants to restart the level after dying."""
-        prompt_box = pygame.Surface((400, 150))
-        prompt_box.fill(WHITE)
-        prompt_box_rect = prompt_box.get_rect(center=(WIDTH/2, HEIGHT/2))
-
-        button_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 20)
-        text = self.font.render("You died! Restart level?", True, BLACK)
-        text_rect = text.get_rect(center=(200, 50))
-        prompt_box.blit(text, text_rect)
-
-        yes_button = pygame.Rect(50, 100, 100, 40)
-        no_button = pygame.Rect(250, 100, 100, 40)
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
-                    adjusted_pos = (mouse_pos[0] - prompt_box_rect.x, mouse_pos[1] - prompt_box_rect.y)
-                    if yes_button.collidepoint(adjusted_pos):
-                        sound_manager.play_sound('button_click')
-                        return True
-                    elif no_button.collidepoint(adjusted_pos):
-                        sound_manager.play_sound('button_click')
-                        return False
-
-            # Draw buttons
-            pygame.draw.rect(prompt_box, GREEN, yes_button)
-            pygame.draw.rect(prompt_box, RED, no_button)
-
-            yes_text = button_font.render("Yes", True, BLACK)
-            no_text = button_font.render("No", True, BLACK)
-
-            prompt_box.blit(yes_text, (85, 110))
-            prompt_box.blit(no_text, (285, 110))
-
-            self.screen.blit(prompt_box, prompt_box_rect)
-            pygame.display.update()
-            self.clock.tick(FPS)
+        return self.scenes.run(RestartPromptScene(self))
 
     def show_final_results(self, victory=False):
         """
@@ -1107,47 +721,11 @@ class Game:
             # Add to leaderboard if game was won
             rank = self.leaderboard_system.get_rank(final_time)
             if rank is not None:
-                show_new_highscore(self.screen, self.font, rank, final_time)
+                show_new_highscore(self.scenes, self.font, rank, final_time)
                 self.leaderboard_system.add_score(self.player_name, final_time)
         
-        # Show completion or game over text
-        if victory:
-            text = self.font.render('Congratulations! Game Complete!', True, (255, 215, 0))  # Golden color
-        else:
-            text = self.font.render('Game Over', True, RED)
-        text_rect = text.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
-        
-        # Show time text
-        time_text = self.font.render(f'Total Time: {time_str}', True, WHITE)
-        time_rect = time_text.get_rect(center=(WIDTH/2, HEIGHT/2))
-        
-        show_leaderboard = True
-        while show_leaderboard and self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    show_leaderboard = False
-            
-            self.screen.fill(BLACK)
-            self.screen.blit(text, text_rect)
-            self.screen.blit(time_text, time_rect)
-            
-            if game_completed:
-                # Show leaderboard for completed game
-                draw_leaderboard(self.screen, self.font, self.leaderboard_system)
-            else:
-                # Show appropriate message based on victory state
-                if victory:
-                    msg = self.font.render('Game completed! Press ENTER to continue', True, GREEN)
-                else:
-                    msg = self.font.render('Game over! Press ENTER to continue', True, RED)
-                msg_rect = msg.get_rect(center=(WIDTH/2, HEIGHT/2 + 50))
-                self.screen.blit(msg, msg_rect)
-            
-            pygame.display.update()
-            self.clock.tick(FPS)
+        if self.running:
+            self.scenes.show(FinalResultsScene(self, time_str, victory, game_completed))
 
     def show_message(self, message, duration=2.0):
         """
@@ -1157,37 +735,7 @@ class Game:
             message (str): Message to display
             duration (float): How long to show message in seconds
         """
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        
-        # Render message
-        font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 28)
-        text = font.render(message, True, WHITE)
-        text_rect = text.get_rect(center=(WIDTH/2, HEIGHT/2))
-        
-        # Calculate end time
-        end_time = time.time() + duration
-        
-        # Show message
-        while time.time() < end_time:
-            # Draw current game state
-            self.draw()
-            
-            # Draw message overlay
-            self.screen.blit(overlay, (0, 0))
-            self.screen.blit(text, text_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-            
-            # Check for early exit
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-                if event.type == pygame.KEYDOWN:
-                    return
+        self.scenes.show(MessageScene(self, message, duration))
                 
     def reset_game(self):
         """
@@ -0,0 +1,329 @@
+import threading
+import time
+import pygame
+from config_settings import MUSIC_TRACKS, MUSIC_CHUNK_MS, MUSIC_CROSSFADE_MS
+
+UPDATE_INTERVAL = 0.05  # Seconds between refilling channels and fade steps
+
+
+class MusicStream:
+    """
+    One track playing on one mixer channel, fed from the sound bank in chunks.
+
+    Only the chunk that is playing and the one queued behind it exist as
+    sounds, so memory stays the same however long the track is.
+
+    Attributes:
+        track (str): Filename of the track
+        key (str): The track's entry in the sound bank
+        channel (pygame.mixer.Channel): Channel the track plays on
+        position (int): Byte offset of the next chunk
+        level (float): Fade level from 0.0 to 1.0
+        fade_rate (float): Change in level per millisecond, negative to fade out
+    """
+
+    def __init__(self, bank, track, channel, chunk_bytes):
+        """
+        Args:
+            bank (SoundBank): Bank holding the track's samples
+            track (str): Filename of the track in assets/sounds/bgm
+            channel (pygame.mixer.Channel): Channel to play on
+            chunk_bytes (int): Size of each streamed chunk
+        """
+        self.bank = bank
+        self.track = track
+        self.key = f'bgm/{track}'
+        self.channel = channel
+        self.chunk_bytes = chunk_bytes
+        self.position = 0
+        self.level = 0.0
+        self.fade_rate = 0.0
+
+    def next_chunk(self):
+        """Build the next chunk, wrapping round to loop the track."""
+        if self.position >= self.bank.length(self.key):
+            self.position = 0
+        samples = self.bank.buffer(self.key, self.position, self.chunk_bytes)
+        self.position += len(samples)
+        return pygame.mixer.Sound(buffer=samples)
+
+    def start(self, prepared=None):
+        """
+        Start playing from the beginning of the track.
+
+        Args:
+            prepared (tuple): First chunk built ahead of time and its size in bytes
+        """
+        if prepared is not None:
+            first_chunk, self.position = prepared
+        else:
+            first_chunk = self.next_chunk()
+        self.channel.play(first_chunk)
+        self.feed()
+
+    def feed(self):
+        """Queue the next chunk once the channel has room for it."""
+        if not self.channel.get_busy():
+            # Fell behind, pick up again from where the track had got to
+            self.channel.play(self.next_chunk())
+        if self.channel.get_queue() is None:
+            self.channel.queue(self.next_chunk())
+
+    def fade(self, dt):
+        """
+        Move the fade level along.
+
+        Args:
+            dt (float): Milliseconds since the last update
+
+        Returns:
+            bool: Whether the stream has faded out completely
+        """
+        self.level = max(0.0, min(1.0, self.level + self.fade_rate * dt))
+        return self.fade_rate < 0 and self.level <= 0.0
+
+    def stop(self):
+        """Stop the channel and drop any queued chunk."""
+        self.channel.stop()
+
+
+class MusicManager:
+    """
+    Plays a music track for whatever the player is doing and crossfades between them.
+
+    Callers only state which track or game mode they want. The switching,
+    refilling and fading all happen on a background thread, so nothing here
+    waits on the main loop. Tracks are streamed chunk by chunk from the
+    sound bank on two reserved channels so one can fade out while the next
+    fades in. Tracks missing from the bank are played with pygame's own
+    music stream instead, fading out before the next one fades in.
+
+    Modes are kept on a stack: entering dialogue during the main game and
+    leaving it again returns to the main game's track.
+
+    Attributes:
+        sound_manager (SoundManager): Owner of the mixer, channels and bank
+        modes (list): Game modes entered, the last one chooses the track
+        track (str): Track that should be playing, None for silence
+        volume (float): Music volume from 0.0 to 1.0
+        paused (bool): Whether the music is paused
+        streams (list): Streams playing, the last one is the current track
+        fallback_track (str): Track playing on pygame's music stream, if any
+    """
+
+    def __init__(self, sound_manager):
+        """
+        Args:
+            sound_manager (SoundManager): Owner of the mixer, channels and bank
+        """
+        self.sound_manager = sound_manager
+        self.modes = []
+        self.track = None
+        self.volume = 0.3
+        self.paused = False
+        self.lock = threading.Lock()
+        self.started = False
+
+        self.streams = []
+        self.fallback_track = None
+        self.fallback_wait = 0  # Milliseconds until the next fallback track starts
+        self.prepare_request = None
+        self.prepared = {}
+        self.paused_channels = False
+
+    def start(self):
+        """Start streaming on a background thread, the mixer must be ready."""
+        if self.started:
+            return
+        self.started = True
+        worker = threading.Thread(target=self._run, name='MusicManager', daemon=True)
+        worker.start()
+
+    def track_for(self, mode):
+        """Get the track for a game mode, the main game's track if it has none."""
+        return MUSIC_TRACKS.get(mode, MUSIC_TRACKS['main'])
+
+    def play(self, track):
+        """
+        Crossfade to a track, or keep playing it if it already is.
+
+        Args:
+            track (str): Filename in assets/sounds/bgm, None to fade out
+        """
+        with self.lock:
+            self.track = track
+
+    def stop(self):
+        """Fade the music out."""
+        self.play(None)
+
+    def enter(self, mode):
+        """
+        Switch to the track of a game mode until it is left again.
+
+        Args:
+            mode (str): Key of MUSIC_TRACKS, e.g. 'dialogue' or 'boss'
+        """
+        self.modes.append(mode)
+        self.play(self.track_for(mode))
+
+    def leave(self, mode):
+        """
+        Return to the track of the mode that was active before.
+
+        Args:
+            mode (str): Mode passed to enter()
+        """
+        if mode in self.modes:
+            # Remove the most recent entry of this mode
+            del self.modes[len(self.modes) - 1 - self.modes[::-1].index(mode)]
+        self.play(self.track_for(self.modes[-1]) if self.modes else None)
+
+    def prepare(self, mode):
+        """
+        Read the start of a mode's track ahead of time so switching to it is instant.
+
+        Args:
+            mode (str): Key of MUSIC_TRACKS
+        """
+        with self.lock:
+            self.prepare_request = self.track_for(mode)
+
+    def set_volume(self, volume):
+        """
+        Set the music volume.
+
+        Args:
+            volume (float): Volume level between 0.0 and 1.0
+        """
+        self.volume = volume
+
+    def pause(self):
+        """Pause the music."""
+        self.paused = True
+
+    def unpause(self):
+        """Resume the paused music."""
+        self.paused = False
+
+    def _run(self):
+        """Refill and fade the music at a steady rate."""
+        last = time.perf_counter()
+        while True:
+            time.sleep(UPDATE_INTERVAL)
+            now = time.perf_counter()
+            try:
+                self.update((now - last) * 1000)
+            except pygame.error as e:
+                print(f"Error streaming music: {e}")
+            last = now
+
+    def chunk_bytes(self):
+        """Size of one chunk in the mixer's output format."""
+        frequency, size, channels = pygame.mixer.get_init()
+        frame = abs(size) // 8 * channels
+        return frequency * MUSIC_CHUNK_MS // 1000 * frame
+
+    def update(self, dt):
+        """
+        Switch, refill and fade the music.
+
+        Args:
+            dt (float): Milliseconds since the last update
+        """
+        with self.lock:
+            track = self.track
+            prepare = self.prepare_request
+            self.prepare_request = None
+
+        if self.paused != self.paused_channels:
+            self._set_paused(self.paused)
+        if self.paused:
+            return
+
+        current = self.streams[-1].track if self.streams else self.fallback_track
+        if track != current and self.streams[-1:] and self.streams[-1].fade_rate < 0:
+            current = None  # Already fading out towards silence
+        if track != current:
+            self._switch(track)
+        if prepare is not None:
+            self._prepare(prepare)
+
+        for stream in self.streams[:]:
+            if stream.fade(dt):
+                stream.stop()
+                self.streams.remove(stream)
+                continue
+            stream.channel.set_volume(self.volume * stream.level)
+            stream.feed()
+
+        if self.fallback_wait > 0:
+            self.fallback_wait -= dt
+            if self.fallback_wait <= 0 and self.fallback_track:
+                self._play_fallback(self.fallback_track)
+        pygame.mixer.music.set_volume(self.volume)
+
+    def _switch(self, track):
+        """Start fading from the current track to another one."""
+        fade_rate = 1.0 / MUSIC_CROSSFADE_MS
+        for stream in self.streams:
+            stream.fade_rate = -fade_rate
+        # A third track during a crossfade cuts off the oldest one
+        while len(self.streams) > 1:
+            self.streams.pop(0).stop()
+
+        if self.fallback_track:
+            pygame.mixer.music.fadeout(MUSIC_CROSSFADE_MS)
+            self.fallback_track = None
+            self.fallback_wait = 0
+        if track is None:
+            return
+
+        bank = self.sound_manager.bank
+        if bank.length(f'bgm/{track}'):
+            in_use = {stream.channel for stream in self.streams}
+            channel = next(c for c in self.sound_manager.channel_pools['music'] if c not in in_use)
+            stream = MusicStream(bank, track, channel, self.chunk_bytes())
+            stream.fade_rate = fade_rate
+            channel.set_volume(0.0)
+            stream.start(self.prepared.pop(track, None))
+            self.streams.append(stream)
+        else:
+            # Not in the bank, pygame's music stream can only play one track at a time
+            self.fallback_track = track
+            self.fallback_wait = MUSIC_CROSSFADE_MS if pygame.mixer.music.get_busy() else 0
+            if not self.fallback_wait:
+                self._play_fallback(track)
+
+    def _play_fallback(self, track):
+        """Load and fade in a track on pygame's music stream."""
+        try:
+            pygame.mixer.music.load(self.sound_manager.get_sound_path('bgm', track))
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(-1, fade_ms=MUSIC_CROSSFADE_MS)
+            print(f"Successfully loaded music: {track}")
+        except pygame.error as e:
+            print(f"Error loading music {track}: {e}")
+        self.fallback_wait = 0
+
+    def _prepare(self, track):
+        """Build the first chunk of a banked track, keeping only the latest one."""
+        bank = self.sound_manager.bank
+        key = f'bgm/{track}'
+        if track in self.prepared or not bank.length(key):
+            return
+        samples = bank.buffer(key, 0, self.chunk_bytes())
+        self.prepared = {track: (pygame.mixer.Sound(buffer=samples), len(samples))}
+
+    def _set_paused(self, paused):
+        """Pause or resume every music channel and the fallback stream."""
+        for stream in self.streams:
+            if paused:
+                stream.channel.pause()
+            else:
+                stream.channel.unpause()
+        if paused:
+            pygame.mixer.music.pause()
+        else:
+            pygame.mixer.music.unpause()
+        self.paused_channels = paused
@@ -91,8 +91,6 @@ class Player(pygame.sprite.Sprite):
         # Only animate if the player is moving
         if self.x_change != 0 or self.y_change != 0:
             self.animate()  # Update player animation
-        
-        self.collide_enemy()  # Check for collisions with enemies
 
         # Apply movement
         self.rect.x += self.x_change
@@ -138,28 +136,28 @@ class Player(pygame.sprite.Sprite):
 
     def movement(self):
         """
-        Handle player movement based on keyboard input.
+        Handle player movement based on the game's input snapshot.
         """
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_a]:
+        keys = self.game.input_state
+        if keys.is_held('move_left'):
             #camera movement 
             for sprite in self.game.allsprites:
                 sprite.rect.x += PLAYER_SPEED
             self.x_change -= PLAYER_SPEED
             self.facing = 'left'
-        if keys[pygame.K_d]:
+        if keys.is_held('move_right'):
             #camera movement 
             for sprite in self.game.allsprites:
                 sprite.rect.x -= PLAYER_SPEED        
             self.x_change += PLAYER_SPEED
             self.facing = 'right'
-        if keys[pygame.K_w]:
+        if keys.is_held('move_up'):
             #camera movement 
             for sprite in self.game.allsprites:
                 sprite.rect.y += PLAYER_SPEED
             self.y_change -= PLAYER_SPEED
             self.facing = 'up'
-        if keys[pygame.K_s]:
+        if keys.is_held('move_down'):
             #camera movement 
             for sprite in self.game.allsprites:
                 sprite.rect.y -= PLAYER_SPEED
@@ -219,13 +217,11 @@ class Player(pygame.sprite.Sprite):
 
     def collide_enemy(self):
         """
-        Handle collisions with enemy sprites.
+        Take damage for touching enemies this tick, however many there are.
         """
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
-        if hits:
-            self.health -= 1
-            if self.health <= 0:
-                self.kill()
+        self.health -= 1
+        if self.health <= 0:
+            self.kill()
 
     def shoot(self, target_pos):
         """Modified shoot method to use ammo system with cooldown."""
@@ -250,77 +246,3 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(surface, RED, (10, 10, 200, 20))
         pygame.draw.rect(surface, GREEN, (10, 10, 200 * health_ratio, 20))
 
-
-    def draw_stats(self, screen):
-        """Draw player stats including health bar, and ammo counter."""
-        # Constants for positioning and sizing
-        BAR_WIDTH = 200
-        BAR_HEIGHT = 20
-        MARGIN = 10
-        LEFT_OFFSET = 10
-        TOP_OFFSET = 10
-        
-        # Create smaller font for stats
-        small_font = pygame.font.Font('LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf', 14)
-        
-        # Health Bar
-        health_y = TOP_OFFSET
-        health_outline = pygame.Rect(LEFT_OFFSET, health_y, BAR_WIDTH, BAR_HEIGHT)
-        health_fill = pygame.Rect(LEFT_OFFSET, health_y, BAR_WIDTH * (self.health / self.max_health), BAR_HEIGHT)
-        
-        # Draw health bar background and fill
-        pygame.draw.rect(screen, (100, 0, 0), health_outline)  # Dark red background
-        pygame.draw.rect(screen, RED, health_fill)  # Health fill
-        pygame.draw.rect(screen, WHITE, health_outline, 2)  # White border
-        
-        # Draw player name on left side of health bar
-        name_text = small_font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect(midleft=(LEFT_OFFSET + 5, health_y + BAR_HEIGHT//2))
-        screen.blit(name_text, name_rect)
-        
-        # Draw HP counter next to health bar
-        hp_text = small_font.render(f"{self.health}/{self.max_health}", True, WHITE)
-        hp_rect = hp_text.get_rect(midleft=(LEFT_OFFSET + BAR_WIDTH + 5, health_y + BAR_HEIGHT//2))
-        screen.blit(hp_text, hp_rect)
-        
-        # Ammo Display
-        ammo_y = BAR_HEIGHT + MARGIN
-        mag_width = BAR_WIDTH
-        mag_height = BAR_HEIGHT
-        
-        # Magazine background
-        mag_rect = pygame.Rect(LEFT_OFFSET, ammo_y, mag_width, mag_height)
-        pygame.draw.rect(screen, (40, 40, 40), mag_rect)  # Darker background
-        pygame.draw.rect(screen, (70, 70, 70), mag_rect, 2)  # Border
-        
-        # Calculate bullet dimensions
-        bullet_width = (mag_width - 20) // self.ammo_system.magazine_size
-        bullet_margin = 2
-        bullet_height = mag_height - 6
-        
-        # Draw ammo slots
-        for i in range(self.ammo_system.magazine_size):
-            bullet_x = LEFT_OFFSET + 10 + (bullet_width + bullet_margin) * i
-            bullet_y = ammo_y + 3
-            bullet_rect = pygame.Rect(bullet_x, bullet_y, bullet_width, bullet_height)
-            
-            # Color each bullet slot
-            if i < self.ammo_system.current_ammo:
-                color = (255, 165, 0)  # Bright orange for loaded bullets
-            else:
-                color = (80, 80, 80)  # Darker gray for empty slots
-            
-            pygame.draw.rect(screen, color, bullet_rect)
-            
-            # Draw separator after each bullet except the last one
-            if i < self.ammo_system.magazine_size - 1:
-                separator_x = bullet_x + bullet_width + bullet_margin//2
-                pygame.draw.line(screen, (70, 70, 70),
-                            (separator_x, ammo_y + 3),
-                            (separator_x, ammo_y + mag_height - 3))
-        
-        # Attack Power
-        attack_y = ammo_y + mag_height + MARGIN
-        attack_text = small_font.render(f"ATK: {self.attack_power}", True, WHITE)
-        attack_rect = attack_text.get_rect(topleft=(LEFT_OFFSET, attack_y))
-        screen.blit(attack_text, attack_rect)
@@ -0,0 +1,374 @@
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+
+QUESTION_PATH = os.path.join('LEGEND OF ZAHIR', 'assets', 'questions', 'timezones.json')
+QUESTIONS_PER_TIER = 200
+CHOICES = 4
+MINUTES = [0, 15, 30, 45]
+
+# Standard UTC offset in minutes and daylight saving rule of each zone
+ZONES = {
+    'New York': (-300, 'us'),
+    'London': (0, 'eu'),
+    'Paris': (60, 'eu'),
+    'Dubai': (240, None),
+    'Tokyo': (540, None),
+    'Sydney': (600, 'au'),
+    'Los Angeles': (-480, 'us'),
+    'Singapore': (480, None),
+    'Mumbai': (330, None),
+    'Adelaide': (570, 'au'),
+    'St. John\'s': (-210, 'us'),
+    'Kathmandu': (345, None),
+}
+
+# Zones, dates and wrong answers used by each difficulty tier. Wrong answers
+# are the correct time moved by one of the tier's offsets in minutes.
+TIERS = {
+    # Whole hour zones with no summer time, like the original quiz
+    'easy': {
+        'zones': ['New York', 'London', 'Paris', 'Dubai', 'Tokyo', 'Sydney', 'Los Angeles', 'Singapore'],
+        'dates': False,
+        'distractors': [-120, -60, 60, 120],
+    },
+    # The same zones on a given date, so summer time has to be accounted for
+    'medium': {
+        'zones': ['New York', 'London', 'Paris', 'Dubai', 'Tokyo', 'Sydney', 'Los Angeles', 'Singapore'],
+        'dates': True,
+        'distractors': [-120, -60, 60, 120],
+    },
+    # Every zone, including half and quarter hour offsets
+    'hard': {
+        'zones': list(ZONES),
+        'dates': True,
+        'distractors': [-60, -30, -15, 15, 30, 60],
+    },
+}
+
+
+def nth_sunday(year, month, n):
+    """Get the nth Sunday of a month."""
+    first = datetime.date(year, month, 1)
+    return first + datetime.timedelta(days=(6 - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def last_sunday(year, month):
+    """Get the last Sunday of a month."""
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() + 1) % 7)
+
+
+def summer_time(rule, date):
+    """
+    Check whether a daylight saving rule is in effect on a date.
+
+    Changes are taken to happen at the start of the day, which is all the
+    quiz needs.
+
+    Args:
+        rule (str): 'us', 'eu', 'au' or None
+        date (datetime.date): Day to check
+
+    Returns:
+        bool: Whether clocks are one hour ahead of standard time
+    """
+    year = date.year
+    if rule == 'us':
+        return nth_sunday(year, 3, 2) <= date < nth_sunday(year, 11, 1)
+    if rule == 'eu':
+        return last_sunday(year, 3) <= date < last_sunday(year, 10)
+    if rule == 'au':
+        # Southern hemisphere, summer time runs over the new year
+        return not nth_sunday(year, 4, 1) <= date < nth_sunday(year, 10, 1)
+    return False
+
+
+def utc_offset(zone, date=None):
+    """
+    Get a zone's UTC offset.
+
+    Args:
+        zone (str): Key of ZONES
+        date (datetime.date): Day to check summer time for, None for standard time
+
+    Returns:
+        int: Offset in minutes
+    """
+    offset, rule = ZONES[zone]
+    if date is not None and summer_time(rule, date):
+        offset += 60
+    return offset
+
+
+def format_time(minutes):
+    """Format minutes after midnight as HH:MM, wrapping round the day."""
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def format_difference(minutes):
+    """Describe a number of minutes as hours and minutes."""
+    hours, rest = divmod(abs(minutes), 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if rest:
+        parts.append(f"{rest} minutes")
+    return ' '.join(parts)
+
+
+class Question:
+    """
+    One time conversion with its answer choices.
+
+    Attributes:
+        source (str): Zone the time is given in
+        target (str): Zone to convert to
+        date (datetime.date): Day of the conversion, None for standard time
+        source_time (int): Given time in minutes after midnight
+        answer (str): Correct time in the target zone as HH:MM
+        choices (list): Answer buttons in display order, including the answer
+        tier (str): Difficulty tier the question belongs to
+    """
+
+    def __init__(self, source, target, date, source_time, answer, choices, tier):
+        self.source = source
+        self.target = target
+        self.date = date
+        self.source_time = source_time
+        self.answer = answer
+        self.choices = choices
+        self.tier = tier
+
+    @property
+    def difference(self):
+        """Minutes the target zone is ahead of the source zone."""
+        return utc_offset(self.target, self.date) - utc_offset(self.source, self.date)
+
+    @property
+    def prompt(self):
+        """The question as shown to the player."""
+        if self.date is None:
+            return f"Convert time from {self.source} to {self.target}"
+        return f"Convert time from {self.source} to {self.target} on {self.date.day} {self.date:%B}"
+
+    @property
+    def time_text(self):
+        """The given time as HH:MM."""
+        return format_time(self.source_time)
+
+    @property
+    def hint(self):
+        """How to work the answer out."""
+        diff = self.difference
+        given = f"{self.source_time // 60:02d}:00"
+        summer = [zone for zone in (self.source, self.target)
+                  if self.date is not None and summer_time(ZONES[zone][1], self.date)]
+        note = f" ({' and '.join(summer)} on summer time)" if summer else ""
+        if diff > 0:
+            return f"Hint: Add {format_difference(diff)} to {given}{note}"
+        elif diff < 0:
+            return f"Hint: Subtract {format_difference(diff)} from {given}{note}"
+        else:
+            return f"Hint: Time is the same in both zones{note}"
+
+    def to_dict(self):
+        return {
+            'source': self.source,
+            'target': self.target,
+            'date': self.date.isoformat() if self.date else None,
+            'source_time': self.source_time,
+            'answer': self.answer,
+            'choices': self.choices,
+            'tier': self.tier,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        date = datetime.date.fromisoformat(data['date']) if data['date'] else None
+        return cls(data['source'], data['target'], date, data['source_time'],
+                   data['answer'], list(data['choices']), data['tier'])
+
+
+def validate(question):
+    """
+    Check a question for mistakes, e.g. in a hand-edited bank file.
+
+    Args:
+        question (Question): Question to check
+
+    Returns:
+        list: Descriptions of the problems found, empty if it is valid
+    """
+    problems = []
+    if question.source not in ZONES or question.target not in ZONES:
+        return ["unknown zone"]
+    if question.source == question.target:
+        problems.append("source and target are the same zone")
+    if not 0 <= question.source_time < 24 * 60:
+        problems.append("given time is outside the day")
+    expected = format_time(question.source_time + question.difference)
+    if question.answer != expected:
+        problems.append(f"answer is {question.answer}, should be {expected}")
+    if question.answer not in question.choices:
+        problems.append("answer is not one of the choices")
+    if len(set(question.choices)) != len(question.choices) or len(question.choices) != CHOICES:
+        problems.append(f"needs {CHOICES} different choices")
+    return problems
+
+
+def generate(tier, count, rng=random, year=None):
+    """
+    Generate distinct, validated questions for a tier.
+
+    Args:
+        tier (str): Key of TIERS
+        count (int): Number of questions
+        rng (random.Random): Random number source
+        year (int): Year the dates fall in, the current year if None
+
+    Returns:
+        list: The questions in random order
+    """
+    settings = TIERS[tier]
+    zones = settings['zones']
+    year = year or datetime.date.today().year
+    days = (datetime.date(year + 1, 1, 1) - datetime.date(year, 1, 1)).days
+
+    questions = []
+    seen = set()
+    attempts = 0
+    while len(questions) < count and attempts < count * 20:
+        attempts += 1
+        source, target = rng.sample(zones, 2)
+        date = None
+        if settings['dates']:
+            date = datetime.date(year, 1, 1) + datetime.timedelta(days=rng.randrange(days))
+        source_time = rng.randint(0, 23) * 60 + rng.choice(MINUTES)
+        key = (source, target, date, source_time)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        correct = source_time + utc_offset(target, date) - utc_offset(source, date)
+        answer = format_time(correct)
+        wrong = rng.sample(settings['distractors'], CHOICES - 1)
+        choices = [format_time(correct + offset) for offset in wrong] + [answer]
+        rng.shuffle(choices)
+        question = Question(source, target, date, source_time, answer, choices, tier)
+        if not validate(question):
+            questions.append(question)
+    return questions
+
+
+def build_bank(path=QUESTION_PATH, count=QUESTIONS_PER_TIER, seed=None):
+    """
+    Generate questions for every tier and save them as a compiled bank.
+
+    Args:
+        path (str): File to write
+        count (int): Questions per tier
+        seed (int): Seed for the generator, random if None
+
+    Returns:
+        dict: Number of questions written for each tier
+    """
+    rng = random.Random(seed)
+    bank = {tier: [q.to_dict() for q in generate(tier, count, rng)] for tier in TIERS}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(bank, f, indent=1)
+    os.replace(path + '.tmp', path)
+    return {tier: len(questions) for tier, questions in bank.items()}
+
+
+def load_questions(tier, path=QUESTION_PATH):
+    """
+    Load a tier's questions from a compiled bank, dropping any invalid ones.
+
+    Args:
+        tier (str): Key of TIERS
+        path (str): Compiled bank file
+
+    Returns:
+        list: The valid questions, empty if the file or tier is missing
+    """
+    try:
+        with open(path) as f:
+            entries = json.load(f).get(tier, [])
+    except (OSError, ValueError) as e:
+        if os.path.exists(path):
+            print(f"Error loading question bank {path}: {e}")
+        return []
+
+    questions = []
+    for entry in entries:
+        try:
+            question = Question.from_dict(entry)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Skipping malformed question {entry}: {e}")
+            continue
+        problems = validate(question)
+        if problems:
+            print(f"Skipping question {question.prompt}: {', '.join(problems)}")
+            continue
+        questions.append(question)
+    return questions
+
+
+class QuestionBank:
+    """
+    Deals a tier's questions in random order without repeats.
+
+    Questions come from the compiled bank file when there is one and are
+    generated in memory otherwise. The whole deck is shuffled again once
+    every question has been asked.
+
+    Attributes:
+        tier (str): Difficulty tier being dealt
+        questions (list): Every question of the tier
+        deck (list): Questions left to deal, the next one last
+    """
+
+    def __init__(self, tier='easy', path=QUESTION_PATH, rng=random):
+        """
+        Args:
+            tier (str): Key of TIERS
+            path (str): Compiled bank file to load from if it exists
+            rng (random.Random): Random number source for shuffling and generating
+        """
+        self.tier = tier
+        self.rng = rng
+        self.questions = load_questions(tier, path) or generate(tier, QUESTIONS_PER_TIER, rng)
+        self.deck = []
+
+    def __len__(self):
+        return len(self.questions)
+
+    def peek(self):
+        """Get the question the next call to next() returns."""
+        if not self.deck:
+            self.deck = self.questions[:]
+            self.rng.shuffle(self.deck)
+        return self.deck[-1]
+
+    def next(self):
+        """Deal the next question."""
+        self.peek()
+        return self.deck.pop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the timezone question bank.")
+    parser.add_argument('--count', type=int, default=QUESTIONS_PER_TIER, help="questions per tier")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--path', default=QUESTION_PATH)
+    args = parser.parse_args()
+    counts = build_bank(args.path, args.count, args.seed)
+    print(f"Wrote {', '.join(f'{n} {tier}' for tier, n in counts.items())} questions to {args.path}")
+    sys.exit(0)
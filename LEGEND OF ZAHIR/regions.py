@@ -0,0 +1,196 @@
+import json
+import os
+import numpy
+import pygame
+from soundbank import source_stamp
+
+NO_REGION = 0  # Mask value of pixels outside every region
+
+
+class Region:
+    """
+    One named area of a map, made of one or more polygons.
+
+    Attributes:
+        id (int): Value of the region's pixels in the hit mask, from 1
+        name (str): Name of the region
+        polygons (list): Point lists relative to the map's top left corner
+        rect (pygame.Rect): Bounding box relative to the map's top left corner
+        highlight (pygame.Surface): Pre-rendered highlight covering rect
+    """
+
+    def __init__(self, region_id, name, polygons):
+        self.id = region_id
+        self.name = name
+        self.polygons = polygons
+        xs = [x for polygon in polygons for x, _ in polygon]
+        ys = [y for polygon in polygons for _, y in polygon]
+        # Polygons are drawn up to and including their last pixel
+        self.rect = pygame.Rect(int(min(xs)), int(min(ys)),
+                                int(max(xs)) - int(min(xs)) + 1, int(max(ys)) - int(min(ys)) + 1)
+        self.highlight = None
+
+
+class RegionMap:
+    """
+    Polygon regions of a map with a hit mask holding a region id per pixel.
+
+    The polygons are rasterized once into the mask, so finding the region
+    under a point is a single array lookup however many regions there are.
+    The mask is cached on disk next to the region file and made again when
+    the file or the map size changes. Highlights are rendered once per
+    region and cropped to its bounding box, so drawing one is a single blit.
+
+    Region files are JSON with the map size the points were drawn for and
+    a list of regions, each with a name and a list of polygons. Where
+    regions overlap the one listed later wins.
+
+    Attributes:
+        path (str): The region file
+        rect (pygame.Rect): Where the map is drawn on screen
+        regions (list): The regions in file order
+        by_name (dict): The regions by name
+        mask (numpy.ndarray): Region id of every map pixel, indexed [x, y]
+    """
+
+    def __init__(self, path, rect, highlight_color=(255, 255, 0), highlight_alpha=120):
+        """
+        Args:
+            path (str): Region file to load
+            rect (pygame.Rect): Where the map is drawn, points are scaled to its size
+            highlight_color (tuple): RGB colour of the highlights
+            highlight_alpha (int): Opacity of the highlights from 0 to 255
+        """
+        self.path = path
+        self.rect = pygame.Rect(rect)
+        with open(path) as f:
+            data = json.load(f)
+
+        width, height = data['size']
+        scale_x = self.rect.width / width
+        scale_y = self.rect.height / height
+        self.regions = []
+        self.by_name = {}
+        for region_id, entry in enumerate(data['regions'], start=1):
+            polygons = [[(x * scale_x, y * scale_y) for x, y in polygon]
+                        for polygon in entry['polygons']]
+            region = Region(region_id, entry['name'], polygons)
+            self.regions.append(region)
+            self.by_name[region.name] = region
+
+        self.mask = self.load_mask()
+        self.render_highlights(highlight_color, highlight_alpha)
+
+    def __len__(self):
+        return len(self.regions)
+
+    def mask_path(self):
+        """Cache file of the mask for the current map size."""
+        base = os.path.splitext(self.path)[0]
+        return f"{base}.{self.rect.width}x{self.rect.height}.mask.npz"
+
+    def rasterize(self):
+        """
+        Draw every region's id into a mask.
+
+        Returns:
+            numpy.ndarray: Region id of every map pixel, indexed [x, y]
+        """
+        surface = pygame.Surface(self.rect.size)
+        surface.fill((0, 0, 0))
+        for region in self.regions:
+            # The id is spread over the red and green channels
+            color = (region.id & 0xFF, region.id >> 8, 0)
+            for polygon in region.polygons:
+                pygame.draw.polygon(surface, color, polygon)
+        pixels = pygame.surfarray.array3d(surface).astype(numpy.uint16)
+        return pixels[..., 0] | (pixels[..., 1] << 8)
+
+    def load_mask(self):
+        """
+        Get the mask from the disk cache, making and saving it when it is stale.
+
+        Returns:
+            numpy.ndarray: Region id of every map pixel, indexed [x, y]
+        """
+        stamp = numpy.array(source_stamp(self.path) + tuple(self.rect.size), dtype=numpy.int64)
+        mask_path = self.mask_path()
+        try:
+            with numpy.load(mask_path) as cached:
+                if numpy.array_equal(cached['stamp'], stamp):
+                    return cached['mask']
+        except (OSError, KeyError, ValueError):
+            pass
+
+        mask = self.rasterize()
+        try:
+            with open(mask_path + '.tmp', 'wb') as f:
+                numpy.savez(f, mask=mask, stamp=stamp)
+            os.replace(mask_path + '.tmp', mask_path)
+        except OSError as e:
+            print(f"Could not cache region mask {mask_path}: {e}")
+        return mask
+
+    def render_highlights(self, color, alpha):
+        """
+        Render every region's highlight from its part of the mask.
+
+        Args:
+            color (tuple): RGB colour of the highlights
+            alpha (int): Opacity of the highlights from 0 to 255
+        """
+        bounds = pygame.Rect((0, 0), self.rect.size)
+        for region in self.regions:
+            region.rect = region.rect.clip(bounds)
+            if not region.rect.width or not region.rect.height:
+                region.highlight = None
+                continue
+            r = region.rect
+            inside = self.mask[r.left:r.right, r.top:r.bottom] == region.id
+            highlight = pygame.Surface(r.size, pygame.SRCALPHA)
+            highlight.fill((*color, 0))
+            pixels = pygame.surfarray.pixels_alpha(highlight)
+            pixels[:] = inside * numpy.uint8(alpha)
+            del pixels  # Unlock the surface
+            region.highlight = highlight
+
+    def id_at(self, pos):
+        """
+        Get the id of the region under a screen position.
+
+        Args:
+            pos (tuple): Screen position
+
+        Returns:
+            int: Region id, NO_REGION outside every region and off the map
+        """
+        x = int(pos[0]) - self.rect.x
+        y = int(pos[1]) - self.rect.y
+        if 0 <= x < self.rect.width and 0 <= y < self.rect.height:
+            return int(self.mask[x, y])
+        return NO_REGION
+
+    def region_at(self, pos):
+        """
+        Get the name of the region under a screen position.
+
+        Args:
+            pos (tuple): Screen position
+
+        Returns:
+            str: Region name, None outside every region and off the map
+        """
+        region_id = self.id_at(pos)
+        return self.regions[region_id - 1].name if region_id != NO_REGION else None
+
+    def draw_highlight(self, surface, name):
+        """
+        Draw a region's pre-rendered highlight.
+
+        Args:
+            surface (pygame.Surface): Surface the map is drawn on
+            name (str): Region to highlight
+        """
+        region = self.by_name[name]
+        if region.highlight is not None:
+            surface.blit(region.highlight, region.rect.move(self.rect.topleft))
@@ -0,0 +1,484 @@
+import abc
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+import pygame
+from inputmanager import input_manager
+
+# File layout: a header, then one record per clock tick ('T') and per input
+# poll ('P') in the order the game made them, then an end record ('E')
+MAGIC = b'LOZR'
+VERSION = 1
+HEADER = struct.Struct('<4sBQd')  # magic, version, RNG seed, wall clock start
+TICK = struct.Struct('<HI')  # milliseconds returned by the tick, frame time
+POLL = struct.Struct('<HI')  # number of events, game state checksum
+END = struct.Struct('<IIHBI')  # polls, final frame time, sequence index, running, state checksum
+
+# Event encodings, keyed by a one byte kind
+EVENT_QUIT = 0
+EVENT_KEYDOWN = 1
+EVENT_KEYUP = 2
+EVENT_MOTION = 3
+EVENT_BUTTONDOWN = 4
+EVENT_BUTTONUP = 5
+EVENT_FOCUSLOST = 6
+EVENT_USER = 7
+
+KEYDOWN = struct.Struct('<iHB')  # key, mod, length of the utf-8 text that follows
+KEYUP = struct.Struct('<iH')  # key, mod
+MOTION = struct.Struct('<hhhh')  # pos, rel
+BUTTON = struct.Struct('<hhB')  # pos, button
+USER = struct.Struct('<I')  # event type
+
+
+def encode_events(events):
+    """
+    Pack the events the game reacts to into bytes.
+
+    Window and other system events are left out, since nothing in the game
+    reads them.
+
+    Args:
+        events (list): Events for one frame
+
+    Returns:
+        tuple: (number of events kept, packed bytes)
+    """
+    parts = []
+    count = 0
+    for event in events:
+        if event.type == pygame.QUIT:
+            parts.append(bytes((EVENT_QUIT,)))
+        elif event.type == pygame.KEYDOWN:
+            text = getattr(event, 'unicode', '').encode('utf-8')[:255]
+            parts.append(bytes((EVENT_KEYDOWN,)) + KEYDOWN.pack(event.key, getattr(event, 'mod', 0), len(text)) + text)
+        elif event.type == pygame.KEYUP:
+            parts.append(bytes((EVENT_KEYUP,)) + KEYUP.pack(event.key, getattr(event, 'mod', 0)))
+        elif event.type == pygame.MOUSEMOTION:
+            parts.append(bytes((EVENT_MOTION,)) + MOTION.pack(*event.pos, *getattr(event, 'rel', (0, 0))))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            parts.append(bytes((EVENT_BUTTONDOWN,)) + BUTTON.pack(*event.pos, event.button))
+        elif event.type == pygame.MOUSEBUTTONUP:
+            parts.append(bytes((EVENT_BUTTONUP,)) + BUTTON.pack(*event.pos, event.button))
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            parts.append(bytes((EVENT_FOCUSLOST,)))
+        elif pygame.USEREVENT <= event.type < pygame.NUMEVENTS:
+            parts.append(bytes((EVENT_USER,)) + USER.pack(event.type))
+        else:
+            continue
+        count += 1
+    return count, b''.join(parts)
+
+
+def decode_events(data, offset, count):
+    """
+    Unpack events written by encode_events.
+
+    Args:
+        data (bytes): Recording contents
+        offset (int): Position of the first event
+        count (int): Number of events to read
+
+    Returns:
+        tuple: (list of pygame events, offset after the last event)
+    """
+    events = []
+    for _ in range(count):
+        kind = data[offset]
+        offset += 1
+        if kind == EVENT_QUIT:
+            events.append(pygame.event.Event(pygame.QUIT))
+        elif kind == EVENT_KEYDOWN:
+            key, mod, length = KEYDOWN.unpack_from(data, offset)
+            offset += KEYDOWN.size
+            text = data[offset:offset + length].decode('utf-8', 'replace')
+            offset += length
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode=text, scancode=0))
+        elif kind == EVENT_KEYUP:
+            key, mod = KEYUP.unpack_from(data, offset)
+            offset += KEYUP.size
+            events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=mod, unicode='', scancode=0))
+        elif kind == EVENT_MOTION:
+            x, y, dx, dy = MOTION.unpack_from(data, offset)
+            offset += MOTION.size
+            events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(dx, dy), buttons=(0, 0, 0)))
+        elif kind in (EVENT_BUTTONDOWN, EVENT_BUTTONUP):
+            x, y, button = BUTTON.unpack_from(data, offset)
+            offset += BUTTON.size
+            event_type = pygame.MOUSEBUTTONDOWN if kind == EVENT_BUTTONDOWN else pygame.MOUSEBUTTONUP
+            events.append(pygame.event.Event(event_type, pos=(x, y), button=button))
+        elif kind == EVENT_FOCUSLOST:
+            events.append(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        elif kind == EVENT_USER:
+            (event_type,) = USER.unpack_from(data, offset)
+            offset += USER.size
+            events.append(pygame.event.Event(event_type))
+        else:
+            raise ValueError(f"Unknown event kind {kind} in recording")
+    return events, offset
+
+
+def state_checksum(game):
+    """
+    Summarize the parts of the game state a replay must reproduce.
+
+    Args:
+        game (Game): The main game object, or None before it exists
+
+    Returns:
+        int: CRC32 of the state, 0 without a game
+    """
+    if game is None or not hasattr(game, 'player'):
+        return 0
+    offset = game.spawn_service.camera_offset() if hasattr(game, 'spawn_service') else (0, 0)
+    values = (game.current_sequence_index, int(game.in_tutorial), len(game.allsprites),
+              len(game.enemies), len(game.bullets), int(game.player.health),
+              offset[0], offset[1])
+    return zlib.crc32(struct.pack('<8i', *values))
+
+
+class FrameClock:
+    """
+    Stand-in for pygame.time.Clock that sends every tick through a session.
+
+    Attributes:
+        session (Session): Recording or replay the clock belongs to
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def tick(self, framerate=0):
+        return self.session.on_tick(framerate)
+
+    tick_busy_loop = tick
+
+    def get_time(self):
+        return self.session.last_dt
+
+    get_rawtime = get_time
+
+    def get_fps(self):
+        return 1000.0 / self.session.last_dt if self.session.last_dt else 0.0
+
+
+class Session(abc.ABC):
+    """
+    Makes a run repeatable by controlling every source of time and chance.
+
+    While installed, all clocks, pygame.time.get_ticks and time.time report
+    the time of the last clock tick, and the random module is seeded, so the
+    game only changes with the ticks and input stored in the recording.
+    Subclasses decide where each tick's time comes from in on_tick().
+
+    Attributes:
+        seed (int): Seed for the random module
+        base_time (float): Wall clock time the run started at
+        frame_ticks (int): Milliseconds reported for the current frame
+        last_dt (int): Milliseconds returned by the last tick
+        polls (int): Number of input polls so far
+        game (Game): Game being run, used for state checksums
+    """
+
+    def __init__(self, seed, base_time):
+        self.seed = seed
+        self.base_time = base_time
+        self.frame_ticks = 0
+        self.last_dt = 0
+        self.polls = 0
+        self.game = None
+        self._saved = None
+
+    def install(self):
+        """Route time, chance and input through this session."""
+        self._saved = (pygame.time.Clock, pygame.time.get_ticks, time.time)
+        self.real_clock = pygame.time.Clock()
+        self.real_ticks = pygame.time.get_ticks
+        pygame.time.Clock = lambda: FrameClock(self)
+        pygame.time.get_ticks = lambda: self.frame_ticks
+        time.time = lambda: self.base_time + self.frame_ticks / 1000.0
+        random.seed(self.seed)
+
+    def uninstall(self):
+        """Put the real clocks and input back."""
+        if self._saved:
+            pygame.time.Clock, pygame.time.get_ticks, time.time = self._saved
+            self._saved = None
+
+    @abc.abstractmethod
+    def on_tick(self, framerate):
+        """
+        Advance the run by one clock tick.
+
+        Args:
+            framerate (int): Frame cap the game asked for, 0 for none
+
+        Returns:
+            int: Milliseconds the tick took
+        """
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
+
+
+class Recorder(Session):
+    """
+    Records a play-through to a file.
+
+    Attributes:
+        path (str): File the recording is written to
+    """
+
+    def __init__(self, path, seed=None):
+        """
+        Args:
+            path (str): File to write
+            seed (int): Seed for the random module, picked at random if None
+        """
+        if seed is None:
+            seed = random.getrandbits(63)
+        super().__init__(seed, time.time())
+        self.path = path
+        self.file = None
+
+    def install(self):
+        super().install()
+        self.file = open(self.path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.base_time))
+        input_manager.listeners.append(self.on_poll)
+
+    def uninstall(self):
+        if self.on_poll in input_manager.listeners:
+            input_manager.listeners.remove(self.on_poll)
+        if self.file:
+            self.file.close()
+            self.file = None
+        super().uninstall()
+
+    def on_tick(self, framerate):
+        self.last_dt = self.real_clock.tick(framerate)
+        self.frame_ticks = self.real_ticks()
+        self.file.write(b'T' + TICK.pack(min(self.last_dt, 0xFFFF), self.frame_ticks))
+        return self.last_dt
+
+    def on_poll(self, events):
+        self.polls += 1
+        count, data = encode_events(events)
+        self.file.write(b'P' + POLL.pack(count, state_checksum(self.game)) + data)
+
+    def finish(self, game):
+        """
+        Write the outcome of the run.
+
+        Args:
+            game (Game): The game after game_loop returned
+        """
+        self.file.write(b'E' + END.pack(self.polls, self.frame_ticks, game.current_sequence_index,
+                                        int(game.running), state_checksum(game)))
+
+
+class Replayer(Session):
+    """
+    Plays a recording back and checks that it reaches the same states.
+
+    Attributes:
+        path (str): Recording to play
+        realtime (bool): Whether to keep the recorded frame rate instead of
+            running as fast as possible
+        errors (list): Differences found between the recording and the replay
+    """
+
+    max_errors = 20
+
+    def __init__(self, path, realtime=False):
+        """
+        Args:
+            path (str): Recording to play
+            realtime (bool): Whether to keep the recorded frame rate
+        """
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        magic, version, seed, base_time = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} recording")
+        super().__init__(seed, base_time)
+        self.path = path
+        self.realtime = realtime
+        self.offset = HEADER.size
+        self.errors = []
+
+    def install(self):
+        super().install()
+        input_manager.event_source = self.next_events
+        if not self.realtime:
+            self._saved_delays = (pygame.time.delay, pygame.time.wait)
+            pygame.time.delay = pygame.time.wait = lambda milliseconds: 0
+
+    def uninstall(self):
+        input_manager.event_source = None
+        if not self.realtime and self._saved:
+            pygame.time.delay, pygame.time.wait = self._saved_delays
+        super().uninstall()
+
+    def error(self, message):
+        """Note a difference from the recording."""
+        if len(self.errors) < self.max_errors:
+            self.errors.append(f"poll {self.polls}: {message}")
+
+    def next_record(self, tag):
+        """
+        Move to the next record, which should have the given tag.
+
+        Returns:
+            int: Offset of the record body, or None if it does not match
+        """
+        if self.offset >= len(self.data):
+            self.error(f"recording ended, expected {tag.decode()}")
+            return None
+        found = self.data[self.offset:self.offset + 1]
+        if found != tag:
+            self.error(f"expected {tag.decode()} record, found {found.decode()}")
+            return None
+        self.offset += 1
+        return self.offset
+
+    def on_tick(self, framerate):
+        if self.realtime:
+            self.real_clock.tick(framerate)
+        body = self.next_record(b'T')
+        if body is None:
+            # Out of step with the recording, keep time moving at the target rate
+            self.last_dt = 1000 // (framerate or 60)
+            self.frame_ticks += self.last_dt
+            return self.last_dt
+        self.last_dt, self.frame_ticks = TICK.unpack_from(self.data, body)
+        self.offset += TICK.size
+        return self.last_dt
+
+    def next_events(self):
+        """Events for the next poll, in place of the pygame queue."""
+        # Game code still posts its own events; the recorded copies are used
+        pygame.event.get()
+        self.polls += 1
+        body = self.next_record(b'P')
+        if body is None:
+            return [pygame.event.Event(pygame.QUIT)]
+        count, checksum = POLL.unpack_from(self.data, body)
+        if checksum != state_checksum(self.game):
+            self.error("game state differs from the recording")
+        events, self.offset = decode_events(self.data, body + POLL.size, count)
+        return events
+
+    def finish(self, game):
+        """
+        Compare the outcome of the replay with the recording.
+
+        Args:
+            game (Game): The game after game_loop returned
+
+        Returns:
+            dict: Summary of the replay
+        """
+        body = self.next_record(b'E')
+        if body is not None:
+            polls, ticks, sequence_index, running, checksum = END.unpack_from(self.data, body)
+            if polls != self.polls:
+                self.error(f"recording has {polls} polls")
+            if sequence_index != game.current_sequence_index or running != int(game.running):
+                self.error(f"recording ended at sequence {sequence_index}, "
+                           f"replay at {game.current_sequence_index}")
+            if checksum != state_checksum(game):
+                self.error("final game state differs from the recording")
+        return {
+            'polls': self.polls,
+            'game_ms': self.frame_ticks,
+            'sequence_index': game.current_sequence_index,
+            'errors': list(self.errors),
+        }
+
+
+def play(game):
+    """Run the game from the production screen to the end, like the main script."""
+    game.start_game_sequence()
+    game.game_loop()
+
+
+def record(path, seed=None):
+    """
+    Play the game normally while recording it.
+
+    Args:
+        path (str): File to write
+        seed (int): Seed for the random module, picked at random if None
+    """
+    from maingame import Game
+    with Recorder(path, seed) as recorder:
+        game = Game()
+        recorder.game = game
+        play(game)
+        recorder.finish(game)
+    print(f"Recorded {recorder.polls} polls to {path} (seed {recorder.seed})")
+
+
+def replay(path, realtime=False):
+    """
+    Drive the game from a recording.
+
+    Args:
+        path (str): Recording to play
+        realtime (bool): Whether to keep the recorded frame rate
+
+    Returns:
+        dict: Summary of the replay, with any differences under 'errors'
+    """
+    from maingame import Game
+    with Replayer(path, realtime) as replayer:
+        game = Game()
+        replayer.game = game
+        start = time.perf_counter()
+        play(game)
+        report = replayer.finish(game)
+    report['wall_s'] = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record or replay a Legend of Zahir play-through.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record_parser = commands.add_parser('record', help="play normally and save the input")
+    record_parser.add_argument('path')
+    record_parser.add_argument('--seed', type=int)
+    replay_parser = commands.add_parser('replay', help="play a recording back and verify it")
+    replay_parser.add_argument('path')
+    replay_parser.add_argument('--headless', action='store_true', help="no window or audio device")
+    replay_parser.add_argument('--realtime', action='store_true', help="keep the recorded frame rate")
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        record(args.path, args.seed)
+        return 0
+
+    if args.headless:
+        # Must be set before the game modules open the display
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        os.environ['ZAHIR_NO_AUDIO'] = '1'
+    report = replay(args.path, args.realtime)
+    print(f"Replayed {report['polls']} polls ({report['game_ms'] / 1000:.1f}s of game time) "
+          f"in {report['wall_s']:.1f}s, ended at sequence {report['sequence_index']}")
+    for error in report['errors']:
+        print(f"Mismatch at {error}")
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+import pygame
+from config_settings import FPS, RENDER_ON_DEMAND, IDLE_WAIT_MS
+from inputmanager import input_manager
+from jobs import job_scheduler
+
+
+class Timer:
+    """
+    Counts down a duration without blocking the game loop.
+
+    Attributes:
+        duration (float): Length of the timer in milliseconds
+        elapsed (float): Milliseconds counted so far
+        callback (callable): Called once when the timer runs out, or None
+        done (bool): Whether the timer has run out
+    """
+
+    def __init__(self, duration, callback=None):
+        """
+        Initialize the timer.
+
+        Args:
+            duration (float): Length of the timer in milliseconds
+            callback (callable): Called once when the timer runs out
+        """
+        self.duration = duration
+        self.elapsed = 0
+        self.callback = callback
+        self.done = False
+
+    @property
+    def progress(self):
+        """Fraction of the duration that has passed, from 0.0 to 1.0."""
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, self.elapsed / self.duration)
+
+    @property
+    def remaining(self):
+        """Milliseconds left before the timer runs out."""
+        return max(0, self.duration - self.elapsed)
+
+    def update(self, dt):
+        """
+        Advance the timer.
+
+        Args:
+            dt (float): Milliseconds since the last update
+
+        Returns:
+            bool: True on the update where the timer runs out
+        """
+        if self.done:
+            return False
+        self.elapsed += dt
+        if self.elapsed >= self.duration:
+            self.done = True
+            if self.callback:
+                self.callback()
+            return True
+        return False
+
+
+class Scene:
+    """
+    Base class for a screen run by the SceneManager.
+
+    A scene reacts to the events of a frame, advances its state and draws
+    itself, but never waits or loops on its own. When it is done it calls
+    finish() with a result and the manager removes it from the stack.
+
+    Scenes that only change in response to input or timers can set
+    on_demand. They are then only drawn after mark_dirty() is called, and
+    while clean the manager sleeps until input arrives instead of running
+    the frame loop. Any input and any timer running out marks a scene dirty
+    unless it overrides handle_input.
+
+    Attributes:
+        manager (SceneManager): Manager running this scene, set on push
+        overlay (bool): Whether the scene below should be drawn first
+        fps (int): Frame cap while this scene is on top
+        on_demand (bool): Whether the scene is only drawn when dirty
+        dirty (bool): Whether the scene changed since it was last drawn
+        done (bool): Whether the scene has finished
+        result: Value handed back to whoever showed the scene
+        timers (list): Timers advanced automatically every frame
+    """
+
+    overlay = False
+    fps = FPS
+    on_demand = False
+
+    def __init__(self):
+        self.manager = None
+        self.dirty = True
+        self.done = False
+        self.result = None
+        self.timers = []
+
+    def enter(self):
+        """Called when the scene is pushed onto the stack."""
+
+    def exit(self):
+        """Called when the scene is removed from the stack."""
+
+    def handle_input(self, snapshot):
+        """
+        React to the input of one frame.
+
+        Scenes that only care about raw events can override handle_events
+        instead.
+
+        Args:
+            snapshot (InputSnapshot): Input polled for this frame
+        """
+        if snapshot.events:
+            self.mark_dirty()
+        self.handle_events(snapshot.events)
+
+    def handle_events(self, events):
+        """
+        React to the events of one frame.
+
+        Args:
+            events (tuple): Events pulled from the queue this frame
+        """
+
+    def update(self, dt):
+        """
+        Advance the scene's timers.
+
+        Args:
+            dt (float): Milliseconds since the last frame
+        """
+        for timer in self.timers[:]:
+            timer.update(dt)
+            if timer.done:
+                self.timers.remove(timer)
+                self.mark_dirty()
+
+    def mark_dirty(self):
+        """Have the scene drawn again on the next frame."""
+        self.dirty = True
+
+    def idle_timeout(self):
+        """
+        How long the manager may sleep while the scene is clean.
+
+        Returns:
+            float: Milliseconds until the next timer runs out, at most IDLE_WAIT_MS
+        """
+        timeout = IDLE_WAIT_MS
+        for timer in self.timers:
+            timeout = min(timeout, timer.remaining)
+        return timeout
+
+    def draw(self, screen):
+        """
+        Draw the scene.
+
+        Args:
+            screen (pygame.Surface): Display surface
+        """
+
+    def capture_backdrop(self):
+        """
+        Keep a copy of what is on screen to draw underneath this scene.
+
+        Returns:
+            pygame.Surface: Copy of the display surface
+        """
+        return self.manager.screen.copy()
+
+    def add_timer(self, duration, callback=None):
+        """
+        Start a timer that is advanced with the scene.
+
+        Args:
+            duration (float): Length of the timer in milliseconds
+            callback (callable): Called once when it runs out
+
+        Returns:
+            Timer: The new timer
+        """
+        timer = Timer(duration, callback)
+        self.timers.append(timer)
+        return timer
+
+    def add_transition(self, transition):
+        """
+        Advance a transition effect with the scene's timers.
+
+        Args:
+            transition (Timer): Effect from transitions.py, or any timer
+
+        Returns:
+            Timer: The same transition, for drawing
+        """
+        self.timers.append(transition)
+        return transition
+
+    def finish(self, result=None):
+        """
+        Mark the scene as done.
+
+        Args:
+            result: Value handed back to whoever showed the scene
+        """
+        self.done = True
+        self.result = result
+
+
+class SceneManager:
+    """
+    Runs a stack of scenes from a single loop.
+
+    Only the top scene receives events and updates. Drawing starts at the
+    highest scene that is not an overlay, so pause menus and messages are
+    drawn over the screen below them. Frame hooks run every frame no matter
+    which scene is on top, so background work keeps going during menus and
+    transitions. After them the job scheduler gets its budget of the frame,
+    and idle screens keep polling instead of sleeping while it has work.
+
+    Attributes:
+        screen (pygame.Surface): Display surface
+        clock (pygame.time.Clock): Clock used to cap the frame rate
+        stack (list): Active scenes, the last one is on top
+        frame_hooks (list): Callables run every frame with the frame time
+        callbacks (dict): Scene to callable run with its result when removed
+        running (int): Number of run() calls currently driving the loop
+        input (InputSnapshot): Input polled for the current frame
+        render_on_demand (bool): Whether on_demand scenes skip clean frames
+        frames_drawn (int): Frames drawn and flipped, for profiling
+        frames_idle (int): Frames skipped because the top scene was clean
+    """
+
+    def __init__(self, screen, clock):
+        """
+        Initialize the scene manager.
+
+        Args:
+            screen (pygame.Surface): Display surface
+            clock (pygame.time.Clock): Clock used to cap the frame rate
+        """
+        self.screen = screen
+        self.clock = clock
+        self.stack = []
+        self.frame_hooks = []
+        self.callbacks = {}
+        self.running = 0
+        self.input = input_manager.current
+        self.render_on_demand = RENDER_ON_DEMAND
+        self.frames_drawn = 0
+        self.frames_idle = 0
+
+    @property
+    def top(self):
+        """The scene currently receiving input, or None."""
+        return self.stack[-1] if self.stack else None
+
+    def add_frame_hook(self, hook):
+        """
+        Run a callable every frame.
+
+        Args:
+            hook (callable): Called with the frame time in milliseconds
+        """
+        self.frame_hooks.append(hook)
+
+    def remove_frame_hook(self, hook):
+        """Stop running a frame hook."""
+        if hook in self.frame_hooks:
+            self.frame_hooks.remove(hook)
+
+    def push(self, scene, on_done=None):
+        """
+        Put a scene on top of the stack without waiting for it.
+
+        Args:
+            scene (Scene): Scene to show
+            on_done (callable): Called with the scene's result when it finishes
+        """
+        scene.manager = self
+        scene.dirty = True
+        self.stack.append(scene)
+        if on_done:
+            self.callbacks[scene] = on_done
+        scene.enter()
+
+    def remove(self, scene):
+        """
+        Take a scene off the stack and hand its result to its callback.
+
+        Scenes pushed on top of it are removed first, since they were
+        shown on its behalf.
+        """
+        if scene not in self.stack:
+            return
+        index = self.stack.index(scene)
+        for removed in reversed(self.stack[index:]):
+            self.stack.remove(removed)
+            removed.exit()
+            callback = self.callbacks.pop(removed, None)
+            if callback:
+                callback(removed.result)
+        if self.stack:
+            # Whatever was underneath is uncovered
+            self.top.mark_dirty()
+
+    def show(self, scene, on_done=None):
+        """
+        Show a scene, pushing it if a loop is already running.
+
+        Inside a running loop the scene is pushed and this returns at once;
+        otherwise the loop is started and the scene's result is returned.
+
+        Args:
+            scene (Scene): Scene to show
+            on_done (callable): Called with the scene's result when it finishes
+
+        Returns:
+            The scene's result when run directly, otherwise None
+        """
+        if self.running:
+            self.push(scene, on_done)
+            return None
+        result = self.run(scene)
+        if on_done:
+            on_done(result)
+        return result
+
+    def run(self, scene):
+        """
+        Push a scene and drive the loop until it finishes.
+
+        Args:
+            scene (Scene): Scene to run
+
+        Returns:
+            The scene's result
+        """
+        self.push(scene)
+        self.running += 1
+        try:
+            while scene in self.stack:
+                self.step()
+        finally:
+            self.running -= 1
+        return scene.result
+
+    def on_demand(self, scene):
+        """Whether a scene is only drawn when dirty."""
+        return self.render_on_demand and scene.on_demand
+
+    def step(self):
+        """Run one frame: input, update, hooks and drawing for the stack."""
+        top = self.top
+        if self.on_demand(top) and not top.dirty and not job_scheduler.busy:
+            # Nothing to show, sleep until input arrives or a timer is due
+            self.input = input_manager.wait(top.idle_timeout())
+            dt = self.clock.tick()
+        else:
+            dt = self.clock.tick(top.fps)
+            self.input = input_manager.poll()
+        top.handle_input(self.input)
+        if not top.done:
+            top.update(dt)
+
+        for hook in self.frame_hooks[:]:
+            hook(dt)
+
+        # Give background jobs their slice of the frame
+        job_scheduler.run()
+
+        for finished in [s for s in self.stack if s.done]:
+            self.remove(finished)
+
+        if not self.stack:
+            return
+        top = self.top
+        if self.on_demand(top) and not top.dirty:
+            self.frames_idle += 1
+            return
+        self.draw()
+        pygame.display.flip()
+        top.dirty = False
+        self.frames_drawn += 1
+
+    def draw(self):
+        """Draw the stack from the highest opaque scene upwards."""
+        start = len(self.stack) - 1
+        while start > 0 and self.stack[start].overlay:
+            start -= 1
+        for scene in self.stack[start:]:
+            scene.draw(self.screen)
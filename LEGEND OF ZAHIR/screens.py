@@ -0,0 +1,662 @@
+import pygame
+from config_settings import *
+from scenes import Scene
+from jobs import job_scheduler
+from soundmanager import sound_manager
+from leaderboard import draw_leaderboard
+from timestep import capture_positions, draw_interpolated
+from transitions import dim, Fade
+from widgets import TextInput
+
+FONT_PATH = 'LEGEND OF ZAHIR/assets/fonts/nokiafc22.ttf'
+
+
+class ProductionScene(Scene):
+    """Production credits that fade in, hold and fade out."""
+
+    fade_ms = 1000
+    hold_ms = 2000
+
+    def enter(self):
+        font_large = pygame.font.Font(FONT_PATH, 48)  # Larger font for production text
+        production_text = font_large.render("Produced by", True, WHITE)
+        team_text = font_large.render("Learning Team 7", True, WHITE)
+        self.lines = [
+            (production_text, production_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 40))),
+            (team_text, team_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 40))),
+        ]
+        self.fade = self.add_transition(Fade(self.fade_ms, fade_in=True))
+        self.add_timer(self.fade_ms + self.hold_ms, self.fade_out)
+
+    def fade_out(self):
+        self.fade = self.add_transition(Fade(self.fade_ms, fade_in=False, callback=self.finish))
+
+    def draw(self, screen):
+        screen.fill(BLACK)
+        for text, rect in self.lines:
+            screen.blit(text, rect)
+        self.fade.draw(screen)
+
+
+class LoadingScene(Scene):
+    """
+    Loading screen with a progress bar that fills over a fixed time.
+
+    Background jobs such as the visual novel assets load while it is up,
+    and whatever is left is finished at once when the time runs out, so
+    the screen lasts the same number of ticks however fast the jobs are.
+    """
+
+    duration_ms = 1000
+    bar_width = 400
+    bar_height = 40
+
+    def __init__(self, font):
+        """
+        Args:
+            font (pygame.font.Font): Font for the caption and percentage
+        """
+        super().__init__()
+        self.font = font
+
+    def enter(self):
+        self.loading_text = self.font.render("Loading...", True, WHITE)
+        self.loading_rect = self.loading_text.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
+        self.bar_bg_rect = pygame.Rect(WIDTH/2 - self.bar_width/2, HEIGHT/2, self.bar_width, self.bar_height)
+        self.progress_timer = self.add_timer(self.duration_ms, self.finish_loading)
+        self.percent = None
+
+    def finish_loading(self):
+        """Finish the background jobs that are left, then leave the screen."""
+        job_scheduler.finish_all()
+        self.finish()
+
+    def draw(self, screen):
+        progress = int(self.progress_timer.progress * 100)
+        fill_rect = pygame.Rect(WIDTH/2 - self.bar_width/2, HEIGHT/2,
+                                (progress / 100) * self.bar_width, self.bar_height)
+
+        screen.fill(BLACK)
+        screen.blit(self.loading_text, self.loading_rect)
+        pygame.draw.rect(screen, GRAY, self.bar_bg_rect, 2)  # Border
+        pygame.draw.rect(screen, WHITE, fill_rect)
+
+        # Only render the percentage again when it changes
+        if progress != self.percent:
+            self.percent = progress
+            self.percent_text = self.font.render(f"{progress}%", True, WHITE)
+            self.percent_rect = self.percent_text.get_rect(center=(WIDTH/2, HEIGHT/2 + self.bar_height + 20))
+        screen.blit(self.percent_text, self.percent_rect)
+
+
+# Main menu button colours
+BUTTON_BG = (67, 56, 202)  # Base color
+BUTTON_HOVER = (99, 102, 241)  # Hover color
+BUTTON_BORDER = (129, 140, 248)  # Border color
+BUTTON_SHADOW = (30, 27, 75)  # Shadow color
+SHADOW_OFFSET = 3  # Slightly reduced shadow for smaller buttons
+
+
+def draw_menu_button(surface, font, rect, text, is_selected, is_pressed=False):
+    """Draw a single main menu button with proper sizing and styling."""
+    # Shadow/3D effect
+    shadow_rect = rect.copy()
+    shadow_rect.y += SHADOW_OFFSET
+    pygame.draw.rect(surface, BUTTON_SHADOW, shadow_rect, border_radius=8)
+
+    # Main button
+    button_rect = rect.copy()
+    if is_pressed:
+        button_rect.y += SHADOW_OFFSET
+        color = BUTTON_HOVER
+    else:
+        color = BUTTON_HOVER if is_selected else BUTTON_BG
+
+    pygame.draw.rect(surface, color, button_rect, border_radius=8)
+
+    # Gradient effect
+    gradient_rect = button_rect.copy()
+    gradient_rect.height = button_rect.height // 2
+    pygame.draw.rect(surface, (*[min(c + 20, 255) for c in color], 50),
+                     gradient_rect, border_radius=8)
+
+    # Border
+    pygame.draw.rect(surface, BUTTON_BORDER, button_rect, 2, border_radius=8)
+
+    # Inner glow when selected
+    if is_selected:
+        glow_rect = button_rect.inflate(-4, -4)
+        pygame.draw.rect(surface, (*BUTTON_BORDER, 100), glow_rect, 2, border_radius=6)
+
+    # Text
+    text_surface = font.render(text, True, WHITE)
+    text_rect = text_surface.get_rect(center=button_rect.center)
+    if is_pressed:
+        text_rect.y += SHADOW_OFFSET
+
+    # Text shadow
+    text_shadow = font.render(text, True, BUTTON_SHADOW)
+    shadow_text_rect = text_rect.copy()
+    shadow_text_rect.y += 2
+    surface.blit(text_shadow, shadow_text_rect)
+
+    # Main text
+    surface.blit(text_surface, text_rect)
+
+
+class MainMenuScene(Scene):
+    """
+    Main menu with New Game, Leaderboard and Quit buttons.
+
+    The menu is only drawn again when a button is hovered, pressed or
+    released, so it sleeps while the mouse rests. It finishes with
+    'new_game' or 'quit'.
+    """
+
+    on_demand = True
+    button_width = 200  # Reduced width to match font size
+    button_height = 40  # Reduced height to match font size
+    button_spacing = 20
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        try:
+            background = pygame.image.load('LEGEND OF ZAHIR/menu_background.png')
+            self.background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+        except:
+            print("Could not load menu background image")
+            self.background = None
+
+        self.button_font = pygame.font.Font(FONT_PATH, 20)
+        start_y = HEIGHT/2 + 50
+        labels = {'new_game': 'New Game', 'leaderboard': 'Leaderboard', 'quit': 'Quit'}
+        self.buttons = {}
+        for i, (key, text) in enumerate(labels.items()):
+            rect = pygame.Rect(WIDTH/2 - self.button_width/2,
+                               start_y + (self.button_height + self.button_spacing) * i,
+                               self.button_width, self.button_height)
+            self.buttons[key] = (rect, text)
+        self.selected = None
+        self.pressed = None
+
+    def button_at(self, pos):
+        """Get the key of the button under a position, if any."""
+        for key, (rect, _) in self.buttons.items():
+            if rect.collidepoint(pos):
+                return key
+        return None
+
+    def handle_input(self, snapshot):
+        before = (self.selected, self.pressed)
+        mouse_pos = snapshot.mouse_pos
+        for event in snapshot.events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+                self.finish('quit')
+                return
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.pressed = self.button_at(mouse_pos)
+                if self.pressed:
+                    sound_manager.play_sound('button_click')
+            elif event.type == pygame.MOUSEBUTTONUP:
+                if self.pressed and self.button_at(mouse_pos) == self.pressed:
+                    self.activate(self.pressed)
+                self.pressed = None
+            elif event.type != pygame.MOUSEMOTION:
+                # Window exposed, focus changes and the like
+                self.mark_dirty()
+
+        # Mouse movement only matters when it moves onto another button
+        self.selected = self.button_at(mouse_pos)
+        if (self.selected, self.pressed) != before:
+            self.mark_dirty()
+
+    def update(self, dt):
+        super().update(dt)
+        if not self.game.running:
+            # Closed from the leaderboard
+            self.finish('quit')
+
+    def activate(self, key):
+        """Run a button's action."""
+        if key == 'leaderboard':
+            self.manager.push(LeaderboardScene(self.game))
+        elif key == 'quit':
+            self.game.running = False
+            self.finish('quit')
+        else:
+            self.finish(key)
+
+    def draw(self, screen):
+        if self.background:
+            screen.blit(self.background, (0, 0))
+        else:
+            screen.fill((30, 27, 75))
+
+        for key, (rect, text) in self.buttons.items():
+            draw_menu_button(screen, self.button_font, rect, text,
+                             key == self.selected, key == self.pressed)
+
+
+class LeaderboardScene(Scene):
+    """Leaderboard screen closed with ESC or ENTER."""
+
+    on_demand = True
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+                self.finish()
+                return
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+                    sound_manager.play_sound('button_click')
+                    self.finish()
+                    return
+
+    def draw(self, screen):
+        screen.fill(BLACK)
+        draw_leaderboard(screen, self.game.font, self.game.leaderboard_system)
+
+
+class GameplayScene(Scene):
+    """Main dungeon gameplay for one room of the game sequence."""
+
+    def __init__(self, game):
+        """
+        Initialize the gameplay scene.
+
+        Args:
+            game (Game): The main game object, already set up with game.new()
+        """
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        self.game.timestep.reset(self.manager.clock)
+
+    def handle_input(self, snapshot):
+        self.game.events(snapshot)
+
+    def update(self, dt):
+        super().update(dt)
+        game = self.game
+        steps = game.timestep.advance(dt)
+        for _ in range(steps):
+            if game.paused or not game.playing:
+                break
+            result = game.update()
+            if result in ("completed", "died"):
+                self.finish(result)
+                return
+
+        if game.player.health <= 0:
+            self.finish("died")
+        elif not game.playing or not game.running:
+            self.finish("completed" if game.enemies_defeated else "quit")
+
+    def draw(self, screen):
+        self.game.draw(self.game.timestep.alpha)
+
+
+class TutorialScene(Scene):
+    """Gameplay with the tutorial overlay, finished when the tutorial is."""
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        self.game.timestep.reset(self.manager.clock)
+
+    def handle_input(self, snapshot):
+        game = self.game
+        game.input_state = snapshot
+        if snapshot.quit:
+            game.running = False
+            self.finish("quit")
+            return
+
+        # Handle tutorial system input
+        game.tutorial_system.handle_input(snapshot)
+        if snapshot.was_triggered('shoot'):
+            if game.ammo_system.can_shoot():  # Add cooldown check
+                if game.player.shoot(snapshot.mouse_pos):
+                    game.ammo_system.shoot()  # Update ammo system
+                    sound_manager.play_sound('bullet')
+
+        if game.tutorial_system.tutorial_completed:
+            self.finish("completed")
+
+    def update(self, dt):
+        super().update(dt)
+        game = self.game
+        for _ in range(game.timestep.advance(dt)):
+            game.previous_positions = capture_positions(game.allsprites)
+            game.allsprites.update()
+            game.resolve_collisions()
+
+    def draw(self, screen):
+        game = self.game
+        screen.fill(BACKGROUND_COLOR)
+        draw_interpolated(screen, game.allsprites, game.previous_positions, game.timestep.alpha)
+        game.player.draw_health_bar(screen)
+        game.hud.draw(screen)
+
+        # Draw tutorial overlay last
+        game.tutorial_system.draw(screen)
+
+
+class PauseScene(Scene):
+    """Pause menu drawn over the frozen gameplay."""
+
+    overlay = True
+    fps = 30
+    on_demand = True
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        game = self.game
+        # Create menu text
+        menu_font = pygame.font.Font(FONT_PATH, 36)
+        self.lines = [
+            (menu_font.render("PAUSED", True, WHITE), -80),
+            (game.font.render("Press ESC to Resume", True, WHITE), -20),
+            (game.font.render("Press R to Restart Level", True, WHITE), 20),
+            (game.font.render("Press Q to Quit", True, WHITE), 60),
+        ]
+        self.lines = [(text, text.get_rect(center=(WIDTH/2, HEIGHT/2 + offset)))
+                      for text, offset in self.lines]
+
+    def handle_events(self, events):
+        game = self.game
+        for event in events:
+            if event.type == pygame.QUIT:
+                game.running = False
+                game.paused = False
+                self.finish()
+                return
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    game.paused = False
+                    game.resume_timer()
+                    self.finish()
+                    return
+                elif event.key == pygame.K_q:
+                    game.running = False
+                    game.paused = False
+                    self.finish()
+                    return
+                elif event.key == pygame.K_r:
+                    # Handle restart
+                    game.paused = False
+                    game.resume_timer()
+                    game.new()  # Reset the current level
+                    sound_manager.play_sound('button_click')
+                    self.finish()
+                    return
+
+    def draw(self, screen):
+        dim(screen, 128)
+        for text, rect in self.lines:
+            screen.blit(text, rect)
+
+
+class MessageScene(Scene):
+    """Temporary message over the game state, closed by a timer or any key."""
+
+    overlay = True
+
+    def __init__(self, game, message, duration=2.0):
+        """
+        Args:
+            game (Game): The main game object
+            message (str): Message to display
+            duration (float): How long to show message in seconds
+        """
+        super().__init__()
+        self.game = game
+        self.message = message
+        self.duration = duration
+
+    def enter(self):
+        # Render message
+        font = pygame.font.Font(FONT_PATH, 28)
+        self.text = font.render(self.message, True, WHITE)
+        self.text_rect = self.text.get_rect(center=(WIDTH/2, HEIGHT/2))
+
+        self.add_timer(self.duration * 1000, self.finish)
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type in (pygame.QUIT, pygame.KEYDOWN):
+                self.finish()
+                return
+
+    def draw(self, screen):
+        # Shown on its own, draw the current game state underneath
+        if self.manager.stack[0] is self:
+            self.game.draw()
+        dim(screen, 128)
+        screen.blit(self.text, self.text_rect)
+
+
+class LevelCompleteScene(Scene):
+    """Dialogue box with a level complete message, closed with ENTER."""
+
+    overlay = True
+
+    def __init__(self, game, message):
+        super().__init__()
+        self.game = game
+        self.message = message
+
+    def enter(self):
+        self.backdrop = self.capture_backdrop()
+        self.dialogue_box = pygame.Surface((600, 120))
+        self.dialogue_box.fill(WHITE)
+        self.dialogue_box_rect = self.dialogue_box.get_rect(center=(WIDTH/2, HEIGHT/2))
+
+        # Use slightly smaller font for potentially long messages
+        dialogue_font = pygame.font.Font(FONT_PATH, 20)
+        text = dialogue_font.render(self.message, True, BLACK)
+        self.dialogue_box.blit(text, text.get_rect(center=(300, 60)))
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+                self.finish()
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                self.finish()
+                return
+
+    def draw(self, screen):
+        if self.manager.stack[0] is self:
+            screen.blit(self.backdrop, (0, 0))
+        screen.blit(self.dialogue_box, self.dialogue_box_rect)
+
+
+class RestartPromptScene(Scene):
+    """Yes/No prompt after dying, finishes with True to restart."""
+
+    overlay = True
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        self.backdrop = self.capture_backdrop()
+        self.prompt_box = pygame.Surface((400, 150))
+        self.prompt_box.fill(WHITE)
+        self.prompt_box_rect = self.prompt_box.get_rect(center=(WIDTH/2, HEIGHT/2))
+
+        button_font = pygame.font.Font(FONT_PATH, 20)
+        text = self.game.font.render("You died! Restart level?", True, BLACK)
+        self.prompt_box.blit(text, text.get_rect(center=(200, 50)))
+
+        self.yes_button = pygame.Rect(50, 100, 100, 40)
+        self.no_button = pygame.Rect(250, 100, 100, 40)
+
+        # Draw buttons
+        pygame.draw.rect(self.prompt_box, GREEN, self.yes_button)
+        pygame.draw.rect(self.prompt_box, RED, self.no_button)
+        self.prompt_box.blit(button_font.render("Yes", True, BLACK), (85, 110))
+        self.prompt_box.blit(button_font.render("No", True, BLACK), (285, 110))
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.finish(False)
+                return
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                adjusted_pos = (event.pos[0] - self.prompt_box_rect.x,
+                                event.pos[1] - self.prompt_box_rect.y)
+                if self.yes_button.collidepoint(adjusted_pos):
+                    sound_manager.play_sound('button_click')
+                    self.finish(True)
+                    return
+                elif self.no_button.collidepoint(adjusted_pos):
+                    sound_manager.play_sound('button_click')
+                    self.finish(False)
+                    return
+
+    def draw(self, screen):
+        if self.manager.stack[0] is self:
+            screen.blit(self.backdrop, (0, 0))
+        screen.blit(self.prompt_box, self.prompt_box_rect)
+
+
+class NameEntryScene(Scene):
+    """Text box for the player's name, finishes with the entered name."""
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        font = self.game.font
+        self.input_box = pygame.Rect(WIDTH/2 - 150, HEIGHT/2, 200, 36)
+        self.color_inactive = pygame.Color('lightskyblue3')
+        self.color_active = pygame.Color('dodgerblue2')
+        self.active = False
+        # Limit name length to 15 characters, the caret shows once the box is clicked
+        self.text_input = TextInput(font, self.color_inactive, max_length=15, show_caret=False)
+
+        self.prompt = font.render('Please Enter Your Player Name:', True, WHITE)
+        self.prompt_rect = self.prompt.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
+
+        self.enter_text = font.render('Press ENTER when done', True, WHITE)
+        self.enter_rect = self.enter_text.get_rect(center=(WIDTH/2, HEIGHT/2 + 50))
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+                self.finish('')
+                return
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.active = self.input_box.collidepoint(event.pos)
+                self.text_input.set_color(self.color_active if self.active else self.color_inactive)
+                self.text_input.show_caret = self.active
+
+            if event.type == pygame.KEYDOWN and self.active:
+                if event.key == pygame.K_RETURN:
+                    # Return "Player" if no name entered
+                    self.finish(self.text_input.text or "Player")
+                    return
+                self.text_input.handle_event(event)
+
+    def update(self, dt):
+        super().update(dt)
+        self.text_input.update(dt)
+
+    def draw(self, screen):
+        screen.fill(BLACK)
+
+        # Draw prompt
+        screen.blit(self.prompt, self.prompt_rect)
+
+        # Draw the input box
+        self.input_box.w = max(200, self.text_input.get_width()+10)
+        self.input_box.centerx = WIDTH/2
+        pygame.draw.rect(screen, self.text_input.color, self.input_box, 2)
+        self.text_input.draw(screen, topleft=(self.input_box.x+5, self.input_box.y+5))
+
+        # Draw enter instruction
+        screen.blit(self.enter_text, self.enter_rect)
+
+
+class FinalResultsScene(Scene):
+    """Final time and leaderboard or game over message, closed with ENTER."""
+
+    on_demand = True
+
+    def __init__(self, game, time_str, victory, game_completed):
+        """
+        Args:
+            game (Game): The main game object
+            time_str (str): Formatted total time
+            victory (bool): Whether the boss was defeated
+            game_completed (bool): Whether the run counts for the leaderboard
+        """
+        super().__init__()
+        self.game = game
+        self.time_str = time_str
+        self.victory = victory
+        self.game_completed = game_completed
+
+    def enter(self):
+        font = self.game.font
+        # Show completion or game over text
+        if self.victory:
+            self.text = font.render('Congratulations! Game Complete!', True, (255, 215, 0))  # Golden color
+        else:
+            self.text = font.render('Game Over', True, RED)
+        self.text_rect = self.text.get_rect(center=(WIDTH/2, HEIGHT/2 - 50))
+
+        # Show time text
+        self.time_text = font.render(f'Total Time: {self.time_str}', True, WHITE)
+        self.time_rect = self.time_text.get_rect(center=(WIDTH/2, HEIGHT/2))
+
+        # Show appropriate message based on victory state
+        if self.victory:
+            self.msg = font.render('Game completed! Press ENTER to continue', True, GREEN)
+        else:
+            self.msg = font.render('Game over! Press ENTER to continue', True, RED)
+        self.msg_rect = self.msg.get_rect(center=(WIDTH/2, HEIGHT/2 + 50))
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.game.running = False
+                self.finish()
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                self.finish()
+                return
+
+    def draw(self, screen):
+        screen.fill(BLACK)
+        screen.blit(self.text, self.text_rect)
+        screen.blit(self.time_text, self.time_rect)
+
+        if self.game_completed:
+            # Show leaderboard for completed game
+            draw_leaderboard(screen, self.game.font, self.game.leaderboard_system)
+        else:
+            screen.blit(self.msg, self.msg_rect)
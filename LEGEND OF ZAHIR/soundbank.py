@@ -0,0 +1,219 @@
+import json
+import mmap
+import os
+import sys
+import pygame
+
+SOUND_PATH = os.path.join('LEGEND OF ZAHIR', 'assets', 'sounds')
+BANK_FILE = 'soundbank.pcm'
+MANIFEST_FILE = 'soundbank.json'
+SOUND_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+ALIGNMENT = 16  # Keep every entry on a whole sample frame
+
+
+def source_files(directory=SOUND_PATH):
+    """
+    Find the sound files a bank is built from.
+
+    Args:
+        directory (str): Folder holding the sfx and bgm subfolders
+
+    Returns:
+        list: Paths relative to the folder, with forward slashes
+    """
+    found = []
+    for root, _, files in os.walk(directory):
+        for filename in sorted(files):
+            if filename.lower().endswith(SOUND_EXTENSIONS):
+                path = os.path.relpath(os.path.join(root, filename), directory)
+                found.append(path.replace(os.sep, '/'))
+    return sorted(found)
+
+
+def source_stamp(path):
+    """Get the modification time and size that mark a source file's version."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def build_bank(directory=SOUND_PATH):
+    """
+    Decode every sound once into a raw PCM bank with a JSON manifest.
+
+    The samples are stored in the mixer's current output format, so they
+    can be handed to pygame.mixer.Sound(buffer=...) without decoding. The
+    mixer must already be initialised.
+
+    Args:
+        directory (str): Folder holding the sfx and bgm subfolders
+
+    Returns:
+        dict: The manifest that was written
+    """
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        raise RuntimeError("pygame.mixer must be initialised to build the sound bank")
+
+    entries = {}
+    bank_path = os.path.join(directory, BANK_FILE)
+    temp_path = bank_path + '.tmp'
+    offset = 0
+    with open(temp_path, 'wb') as bank:
+        for key in source_files(directory):
+            source = os.path.join(directory, *key.split('/'))
+            try:
+                raw = pygame.mixer.Sound(source).get_raw()
+            except pygame.error as e:
+                print(f"Skipping {key}: {e}")
+                continue
+            mtime_ns, size = source_stamp(source)
+            entries[key] = {'offset': offset, 'length': len(raw),
+                            'mtime_ns': mtime_ns, 'size': size}
+            bank.write(raw)
+            padding = -len(raw) % ALIGNMENT
+            bank.write(b'\0' * padding)
+            offset += len(raw) + padding
+            print(f"Banked {key}: {len(raw) / 1024:.0f} KiB")
+
+    manifest = {'format': list(mixer_format), 'entries': entries}
+    with open(os.path.join(directory, MANIFEST_FILE) + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    # Replace both files only once they are complete
+    os.replace(temp_path, bank_path)
+    os.replace(os.path.join(directory, MANIFEST_FILE) + '.tmp', os.path.join(directory, MANIFEST_FILE))
+    return manifest
+
+
+class SoundBank:
+    """
+    Read-only view of a built sound bank.
+
+    The bank file is memory-mapped, so opening it costs nothing up front and
+    only the pages of sounds that are actually used are read from disk. Each
+    entry is checked against its source file before use, and a stale or
+    missing entry is reported as unavailable so callers decode the source.
+
+    Attributes:
+        directory (str): Folder holding the bank, manifest and sources
+        entries (dict): Manifest entries by relative source path
+        data (mmap.mmap): Mapped bank file, or None when not open
+    """
+
+    def __init__(self, directory=SOUND_PATH):
+        """
+        Args:
+            directory (str): Folder holding the bank, manifest and sources
+        """
+        self.directory = directory
+        self.entries = {}
+        self.data = None
+        self._file = None
+        self._fresh = {}
+
+    def open(self):
+        """
+        Map the bank if it exists and matches the mixer's output format.
+
+        Returns:
+            bool: Whether the bank can be used
+        """
+        try:
+            with open(os.path.join(self.directory, MANIFEST_FILE)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if tuple(manifest.get('format', ())) != pygame.mixer.get_init():
+            print("Sound bank was built for another mixer format, decoding sources instead")
+            return False
+
+        try:
+            self._file = open(os.path.join(self.directory, BANK_FILE), 'rb')
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            print(f"Could not map the sound bank: {e}")
+            self.close()
+            return False
+        self.entries = manifest.get('entries', {})
+        return True
+
+    def close(self):
+        """Unmap the bank."""
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.entries = {}
+        self._fresh = {}
+
+    def is_fresh(self, key):
+        """
+        Check that a banked sound still matches its source file.
+
+        Args:
+            key (str): Source path relative to the bank folder, e.g. 'sfx/fireball.mp3'
+
+        Returns:
+            bool: Whether the banked samples can be used
+        """
+        if key not in self._fresh:
+            entry = self.entries.get(key)
+            fresh = False
+            if entry is not None and self.data is not None:
+                try:
+                    stamp = source_stamp(os.path.join(self.directory, *key.split('/')))
+                    fresh = stamp == (entry['mtime_ns'], entry['size'])
+                except OSError:
+                    # Source removed, the banked copy is all there is
+                    fresh = True
+            if entry is not None and not fresh:
+                print(f"Sound bank entry {key} is out of date, decoding the source")
+            self._fresh[key] = fresh
+        return self._fresh[key]
+
+    def buffer(self, key, start=0, length=None):
+        """
+        Get the raw samples of a banked sound, or a slice of them.
+
+        Args:
+            key (str): Source path relative to the bank folder
+            start (int): Byte offset into the sound
+            length (int): Number of bytes, None for the rest of the sound
+
+        Returns:
+            memoryview: View into the mapped bank, or None if unavailable
+        """
+        if not self.is_fresh(key):
+            return None
+        entry = self.entries[key]
+        start = min(start, entry['length'])
+        end = entry['length'] if length is None else min(entry['length'], start + length)
+        return memoryview(self.data)[entry['offset'] + start:entry['offset'] + end]
+
+    def length(self, key):
+        """Size in bytes of a banked sound, 0 if unavailable."""
+        return self.entries[key]['length'] if self.is_fresh(key) else 0
+
+    def sound(self, key):
+        """
+        Build a playable sound from the bank without decoding.
+
+        Args:
+            key (str): Source path relative to the bank folder
+
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it is not banked or stale
+        """
+        samples = self.buffer(key)
+        if samples is None:
+            return None
+        return pygame.mixer.Sound(buffer=samples)
+
+
+if __name__ == "__main__":
+    # Build with the same mixer settings the game opens
+    pygame.mixer.init()
+    manifest = build_bank(sys.argv[1] if len(sys.argv) > 1 else SOUND_PATH)
+    print(f"Wrote {len(manifest['entries'])} sounds for mixer format {manifest['format']}")
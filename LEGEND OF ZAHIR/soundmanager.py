@@ -1,33 +1,136 @@
 import pygame
 import os
+import time
+import queue
+import threading
+from config_settings import AUDIO_ENABLED, SOUND_CHANNELS, SOUND_MAX_INSTANCES, SOUND_STEALING
+from soundbank import SoundBank
+from musicmanager import MusicManager
+
 class SoundManager:
     """
     A class to manage all sound-related functionality for the game.
     This class centralizes sound loading, playing, and stopping, making it easier to manage audio across the entire game.
     It now uses a more organized folder structure for sound assets.
+
+    Each sound is decoded once and shared by every caller. Sounds belong to a
+    category ('sfx', 'ui' or 'voice') that has its own reserved mixer channels,
+    so a volley of shots cannot cut off button clicks or dialogue. Within a
+    category only a limited number of copies of one sound play at once, and
+    when every channel is busy the oldest sound is stolen or the new play is
+    dropped, depending on the category.
+
+    Nothing touches the audio device until start() is called (or the first
+    sound is played). The mixer is then opened on a background thread, so a
+    slow sound driver never holds up the game window. Sounds are registered
+    by name and decoded the first time they play, or ahead of time on the
+    same background thread when prefetched. Setting AUDIO_ENABLED to False or
+    the ZAHIR_NO_AUDIO environment variable skips the mixer entirely.
+
+    When a sound bank has been built with soundbank.py, sounds are taken
+    from its pre-decoded samples instead of decoding the MP3s at launch.
+    Any sound whose source file changed since the build is decoded from the
+    source as before.
+
+    Music is handled by a MusicManager, reachable as the music attribute,
+    which streams and crossfades a track for each game mode.
     """
     def __init__(self):
         """
         Initialize the SoundManager.
-        Sets up the pygame mixer and initializes dictionaries for sounds and music.
+        Registers the game's sounds and music without opening the mixer.
         """
-        pygame.mixer.init()
+        self.enabled = AUDIO_ENABLED and not os.environ.get('ZAHIR_NO_AUDIO')
         self.sounds = {}
-        self.music = None
+        self.sound_files = {}
+        self.sound_categories = {}
         self.sound_path = os.path.join('LEGEND OF ZAHIR', 'assets', 'sounds')
+        self.bank = SoundBank(self.sound_path)
+
+        self.ready = threading.Event()
+        self.started = False
+        self.lock = threading.Lock()
+        self.decode_queue = queue.Queue()
+        self.sound_volume = 0.5
+        self.music = MusicManager(self)
+
+        self.channel_pools = {}
+        self.channel_started = {}
+        self.stats = {category: {'plays': 0, 'dropped': 0, 'stolen': 0,
+                                 'latency_total_ms': 0.0, 'latency_max_ms': 0.0}
+                      for category in SOUND_CHANNELS}
         
-        # Load all game sounds at initialization
+        # Register all game sounds, they are decoded when first needed
         self.load_sound('bullet', 'fireball.mp3')
-        self.load_sound('button_click', 'buttons.mp3')
+        self.load_sound('button_click', 'buttons.mp3', category='ui')
         # Add any other game sounds here
         
-        # Load background music
-        self.load_music('A_Journey_Awaits.mp3')
-        
         # Set default volume levels
         self.set_sound_volume(0.5)  # 50% volume for sound effects
         self.set_music_volume(0.3)  # 30% volume for background music
 
+    def start(self):
+        """
+        Open the mixer on a background thread.
+
+        Returns immediately. Sounds played before the mixer is ready are
+        dropped, and music requested before then starts as soon as it is.
+        """
+        if not self.enabled or self.started:
+            return
+        self.started = True
+        worker = threading.Thread(target=self._run_worker, name='SoundManager', daemon=True)
+        worker.start()
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Block until the mixer is open.
+
+        Args:
+            timeout (float): Most seconds to wait, None to wait for good.
+
+        Returns:
+            bool: Whether the mixer is ready.
+        """
+        if not self.enabled:
+            return False
+        self.start()
+        return self.ready.wait(timeout)
+
+    def _run_worker(self):
+        """Open the mixer, then decode prefetched sounds as they are queued."""
+        try:
+            pygame.mixer.init()
+            self.setup_channels()
+        except pygame.error as e:
+            print(f"Could not open the audio device, sound is disabled: {e}")
+            self.enabled = False
+            return
+        # The bank is only usable once the mixer's output format is known
+        self.bank.open()
+        self.ready.set()
+        self.music.start()
+
+        while True:
+            self._decode(self.decode_queue.get())
+
+    def setup_channels(self):
+        """
+        Reserve a pool of mixer channels for each sound category.
+
+        Reserved channels are never picked by pygame for plain Sound.play()
+        calls, so only the SoundManager decides what plays on them.
+        """
+        total = sum(SOUND_CHANNELS.values())
+        # Keep pygame's default channels free for sounds played outside the pools
+        pygame.mixer.set_num_channels(total + pygame.mixer.get_num_channels())
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in SOUND_CHANNELS.items():
+            self.channel_pools[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+
     def get_sound_path(self, folder, filename):
         """
         Construct the full path for a sound file.
@@ -41,38 +144,186 @@ class SoundManager:
         """
         return os.path.join(self.sound_path, folder, filename)
 
-    def load_sound(self, name, filename):
+    def register_sound(self, name, filename, category='sfx'):
+        """
+        Make a sound effect playable by name without decoding it yet.
+        
+        Args:
+            name (str): The name to associate with the sound.
+            filename (str): The filename of the sound file (without path).
+            category (str): Channel pool the sound plays on ('sfx', 'ui' or 'voice').
+        """
+        self.sound_files[name] = filename
+        self.sound_categories[name] = category
+
+    def load_sound(self, name, filename, category='sfx'):
         """
-        Load a sound effect and store it in the sounds dictionary.
+        Register a sound effect and decode it in the background.
         
         Args:
             name (str): The name to associate with the sound.
             filename (str): The filename of the sound file (without path).
+            category (str): Channel pool the sound plays on ('sfx', 'ui' or 'voice').
+        """
+        self.register_sound(name, filename, category)
+        self.prefetch(name)
+
+    def prefetch(self, *names):
+        """
+        Queue sounds to be decoded on the background thread.
+        
+        Args:
+            *names (str): Names of registered sounds.
+        """
+        if not self.enabled:
+            return
+        for name in names:
+            if name not in self.sounds:
+                self.decode_queue.put(name)
+
+    def _decode(self, name):
+        """
+        Decode a registered sound, once.
+        
+        Args:
+            name (str): The name of the sound.
+            
+        Returns:
+            pygame.mixer.Sound: The decoded sound, or None if it failed.
         """
+        sound = self.sounds.get(name)
+        if sound is not None or name not in self.sound_files:
+            return sound
+        filename = self.sound_files[name]
         try:
-            file_path = self.get_sound_path('sfx', filename)
-            sound = pygame.mixer.Sound(file_path)
-            self.sounds[name] = sound
-            print(f"Successfully loaded sound: {name}")
+            sound = self.bank.sound(f'sfx/{filename}')
+            if sound is None:
+                sound = pygame.mixer.Sound(self.get_sound_path('sfx', filename))
+            sound.set_volume(self.sound_volume)
         except pygame.error as e:
             print(f"Error loading sound {filename}: {e}")
+            return None
         except FileNotFoundError:
             print(f"Sound file not found: {filename}")
+            return None
+        with self.lock:
+            # Another thread may have decoded it meanwhile, keep a single copy
+            sound = self.sounds.setdefault(name, sound)
+        print(f"Successfully loaded sound: {name}")
+        return sound
+
+    def get_sound(self, name):
+        """
+        Get the shared decoded buffer for a loaded sound.
+        
+        Args:
+            name (str): The name of the sound.
+            
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it is not loaded.
+        """
+        if not self.ready.is_set():
+            return None
+        return self._decode(name)
 
     def play_sound(self, name):
         """
-        Play a loaded sound effect.
+        Play a loaded sound effect on its category's channels.
         
         Args:
             name (str): The name of the sound to play.
+            
+        Returns:
+            pygame.mixer.Channel: The channel it plays on, or None if dropped.
         """
-        if name in self.sounds:
-            try:
-                self.sounds[name].play()
-            except pygame.error as e:
-                print(f"Error playing sound {name}: {e}")
-        else:
+        if name not in self.sound_files:
             print(f"Sound '{name}' not found")
+            return None
+        if not self.enabled:
+            return None
+
+        start = time.perf_counter()
+        category = self.sound_categories.get(name, 'sfx')
+        stats = self.stats[category]
+        if not self.ready.is_set():
+            # Mixer still opening, never wait for it on the game thread
+            self.start()
+            stats['dropped'] += 1
+            return None
+
+        sound = self._decode(name)
+        if sound is None:
+            stats['dropped'] += 1
+            return None
+        channel = self.pick_channel(sound, category)
+        if channel is None:
+            stats['dropped'] += 1
+            return None
+
+        try:
+            channel.play(sound)
+        except pygame.error as e:
+            print(f"Error playing sound {name}: {e}")
+            stats['dropped'] += 1
+            return None
+        self.channel_started[channel] = start
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        stats['plays'] += 1
+        stats['latency_total_ms'] += latency_ms
+        stats['latency_max_ms'] = max(stats['latency_max_ms'], latency_ms)
+        return channel
+
+    def pick_channel(self, sound, category):
+        """
+        Choose the channel for a new play within a category's pool.
+        
+        Args:
+            sound (pygame.mixer.Sound): The sound about to play.
+            category (str): The category whose channels to use.
+            
+        Returns:
+            pygame.mixer.Channel: A free or stolen channel, or None to drop the play.
+        """
+        pool = self.channel_pools.get(category, [])
+        busy = [channel for channel in pool if channel.get_busy()]
+
+        # Limit how many copies of the same sound overlap
+        copies = [channel for channel in busy if channel.get_sound() is sound]
+        if len(copies) >= SOUND_MAX_INSTANCES.get(category, 1):
+            if not SOUND_STEALING.get(category, False):
+                return None
+            channel = min(copies, key=lambda c: self.channel_started.get(c, 0))
+            channel.stop()
+            self.stats[category]['stolen'] += 1
+            return channel
+
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+
+        # Every channel is busy, cut off the oldest sound if allowed
+        if not busy or not SOUND_STEALING.get(category, False):
+            return None
+        channel = min(busy, key=lambda c: self.channel_started.get(c, 0))
+        channel.stop()
+        self.stats[category]['stolen'] += 1
+        return channel
+
+    def get_stats(self):
+        """
+        Get play counters for each category.
+        
+        Returns:
+            dict: Category to plays, dropped and stolen counts and the average
+                and worst time taken to start a sound in milliseconds.
+        """
+        report = {}
+        for category, stats in self.stats.items():
+            report[category] = dict(stats)
+            plays = stats['plays']
+            report[category]['latency_avg_ms'] = stats['latency_total_ms'] / plays if plays else 0.0
+        return report
 
     def stop_sound(self, name):
         """
@@ -86,7 +337,7 @@ class SoundManager:
                 self.sounds[name].stop()
             except pygame.error as e:
                 print(f"Error stopping sound {name}: {e}")
-        else:
+        elif name not in self.sound_files:
             print(f"Sound '{name}' not found")
 
     def set_sound_volume(self, volume):
@@ -96,44 +347,25 @@ class SoundManager:
         Args:
             volume (float): Volume level between 0.0 and 1.0
         """
-        for sound in self.sounds.values():
+        self.sound_volume = volume
+        for sound in list(self.sounds.values()):
             sound.set_volume(volume)
 
-    def load_music(self, filename):
+    def play_music(self, mode='main'):
         """
-        Load background music.
+        Play the music for a game mode, as soon as the mixer is ready.
         
         Args:
-            filename (str): The filename of the music file (without path).
-        """
-        try:
-            file_path = self.get_sound_path('bgm', filename)
-            pygame.mixer.music.load(file_path)
-            self.music = file_path
-            print(f"Successfully loaded music: {filename}")
-        except pygame.error as e:
-            print(f"Error loading music {filename}: {e}")
-        except FileNotFoundError:
-            print(f"Music file not found: {filename}")
-
-    def play_music(self, loops=-1):
+            mode (str): Key of MUSIC_TRACKS in config_settings.
         """
-        Play the loaded background music.
-        
-        Args:
-            loops (int): Number of times to loop the music. -1 for infinite loop.
-        """
-        if self.music:
-            try:
-                pygame.mixer.music.play(loops)
-            except pygame.error as e:
-                print(f"Error playing music: {e}")
-        else:
-            print("No music loaded")
+        if not self.enabled:
+            return
+        self.start()
+        self.music.play(self.music.track_for(mode))
 
     def stop_music(self):
-        """Stop the currently playing background music."""
-        pygame.mixer.music.stop()
+        """Fade out the background music."""
+        self.music.stop()
 
     def set_music_volume(self, volume):
         """
@@ -142,15 +374,15 @@ class SoundManager:
         Args:
             volume (float): Volume level between 0.0 and 1.0
         """
-        pygame.mixer.music.set_volume(volume)
+        self.music.set_volume(volume)
 
     def pause_music(self):
         """Pause the currently playing background music."""
-        pygame.mixer.music.pause()
+        self.music.pause()
 
     def unpause_music(self):
         """Resume the paused background music."""
-        pygame.mixer.music.unpause()
+        self.music.unpause()
 
 # Create a global instance of SoundManager
-sound_manager = SoundManager()
\ No newline at end of file
+sound_manager = SoundManager()
@@ -0,0 +1,119 @@
+import pygame
+
+
+class SpatialGrid:
+    """
+    Uniform grid of rectangles for finding what is under a point.
+
+    Each rectangle is filed under every cell it overlaps, so a point query
+    only looks at the few rectangles sharing its cell however many there
+    are in total. Moving a rectangle only refiles it when it changes cells.
+
+    Attributes:
+        cell_size (int): Width and height of a cell in pixels
+        rects (dict): Rectangle of each key
+        cells (dict): Keys filed under each (column, row) cell
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        Args:
+            cell_size (int): Width and height of a cell, about the size of a typical rectangle
+        """
+        self.cell_size = cell_size
+        self.rects = {}
+        self.cells = {}
+        self._order = {}  # Insertion order of each key, for stable results
+        self._next = 0
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def _cells_for(self, rect):
+        """Cells a rectangle overlaps."""
+        size = self.cell_size
+        return [(col, row)
+                for col in range(rect.left // size, (rect.right - 1) // size + 1)
+                for row in range(rect.top // size, (rect.bottom - 1) // size + 1)]
+
+    def insert(self, key, rect):
+        """
+        Add a rectangle, replacing any the key already had.
+
+        Args:
+            key: Hashable name of the rectangle, e.g. a label index
+            rect (pygame.Rect): Area the key covers
+        """
+        if key in self.rects:
+            self.move(key, rect)
+            return
+        rect = pygame.Rect(rect)
+        self.rects[key] = rect
+        self._order[key] = self._next
+        self._next += 1
+        for cell in self._cells_for(rect):
+            self.cells.setdefault(cell, []).append(key)
+
+    def remove(self, key):
+        """Forget a rectangle, if the key has one."""
+        rect = self.rects.pop(key, None)
+        if rect is None:
+            return
+        del self._order[key]
+        for cell in self._cells_for(rect):
+            keys = self.cells[cell]
+            keys.remove(key)
+            if not keys:
+                del self.cells[cell]
+
+    def move(self, key, rect):
+        """
+        Change the area of a rectangle already in the grid.
+
+        Args:
+            key: Name the rectangle was inserted with
+            rect (pygame.Rect): New area
+        """
+        old = self.rects[key]
+        old_cells = self._cells_for(old)
+        new_cells = self._cells_for(rect)
+        if old_cells != new_cells:
+            for cell in old_cells:
+                keys = self.cells[cell]
+                keys.remove(key)
+                if not keys:
+                    del self.cells[cell]
+            for cell in new_cells:
+                self.cells.setdefault(cell, []).append(key)
+        old.update(rect)
+
+    def at(self, pos):
+        """
+        Find the rectangles containing a point.
+
+        Args:
+            pos (tuple): Point to test
+
+        Returns:
+            list: Keys whose rectangle contains the point, oldest first
+        """
+        cell = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        hits = [key for key in self.cells.get(cell, ()) if self.rects[key].collidepoint(pos)]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def top(self, pos):
+        """
+        Find the most recently added rectangle containing a point.
+
+        Args:
+            pos (tuple): Point to test
+
+        Returns:
+            The key of the rectangle, None if there is none
+        """
+        hits = self.at(pos)
+        return hits[-1] if hits else None
@@ -0,0 +1,212 @@
+import random
+import pygame
+from config_settings import *
+
+
+class SpawnService:
+    """
+    Keeps track of which map cells an enemy can be spawned on.
+
+    The walkable cells come from the tilemap once, when the room is built.
+    The player and the enemies claim the cells they stand on: place() moves
+    a sprite's claim when it has moved to other cells and release() drops it
+    when the sprite is killed, so occupancy is kept up to date as things
+    happen instead of being rebuilt for each spawn. Bullets are left out,
+    they only pass through a cell. The free cells are kept in a list with
+    an index so a cell can be added, removed or picked at random in
+    constant time.
+
+    Attributes:
+        game (Game): Reference to the main game instance
+        tilemap (list): Rows of the tilemap the room was built from
+        min_distance (int): Minimum distance in tiles between a spawn and the player
+        walkable (set): Cells that are floor tiles inside the outer walls
+        occupied (dict): Number of sprites standing on each occupied cell
+        claims (dict): Cells each tracked sprite is standing on
+        free_cells (list): Walkable cells with nothing standing on them
+        anchor (Block): Outer wall block the camera offset is read from
+    """
+
+    def __init__(self, game, tilemap=TILEMAP, min_distance=5):
+        """
+        Build the walkable cell set from the tilemap.
+
+        Args:
+            game (Game): Reference to the main game instance
+            tilemap (list): Rows of the tilemap, defaults to TILEMAP
+            min_distance (int): Minimum distance in tiles from the player
+        """
+        self.game = game
+        self.tilemap = tilemap
+        self.min_distance = min_distance
+        self.min_distance_sq = min_distance * min_distance
+
+        map_height = len(tilemap)
+        map_width = len(tilemap[0])
+
+        # Outer ring is always wall, so only look inside it
+        self.walkable = set()
+        for y in range(1, map_height - 1):
+            row = tilemap[y]
+            for x in range(1, min(len(row), map_width) - 1):
+                if row[x] in ".EP":
+                    self.walkable.add((x, y))
+
+        # Any block works, the top row of the outer wall is never removed
+        self.anchor = next(iter(game.blocks.sprites()), None)
+        self.sync()
+
+    def _add_free(self, cell):
+        """Append a cell to the free list if it is not already there."""
+        if cell not in self.free_index:
+            self.free_index[cell] = len(self.free_cells)
+            self.free_cells.append(cell)
+
+    def _remove_free(self, cell):
+        """Remove a cell from the free list by swapping in the last entry."""
+        index = self.free_index.pop(cell, None)
+        if index is None:
+            return
+        last = self.free_cells.pop()
+        if index < len(self.free_cells):
+            self.free_cells[index] = last
+            self.free_index[last] = index
+
+    def place(self, sprite):
+        """
+        Claim the walkable cells a sprite covers now, freeing the ones it left.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The player or an enemy
+        """
+        offset = self.camera_offset()
+        cells = tuple(cell for cell in self.cells_under(sprite.rect, offset) if cell in self.walkable)
+        old = self.claims.get(sprite, ())
+        if cells == old:
+            return
+        for cell in old:
+            self.mark_free(cell)
+        for cell in cells:
+            self.mark_occupied(cell)
+        self.claims[sprite] = cells
+
+    def release(self, sprite):
+        """Free the cells a sprite had claimed, e.g. when it is killed."""
+        for cell in self.claims.pop(sprite, ()):
+            self.mark_free(cell)
+
+    def mark_occupied(self, cell):
+        """Record one more sprite standing on a cell."""
+        self.occupied[cell] = self.occupied.get(cell, 0) + 1
+        self._remove_free(cell)
+
+    def mark_free(self, cell):
+        """Record that one sprite has left a cell."""
+        count = self.occupied.get(cell, 0) - 1
+        if count > 0:
+            self.occupied[cell] = count
+            return
+        self.occupied.pop(cell, None)
+        if cell in self.walkable:
+            self._add_free(cell)
+
+    def camera_offset(self):
+        """
+        Get how far the camera has shifted the world since it was built.
+
+        The player's movement scrolls every sprite, so a block's current rect
+        minus the pixel position it was created at gives the offset.
+
+        Returns:
+            tuple: (x, y) offset in pixels
+        """
+        block = self.anchor
+        if block is None:
+            return 0, 0
+        return block.rect.x - block.x, block.rect.y - block.y
+
+    def cells_under(self, rect, offset):
+        """
+        Get the map cells a rect overlaps.
+
+        Args:
+            rect (pygame.Rect): Rect in screen coordinates
+            offset (tuple): Current camera offset
+
+        Returns:
+            list: (x, y) tile coordinates covered by the rect
+        """
+        left = (rect.left - offset[0]) // TILESIZE
+        top = (rect.top - offset[1]) // TILESIZE
+        right = (rect.right - 1 - offset[0]) // TILESIZE
+        bottom = (rect.bottom - 1 - offset[1]) // TILESIZE
+        return [(x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)]
+
+    def sync(self):
+        """
+        Claim cells for the player and enemies already in the room.
+
+        Done once when the room is built, after that place() and release()
+        keep the claims up to date.
+        """
+        self.occupied = {}
+        self.claims = {}
+        self.free_cells = []
+        self.free_index = {}
+        for cell in self.walkable:
+            self._add_free(cell)
+        for enemy in self.game.enemies:
+            self.place(enemy)
+        if self.game.player.alive():
+            self.place(self.game.player)
+
+    def player_cell(self, offset):
+        """Get the tile the player is standing on."""
+        rect = self.game.player.rect
+        return (rect.x - offset[0]) // TILESIZE, (rect.y - offset[1]) // TILESIZE
+
+    def is_valid(self, cell, player_cell):
+        """Check that a free cell is far enough from the player."""
+        dx = cell[0] - player_cell[0]
+        dy = cell[1] - player_cell[1]
+        return dx * dx + dy * dy >= self.min_distance_sq
+
+    def sample(self, k=1, max_tries=None):
+        """
+        Pick k distinct free cells that are far enough from the player.
+
+        Cells are drawn at random from the free list and rejected if they are
+        too close to the player, so the cost depends on k rather than on the
+        size of the map. If random draws keep landing near the player the
+        remaining candidates are filtered directly.
+
+        Args:
+            k (int): Number of cells wanted
+            max_tries (int): Random draws allowed before falling back to a scan
+
+        Returns:
+            list: Up to k (x, y) tile coordinates
+        """
+        offset = self.camera_offset()
+        player_cell = self.player_cell(offset)
+        if max_tries is None:
+            max_tries = k * 8
+
+        chosen = []
+        seen = set()
+        tries = 0
+        while len(chosen) < k and tries < max_tries and len(seen) < len(self.free_cells):
+            tries += 1
+            cell = self.free_cells[random.randrange(len(self.free_cells))]
+            if cell in seen:
+                continue
+            seen.add(cell)
+            if self.is_valid(cell, player_cell):
+                chosen.append(cell)
+
+        if len(chosen) < k:
+            remaining = [cell for cell in self.free_cells
+                         if cell not in seen and self.is_valid(cell, player_cell)]
+            chosen.extend(random.sample(remaining, min(k - len(chosen), len(remaining))))
+
+        return chosen
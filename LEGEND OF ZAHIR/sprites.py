@@ -1,5 +1,6 @@
 import pygame
 from config_settings import *
+from framecache import cached
 import os
 
 class Spritesheet:
@@ -12,6 +13,18 @@ class Spritesheet:
         sprite.set_colorkey(BLACK)
         return sprite
 
+def load_spritesheet(file):
+    """
+    Get a spritesheet loaded once and shared by the main game and the minigames.
+
+    Args:
+    file (str): Path of the spritesheet image.
+
+    Returns:
+    Spritesheet: The shared spritesheet.
+    """
+    return cached(('spritesheet', file), lambda: Spritesheet(file))
+
 def flip(sprites):
     """
     Flip a list of sprite images horizontally.
@@ -24,6 +37,22 @@ def flip(sprites):
     """
     return [pygame.transform.flip(sprite, True, False) for sprite in sprites]
 
+def load_wall_image():
+    """
+    Load the wall tile scaled to one tile.
+
+    Returns:
+    pygame.Surface: The wall image, or a grey tile if it cannot be loaded.
+    """
+    try:
+        image = pygame.image.load('LEGEND OF ZAHIR/assets/graphics/tilesets/brick wall tile.png').convert_alpha()
+        return pygame.transform.scale(image, (TILESIZE, TILESIZE))
+    except pygame.error:
+        # Fallback if image loading fails
+        image = pygame.Surface([TILESIZE, TILESIZE])
+        image.fill((100, 100, 100))  # Grey color as fallback
+        return image
+
 class Block(pygame.sprite.Sprite):
     """
     Block class representing wall or obstacle sprites in the game.
@@ -50,13 +79,8 @@ class Block(pygame.sprite.Sprite):
         self.height = TILESIZE
 
         # Load and scale the wall image
-        try:
-            self.image = pygame.image.load('LEGEND OF ZAHIR/assets/graphics/tilesets/brick wall tile.png').convert_alpha()
-            self.image = pygame.transform.scale(self.image, (TILESIZE, TILESIZE))
-        except pygame.error:
-            # Fallback if image loading fails
-            self.image = pygame.Surface([TILESIZE, TILESIZE])
-            self.image.fill((100, 100, 100))  # Grey color as fallback
+        # Shared by every wall, so building a room reads the file only once
+        self.image = cached(('wall',), load_wall_image)
 
         # Set up collision rectangle
         self.rect = self.image.get_rect()
@@ -1,6 +1,6 @@
 import pygame
 from config_settings import WIDTH, HEIGHT, TILESIZE
-from sprites import Spritesheet
+from sprites import load_spritesheet
 
 class Background:
     def __init__(self, game):
@@ -22,7 +22,7 @@ class Background:
         self.surface = pygame.Surface((WIDTH, HEIGHT))
         
         # Get floor tile from dungeon spritesheet (using specific tile coordinates)
-        self.spritesheet = Spritesheet('LEGEND OF ZAHIR/assets/graphics/tilesets/floor tile.PNG')
+        self.spritesheet = load_spritesheet('LEGEND OF ZAHIR/assets/graphics/tilesets/floor tile.PNG')
         # Extract floor tile - adjust coordinates based on your spritesheet
         self.floor_tile = self.spritesheet.get_sprite(0,0,29,29)
         
@@ -0,0 +1,143 @@
+import pygame
+from config_settings import SIM_FPS, MAX_SIM_STEPS, RENDER_FPS, VSYNC
+
+
+class FixedTimestep:
+    """
+    Accumulator that runs the simulation at a fixed rate.
+
+    Each rendered frame adds the real time that passed to an accumulator and
+    reports how many fixed simulation ticks fit into it. Whatever is left over
+    becomes the interpolation factor for drawing, so the simulation stays
+    correct under frame drops and rendering can run faster or slower than the
+    simulation.
+
+    Attributes:
+        step_ms (float): Length of one simulation tick in milliseconds
+        max_steps (int): Most ticks run for one frame, extra time is dropped
+        render_fps (int): Frame cap passed to clock.tick, 0 for uncapped
+        accumulator (float): Real time not yet simulated, in milliseconds
+        alpha (float): How far between the last two ticks the frame is drawn
+    """
+
+    def __init__(self, sim_fps=SIM_FPS, max_steps=MAX_SIM_STEPS, render_fps=RENDER_FPS):
+        """
+        Initialize the timestep.
+
+        Args:
+            sim_fps (int): Simulation ticks per second
+            max_steps (int): Most ticks run for one rendered frame
+            render_fps (int): Frame cap for rendering, 0 for uncapped
+        """
+        self.step_ms = 1000.0 / sim_fps
+        self.max_steps = max_steps
+        self.render_fps = 0 if VSYNC else render_fps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def reset(self, clock):
+        """
+        Drop any time that passed while the loop was not running.
+
+        Args:
+            clock (pygame.time.Clock): Clock whose next tick should start fresh
+        """
+        clock.tick()
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, elapsed_ms):
+        """
+        Add real time to the accumulator and count the ticks to simulate.
+
+        Args:
+            elapsed_ms (float): Milliseconds since the previous frame
+
+        Returns:
+            int: Number of simulation ticks to run this frame
+        """
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            # Too far behind (long stall or a blocking screen), drop the debt
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.alpha = self.accumulator / self.step_ms
+        return steps
+
+    def tick(self, clock):
+        """
+        Wait for the next rendered frame and count the ticks to simulate.
+
+        Args:
+            clock (pygame.time.Clock): Clock used to cap the render rate
+
+        Returns:
+            int: Number of simulation ticks to run this frame
+        """
+        return self.advance(clock.tick(self.render_fps))
+
+
+def capture_positions(sprites):
+    """
+    Remember where sprites are before a simulation tick.
+
+    Args:
+        sprites (iterable): Objects with a rect attribute
+
+    Returns:
+        dict: Sprite to (x, y) top left position
+    """
+    return {sprite: sprite.rect.topleft for sprite in sprites}
+
+
+def interpolate(previous, rect, alpha):
+    """
+    Get the position to draw a rect between its last two ticks.
+
+    Args:
+        previous (tuple): Top left position before the last tick, or None
+        rect (pygame.Rect): Rect after the last tick
+        alpha (float): Fraction of a tick since the last one
+
+    Returns:
+        tuple: (x, y) position to draw at
+    """
+    if previous is None:
+        return rect.topleft
+    return (round(previous[0] + (rect.x - previous[0]) * alpha),
+            round(previous[1] + (rect.y - previous[1]) * alpha))
+
+
+def draw_interpolated(surface, group, previous, alpha):
+    """
+    Draw a sprite group at positions interpolated between ticks.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on
+        group (pygame.sprite.Group): Sprites to draw, in layer order
+        previous (dict): Positions returned by capture_positions
+        alpha (float): Fraction of a tick since the last one
+    """
+    for sprite in group.sprites():
+        surface.blit(sprite.image, interpolate(previous.get(sprite), sprite.rect, alpha))
+
+
+def set_display_mode(size):
+    """
+    Open the game window, synced to the display refresh when VSYNC is on.
+
+    Args:
+        size (tuple): Window width and height
+
+    Returns:
+        pygame.Surface: The display surface
+    """
+    if VSYNC:
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"Could not enable vsync: {e}")
+    return pygame.display.set_mode(size)
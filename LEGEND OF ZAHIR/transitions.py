@@ -0,0 +1,154 @@
+import pygame
+from scenes import Timer
+
+# One plain surface per size and colour, reused by every dim() call
+_dim_surfaces = {}
+
+
+def dim_surface(size, color=(0, 0, 0)):
+    """
+    Get the shared full-size surface of one colour.
+
+    The surface has no per-pixel alpha, so its transparency is set with
+    set_alpha() right before each blit and one copy serves every caller.
+
+    Args:
+        size (tuple): Width and height of the target surface
+        color (tuple): RGB colour of the overlay
+
+    Returns:
+        pygame.Surface: Surface filled with the colour
+    """
+    key = (tuple(size), tuple(color))
+    surface = _dim_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        _dim_surfaces[key] = surface
+    return surface
+
+
+def dim(target, alpha, color=(0, 0, 0)):
+    """
+    Darken (or tint) a whole surface.
+
+    Args:
+        target (pygame.Surface): Surface to draw over, usually the screen
+        alpha (int): Overlay opacity from 0 to 255
+        color (tuple): RGB colour of the overlay
+    """
+    if alpha <= 0:
+        return
+    surface = dim_surface(target.get_size(), color)
+    surface.set_alpha(min(255, int(alpha)))
+    target.blit(surface, (0, 0))
+
+
+class Transition(Timer):
+    """
+    A time-based screen effect advanced by a scene and drawn over it.
+
+    Transitions count milliseconds like any other Timer, so they can be
+    added with Scene.add_timer() or advanced by hand, and their callback
+    runs when the effect ends.
+    """
+
+    def draw(self, screen):
+        """
+        Draw the effect at its current progress.
+
+        Args:
+            screen (pygame.Surface): Surface to draw over
+        """
+
+
+class Fade(Transition):
+    """
+    Fades from a colour to the scene, or from the scene to a colour.
+
+    Attributes:
+        fade_in (bool): True to reveal the scene, False to cover it
+        color (tuple): RGB colour faded to or from
+    """
+
+    def __init__(self, duration, fade_in=True, color=(0, 0, 0), callback=None):
+        """
+        Args:
+            duration (float): Length of the fade in milliseconds
+            fade_in (bool): True to reveal the scene, False to cover it
+            color (tuple): RGB colour faded to or from
+            callback (callable): Called once when the fade ends
+        """
+        super().__init__(duration, callback)
+        self.fade_in = fade_in
+        self.color = color
+
+    def draw(self, screen):
+        progress = 1.0 - self.progress if self.fade_in else self.progress
+        dim(screen, 255 * progress, self.color)
+
+
+class Crossfade(Transition):
+    """
+    Fades a snapshot of the previous screen out over the new one.
+
+    Attributes:
+        previous (pygame.Surface): Copy of the screen being faded away
+    """
+
+    def __init__(self, previous, duration, callback=None):
+        """
+        Args:
+            previous (pygame.Surface): Copy of the screen to fade away
+            duration (float): Length of the crossfade in milliseconds
+            callback (callable): Called once when the crossfade ends
+        """
+        super().__init__(duration, callback)
+        self.previous = previous
+
+    def draw(self, screen):
+        if self.done:
+            return
+        self.previous.set_alpha(int(255 * (1.0 - self.progress)))
+        screen.blit(self.previous, (0, 0))
+
+
+class Wipe(Transition):
+    """
+    Slides a solid colour across the screen to cover or uncover it.
+
+    Attributes:
+        cover (bool): True to cover the scene, False to uncover it
+        direction (str): Edge the wipe moves towards, 'left', 'right', 'up' or 'down'
+        color (tuple): RGB colour of the wipe
+    """
+
+    def __init__(self, duration, cover=True, direction='right', color=(0, 0, 0), callback=None):
+        """
+        Args:
+            duration (float): Length of the wipe in milliseconds
+            cover (bool): True to cover the scene, False to uncover it
+            direction (str): Edge the wipe moves towards
+            color (tuple): RGB colour of the wipe
+            callback (callable): Called once when the wipe ends
+        """
+        super().__init__(duration, callback)
+        self.cover = cover
+        self.direction = direction
+        self.color = color
+
+    def draw(self, screen):
+        width, height = screen.get_size()
+        amount = self.progress if self.cover else 1.0 - self.progress
+        if amount <= 0:
+            return
+        if self.direction in ('left', 'right'):
+            size = int(width * amount)
+            # The covered part starts at the edge the wipe moves away from
+            x = 0 if (self.direction == 'right') == self.cover else width - size
+            rect = pygame.Rect(x, 0, size, height)
+        else:
+            size = int(height * amount)
+            y = 0 if (self.direction == 'down') == self.cover else height - size
+            rect = pygame.Rect(0, y, width, size)
+        screen.fill(self.color, rect)
@@ -1,5 +1,6 @@
 import pygame
 from config_settings import *
+from transitions import dim
 
 class TutorialSystem:
     def __init__(self, game_instance):
@@ -77,14 +78,14 @@ class TutorialSystem:
         if "required_keys" in current:
             current["keys_pressed"] = set()
 
-    def handle_input(self, events):
-        """Handle tutorial input events"""
+    def handle_input(self, snapshot):
+        """Handle tutorial input for one frame's InputSnapshot"""
         if not self.active or self.tutorial_completed:
             return
 
         current = self.tutorial_steps[self.current_step]
         
-        for event in events:
+        for event in snapshot.events:
             if "completion_key" in current and event.type == pygame.KEYDOWN:
                 if event.key == current["completion_key"]:
                     self.advance_step()
@@ -105,10 +106,7 @@ class TutorialSystem:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(self.overlay_alpha)
-        screen.blit(overlay, (0, 0))
+        dim(screen, self.overlay_alpha)
 
         current = self.tutorial_steps[self.current_step]
 
@@ -149,7 +147,7 @@ class TutorialSystem:
 
     def draw_combat_visuals(self, screen):
         """Draw combat tutorial visuals"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.game.input_state.mouse_pos
         pygame.draw.circle(screen, WHITE, mouse_pos, 5)
         pygame.draw.line(screen, RED, mouse_pos, 
                         (mouse_pos[0] + 20, mouse_pos[1] + 20), 2)
\ No newline at end of file
@@ -2,6 +2,8 @@ import pygame
 import os
 from typing import Dict, Optional, Tuple
 from enum import Enum
+from transitions import dim
+from jobs import job_scheduler, in_background
 
 class CharacterPosition(Enum):
     """Possible positions for character sprites on screen."""
@@ -40,7 +42,8 @@ class SpriteType(Enum):
 class Character:
     """Represents a character in the visual novel scenes."""
     
-    def __init__(self, name: str, base_path: str, sprite_type: SpriteType):
+    def __init__(self, name: str, base_path: str, sprite_type: SpriteType,
+                 image: Optional[pygame.Surface] = None):
         """
         Initialize a character with their sprite.
         
@@ -48,6 +51,7 @@ class Character:
             name: Character's name
             base_path: Base path to sprites directory
             sprite_type: Type of sprite to use for this character
+            image: Sprite already read from the file, loaded here if None
         """
         self.name = name
         self.sprite_type = sprite_type
@@ -56,13 +60,13 @@ class Character:
         self.alpha = 255
         
         # Load sprite
-        self.sprite = self._load_sprite(os.path.join(base_path, f"{sprite_type.value}.png"))
+        self.sprite = self._load_sprite(os.path.join(base_path, f"{sprite_type.value}.png"), image)
             
-    def _load_sprite(self, path: str) -> Optional[pygame.Surface]:
+    def _load_sprite(self, path: str, image: Optional[pygame.Surface] = None) -> Optional[pygame.Surface]:
         """Load a sprite with error handling and placeholder generation."""
         PIXEL_ART_SIZE = (512, 512)  # Doubled from 256x256
         try:
-            sprite = pygame.image.load(path).convert_alpha()
+            sprite = (image if image is not None else pygame.image.load(path)).convert_alpha()
             return pygame.transform.scale(sprite, PIXEL_ART_SIZE)
         except (pygame.error, FileNotFoundError):
             print(f"Warning: Could not load sprite {path}")
@@ -96,52 +100,70 @@ class VisualNovelAssets:
             CharacterPosition.OFF_SCREEN: (-64, self.height * 0.5)
         }
         
-        # Load characters
-        self.characters: Dict[str, Character] = self._init_characters()
-        
-        # Load backgrounds
-        self.backgrounds = self._load_backgrounds()
+        # Characters and backgrounds are loaded a file at a time over the
+        # next frames; ensure_loaded() finishes the job when they are needed
+        self.characters: Dict[str, Character] = {}
+        self.backgrounds: Dict[str, pygame.Surface] = {}
+        self.loading = job_scheduler.submit(self._load_assets(), "visual novel assets")
         
         # Current state
         self.current_background = None
         self.transition_alpha = 0
         self.is_transitioning = False
         
-    def _init_characters(self) -> Dict[str, Character]:
-        """Initialize all game characters."""
+    def ensure_loaded(self):
+        """Load whatever characters and backgrounds are still missing, at once."""
+        job_scheduler.finish(self.loading)
+        
+    def _load_assets(self):
+        """Load the characters, then the backgrounds, yielding after each file."""
+        yield from self._init_characters()
+        yield from self._load_backgrounds()
+        
+    def _init_characters(self):
+        """Initialize all game characters, yielding after each sprite."""
         base_path = "LEGEND OF ZAHIR/visual_novel_assets"
-        return {
-            "VN1": Character("VN1", base_path, SpriteType.VN1),
-            "VN2": Character("VN2", base_path, SpriteType.VN2),
-            "VN3": Character("VN3", base_path, SpriteType.VN3),
-            "VN4": Character("VN4", base_path, SpriteType.VN4),
-            "VN5": Character("VN5", base_path, SpriteType.VN5),
-            "VN6": Character("VN6", base_path, SpriteType.VN6),
-            "VN7": Character("VN7", base_path, SpriteType.VN7),
-            "VN8": Character("VN8", base_path, SpriteType.VN8),
-            "VN9": Character("VN9", base_path, SpriteType.VN9),
-            "VN10": Character("VN10", base_path, SpriteType.VN10),
-            "VN11": Character("VN11", base_path, SpriteType.VN11),
-            "VN12": Character("VN12", base_path, SpriteType.VN12),
-            "VN13": Character("Language man NPC sheet", base_path, SpriteType.VN13),
-            "VN14": Character("Time man NPC sheet", base_path, SpriteType.VN14),
-            "map": Character("Map NPC", base_path, SpriteType.map),
-            "Boss": Character("boss spritesheet", base_path, SpriteType.Boss),
-            "Boss1": Character("Boss1", base_path, SpriteType.Boss1),
-            "Boss2": Character("Boss3", base_path, SpriteType.Boss2),
-            "Boss4": Character("Boss4", base_path, SpriteType.Boss4),
-            "Boss5": Character("Boss5", base_path, SpriteType.Boss5),
-            "temp1": Character("temp1", base_path, SpriteType.temp1),
-            "boss_room": Character("boss_room", base_path, SpriteType.boss_room)
-            }  
-    def _load_backgrounds(self) -> Dict[str, Optional[pygame.Surface]]:
-        """Load all background images."""
+        sprites = {
+            "VN1": ("VN1", SpriteType.VN1),
+            "VN2": ("VN2", SpriteType.VN2),
+            "VN3": ("VN3", SpriteType.VN3),
+            "VN4": ("VN4", SpriteType.VN4),
+            "VN5": ("VN5", SpriteType.VN5),
+            "VN6": ("VN6", SpriteType.VN6),
+            "VN7": ("VN7", SpriteType.VN7),
+            "VN8": ("VN8", SpriteType.VN8),
+            "VN9": ("VN9", SpriteType.VN9),
+            "VN10": ("VN10", SpriteType.VN10),
+            "VN11": ("VN11", SpriteType.VN11),
+            "VN12": ("VN12", SpriteType.VN12),
+            "VN13": ("Language man NPC sheet", SpriteType.VN13),
+            "VN14": ("Time man NPC sheet", SpriteType.VN14),
+            "map": ("Map NPC", SpriteType.map),
+            "Boss": ("boss spritesheet", SpriteType.Boss),
+            "Boss1": ("Boss1", SpriteType.Boss1),
+            "Boss2": ("Boss3", SpriteType.Boss2),
+            "Boss4": ("Boss4", SpriteType.Boss4),
+            "Boss5": ("Boss5", SpriteType.Boss5),
+            "temp1": ("temp1", SpriteType.temp1),
+            "boss_room": ("boss_room", SpriteType.boss_room)
+            }
+        for key, (name, sprite_type) in sprites.items():
+            path = os.path.join(base_path, f"{sprite_type.value}.png")
+            try:
+                image = yield from in_background(pygame.image.load, path)
+            except (pygame.error, FileNotFoundError):
+                image = None  # The character makes its placeholder
+            self.characters[key] = Character(name, base_path, sprite_type, image)
+            yield
+            
+    def _load_backgrounds(self):
+        """Load all background images, yielding after each file."""
         current_dir = os.path.dirname(os.path.abspath(__file__))
         backgrounds_path = os.path.join(current_dir, "visual_novel_assets", "backgrounds")
         print(f"Looking for backgrounds in: {backgrounds_path}")
         
         # Initialize backgrounds dictionary with required backgrounds
-        backgrounds = {
+        self.backgrounds = backgrounds = {
             "boss_room": None,
             "Boss3": None,
             "Boss4": None,
@@ -164,11 +186,13 @@ class VisualNovelAssets:
                 bg_name = os.path.splitext(bg_file)[0]
                 path = os.path.join(backgrounds_path, bg_file)
                 try:
-                    bg = pygame.image.load(path).convert()
+                    bg = yield from in_background(pygame.image.load, path)
+                    bg = bg.convert()
                     print(f"Successfully loaded: {bg_name}")
                     backgrounds[bg_name] = pygame.transform.scale(bg, (self.width, self.height))
                 except (pygame.error, FileNotFoundError) as e:
                     print(f"Error loading {path}: {str(e)}")
+                yield
                     
         except OSError as e:
             print(f"Error reading backgrounds directory: {str(e)}")
@@ -180,8 +204,6 @@ class VisualNovelAssets:
                 bg.fill((50, 50, 50))
                 backgrounds[bg_name] = bg
                 print(f"Created default background for: {bg_name}")
-        
-        return backgrounds
     
     def move_character(self, character_name: str, position: CharacterPosition):
         """Move a character to a new position."""
@@ -224,10 +246,7 @@ class VisualNovelAssets:
         
         # Draw transition overlay
         if self.is_transitioning:
-            overlay = pygame.Surface((self.width, self.height))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(self.transition_alpha)
-            self.screen.blit(overlay, (0, 0))
+            dim(self.screen, self.transition_alpha)
 
 # Example usage:
 def create_scene(screen: pygame.Surface, scene_data: Dict):
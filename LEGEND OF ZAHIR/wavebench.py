@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+import time
+
+
+def measure_waves(game, ticks, report_every):
+    """
+    Run a main game room with endless waves and measure each frame.
+
+    The player stands still and cannot die, so enemies build up to the
+    live cap and stay there.
+
+    Args:
+        game (Game): The main game object, already in a room with waves
+        ticks (int): Simulation ticks to run, one frame is drawn per tick
+        report_every (int): Ticks between printed entity counts
+
+    Returns:
+        list: Milliseconds spent updating and drawing each frame
+    """
+    frame_ms = []
+    for tick in range(1, ticks + 1):
+        game.player.health = game.player.max_health
+        start = time.perf_counter()
+        game.update()
+        game.draw()
+        frame_ms.append((time.perf_counter() - start) * 1000)
+        if tick % report_every == 0:
+            stats = game.waves.stats()
+            stats['visible/near/far'] = '/'.join(map(str, game.lod.counts))
+            print(f"tick {tick:>6}: " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+    return frame_ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stress the main game with endless enemy waves.")
+    parser.add_argument('--seconds', type=float, default=60, help="simulated time to run")
+    parser.add_argument('--budget', type=int, default=None, help="enemies in the first wave")
+    parser.add_argument('--max-live', type=int, default=None, help="most enemies alive at once")
+    parser.add_argument('--delay-ms', type=float, default=None, help="longest wait between waves")
+    parser.add_argument('--headless', action='store_true', help="no window or audio device")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        # Must be set before the game modules open the display
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        os.environ['ZAHIR_NO_AUDIO'] = '1'
+    from config_settings import SIM_FPS, WAVE_BUDGET, MAX_LIVE_ENEMIES, WAVE_DELAY_MS
+    from maingame import Game
+    from waves import WaveDirector
+
+    game = Game()
+    game.in_tutorial = False
+    game.new()
+    game.waves = WaveDirector(game, waves=0, budget=args.budget or WAVE_BUDGET,
+                              max_live=args.max_live or MAX_LIVE_ENEMIES,
+                              delay_ms=WAVE_DELAY_MS if args.delay_ms is None else args.delay_ms)
+    frame_ms = sorted(measure_waves(game, int(args.seconds * SIM_FPS), SIM_FPS * 5))
+    print(f"frames: {len(frame_ms)}, median {frame_ms[len(frame_ms) // 2]:.2f} ms, "
+          f"95th {frame_ms[len(frame_ms) * 95 // 100]:.2f} ms, worst {frame_ms[-1]:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+from config_settings import *
+from enemies import Enemy
+
+
+class WaveDirector:
+    """
+    Spawns waves of enemies into a main game room over time.
+
+    Each wave has a budget of enemies that grows from wave to wave and is
+    scaled by the difficulty. A wave starts once the previous one is
+    cleared or WAVE_DELAY_MS after it finished spawning, whichever comes
+    first. Its enemies are spawned one at a time, at most one every
+    SPAWN_INTERVAL_MS, through Enemy.create_wave() and the room's
+    SpawnService. Spawning also waits while MAX_LIVE_ENEMIES are alive, so
+    a long session never builds up more than the cap.
+
+    Attributes:
+        game (Game): The main game object enemies are spawned into
+        waves (int): Waves in the room, 0 for endless
+        multiplier (float): Budget multiplier of the difficulty
+        wave (int): Waves started so far
+        pending (int): Enemies of the current wave still to spawn
+        spawned (int): Enemies spawned in the room, for profiling
+        peak_live (int): Most enemies alive at once, for profiling
+    """
+
+    def __init__(self, game, difficulty=DIFFICULTY, waves=WAVE_COUNT, budget=WAVE_BUDGET,
+                 growth=WAVE_GROWTH, max_live=MAX_LIVE_ENEMIES, delay_ms=WAVE_DELAY_MS,
+                 spawn_interval_ms=SPAWN_INTERVAL_MS):
+        """
+        Args:
+            game (Game): The main game object
+            difficulty (int): EASY, NORMAL or HARD
+            waves (int): Waves in the room, 0 for endless
+            budget (int): Enemies in the first wave at NORMAL difficulty
+            growth (float): Each wave's budget over the one before
+            max_live (int): Spawning waits while this many enemies are alive
+            delay_ms (float): Longest wait between the end of one wave and the next
+            spawn_interval_ms (float): Shortest time between two spawns
+        """
+        self.game = game
+        self.waves = waves
+        self.multiplier = DIFFICULTY_MULTIPLIERS[difficulty]
+        self.budget = budget
+        self.growth = growth
+        self.max_live = max_live
+        self.delay_ms = delay_ms
+        self.spawn_interval_ms = spawn_interval_ms
+
+        self.wave = 0
+        self.pending = 0
+        self.spawned = 0
+        self.peak_live = 0
+        self.until_wave = delay_ms  # The room's own enemies come first
+        self.until_spawn = 0
+
+    def budget_for(self, wave):
+        """
+        Get the number of enemies in a wave.
+
+        Args:
+            wave (int): Wave number from 0
+
+        Returns:
+            int: Enemies to spawn, at least one
+        """
+        return max(1, round(self.budget * self.multiplier * self.growth ** wave))
+
+    @property
+    def finished(self):
+        """Whether every wave has been spawned, never for endless waves."""
+        return bool(self.waves) and self.wave >= self.waves and self.pending == 0
+
+    def update(self, dt):
+        """
+        Advance the waves by one simulation tick, spawning at most one enemy.
+
+        Args:
+            dt (float): Milliseconds in the tick
+        """
+        live = len(self.game.enemies)
+        self.peak_live = max(self.peak_live, live)
+
+        if not self.pending:
+            if self.finished:
+                return
+            self.until_wave -= dt
+            if live and self.until_wave > 0:
+                return
+            self.pending = self.budget_for(self.wave)
+            self.wave += 1
+            self.until_spawn = 0
+
+        self.until_spawn -= dt
+        if self.until_spawn > 0 or live >= self.max_live:
+            return
+        self.until_spawn = self.spawn_interval_ms
+        if Enemy.create_wave(self.game, 1):
+            self.pending -= 1
+            self.spawned += 1
+            if not self.pending:
+                self.until_wave = self.delay_ms
+
+    def stats(self):
+        """
+        Get the live entity counts of the room, for profiling.
+
+        Returns:
+            dict: Counts of enemies, bullets and sprites and the wave progress
+        """
+        game = self.game
+        return {
+            'wave': self.wave,
+            'pending': self.pending,
+            'spawned': self.spawned,
+            'enemies': len(game.enemies),
+            'peak_enemies': self.peak_live,
+            'bullets': len(game.bullets),
+            'sprites': len(game.allsprites),
+        }
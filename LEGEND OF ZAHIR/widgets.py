@@ -0,0 +1,153 @@
+import pygame
+
+
+class TextInput:
+    """
+    Single line of editable text with a blinking caret.
+
+    The text is only rendered again when it or its colour changes, and the
+    caret is a separate surface blinked by a timer, so an idle text box
+    costs a couple of blits per frame. A screen keeps one TextInput and
+    calls reset() for each new prompt instead of building a new one.
+
+    Attributes:
+        font (pygame.font.Font): Font the text is rendered with
+        color (tuple): Text colour
+        text (str): Current text
+        max_length (int): Most characters accepted, None for no limit
+        allowed (callable): Returns whether a typed character is accepted
+        transform (callable): Applied to each accepted character, e.g. str.upper
+        caret_visible (bool): Whether the caret is shown in this blink phase
+        show_caret (bool): Whether the caret is drawn at all
+    """
+
+    def __init__(self, font, color, max_length=None, allowed=str.isprintable,
+                 transform=None, blink_ms=500, show_caret=True):
+        """
+        Args:
+            font (pygame.font.Font): Font the text is rendered with
+            color (tuple): Text colour
+            max_length (int): Most characters accepted, None for no limit
+            allowed (callable): Returns whether a typed character is accepted
+            transform (callable): Applied to each accepted character
+            blink_ms (float): How long the caret stays on and off
+            show_caret (bool): Whether the caret is drawn at all
+        """
+        self.font = font
+        self.color = color
+        self.max_length = max_length
+        self.allowed = allowed
+        self.transform = transform
+        self.blink_ms = blink_ms
+        self.show_caret = show_caret
+        self.text = ""
+        self.caret_visible = True
+        self.blink_elapsed = 0
+        self._surface = None
+        self._rendered = None  # (text, color) the surface was made from
+        self._caret = None
+
+    def reset(self, text=""):
+        """
+        Start a new prompt.
+
+        Args:
+            text (str): Initial text
+        """
+        self.text = text
+        self.caret_visible = True
+        self.blink_elapsed = 0
+
+    def set_color(self, color):
+        """Change the text colour, the text is rendered again on the next draw."""
+        self.color = color
+        self._caret = None
+
+    def handle_event(self, event):
+        """
+        Apply a key press to the text.
+
+        Enter is left to the caller, which decides what submitting means.
+
+        Args:
+            event (pygame.event.Event): Event from the queue
+
+        Returns:
+            bool: Whether the text changed
+        """
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_BACKSPACE:
+            if not self.text:
+                return False
+            self.text = self.text[:-1]
+        elif event.unicode and self.allowed(event.unicode):
+            if self.max_length is not None and len(self.text) >= self.max_length:
+                return False
+            char = self.transform(event.unicode) if self.transform else event.unicode
+            self.text += char
+        else:
+            return False
+        # Keep the caret on while typing
+        self.caret_visible = True
+        self.blink_elapsed = 0
+        return True
+
+    def update(self, dt):
+        """
+        Blink the caret.
+
+        Args:
+            dt (float): Milliseconds since the last update
+        """
+        self.blink_elapsed += dt
+        if self.blink_elapsed >= self.blink_ms:
+            self.blink_elapsed %= self.blink_ms
+            self.caret_visible = not self.caret_visible
+
+    @property
+    def surface(self):
+        """The rendered text, made again only when the text or colour changed."""
+        if self._rendered != (self.text, self.color):
+            self._surface = self.font.render(self.text, True, self.color)
+            self._rendered = (self.text, self.color)
+        return self._surface
+
+    @property
+    def caret(self):
+        """The rendered caret."""
+        if self._caret is None:
+            self._caret = self.font.render("|", True, self.color)
+        return self._caret
+
+    def get_width(self):
+        """Width of the text with room for the caret."""
+        width = self.surface.get_width()
+        if self.show_caret:
+            width += self.caret.get_width()
+        return width
+
+    def draw(self, surface, topleft=None, center=None):
+        """
+        Draw the text and caret.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            topleft (tuple): Position of the text's top left corner
+            center (tuple): Position of the centre of the text and caret,
+                used when topleft is not given
+
+        Returns:
+            pygame.Rect: Area covered by the text and caret
+        """
+        text = self.surface
+        height = max(text.get_height(), self.caret.get_height() if self.show_caret else 0)
+        rect = pygame.Rect(0, 0, self.get_width(), height)
+        if topleft is not None:
+            rect.topleft = topleft
+        else:
+            rect.center = center
+        surface.blit(text, rect.topleft)
+        if self.show_caret and self.caret_visible:
+            surface.blit(self.caret, (rect.x + text.get_width(), rect.y))
+        return rect